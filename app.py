@@ -1,4 +1,4 @@
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, Response, render_template, request, jsonify, send_file, stream_with_context
 import os
 import sys
 import pandas as pd
@@ -9,6 +9,11 @@ import json
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from job_manager import MAX_CONCURRENT_JOBS, JobCancelled, JobManager
+from driver_pool import DriverPool
+from job_preview import DEFAULT_PAGE_SIZE, FILTER_COLUMNS, JobFileCache
+import job_export
+
 app = Flask(__name__)
 try:
     Base_dir = os.path.dirname(os.path.abspath(__file__))
@@ -16,16 +21,34 @@ except NameError:
     Base_dir = os.getcwd()
 
 Data_dir = os.path.join(Base_dir, 'Data')
-LINKEDIN_FILE = os.path.join(Data_dir, "linkedin_jobs_scraper.csv")
-SHINE_FILE = os.path.join(Data_dir, "Shine_jobs_scraper.csv")
+# The files the scrapers write: linkedin.csv_path and main.SHINE_OUTPUT_NAME
+LINKEDIN_FILE = os.path.join(Data_dir, "linkedin_jobs_guest.csv")
+SHINE_FILE = os.path.join(Data_dir, "remote_contract_software_jobs.csv")
+PLATFORM_FILES = {"linkedin": LINKEDIN_FILE, "shine": SHINE_FILE}
+
+PLATFORM_NAMES = {"linkedin": "LinkedIn", "shine": "Shine"}
+# Seconds between keep-alive comments on an idle progress stream
+SSE_HEARTBEAT_SECONDS = 15
+# A running job scrapes one platform at a time, so one warm browser per running job
+DRIVER_POOL_SIZE = MAX_CONCURRENT_JOBS
+
+def job_output_path(platform, job_id):
+    """Where one job writes its results before they replace PLATFORM_FILES[platform]"""
+    return os.path.join(Data_dir, f"{platform}_{job_id}.csv")
+
+def publish_job_output(platform, job_id):
+    """Move a job's finished output over the platform file; False when the job saved nothing"""
+    path = job_output_path(platform, job_id)
+    if not os.path.exists(path):
+        return False
+    os.replace(path, PLATFORM_FILES[platform])
+    return True
+
+def create_pool_driver():
+    from main import create_stealth_driver
+    return create_stealth_driver()
 
-scraping_status = {
-    "is_running": False,
-    "current_platform": None,
-    "progress": 0,
-    "message": "",
-    "results": None
-}
+driver_pool = DriverPool(create_pool_driver, size=DRIVER_POOL_SIZE)
 
 class JobScraper:
     def __init__(self):
@@ -36,174 +59,137 @@ class JobScraper:
         if not os.path.exists(Data_dir):
             os.makedirs(Data_dir)
     
-    def update_status(self, platform, progress, message, is_running=True, results=None):
-        """Update scraping status"""
-        global scraping_status
-        scraping_status = {
-            "is_running": is_running,
-            "current_platform": platform,
-            "progress": progress,
-            "message": message,
-            "results": results
-        }
+    def update_status(self, job, platform, progress, message):
+        """Update the job's status; raises JobCancelled if the job was cancelled"""
+        job.update(platform, progress, message)
     
-    def run_linkedin_scraper(self, job_titles):
+    def run_linkedin_scraper(self, job, job_titles):
         """Run LinkedIn scraper with user-defined job titles"""
         try:
-            self.update_status("LinkedIn", 10, "Starting LinkedIn scraper...")
+            self.update_status(job, "LinkedIn", 10, "Starting LinkedIn scraper...")
             
-            # Import the LinkedIn module
-            from linkedin import KEYWORDS as LINKEDIN_DEFAULT_KEYWORDS
-            import linkedin as linkedin_module
+            from linkedin import CSV_FIELDNAMES, LinkedInScraper
+            from job_sink import open_job_sink
+            from main import JobLinkDeduper
             
-            # Store original keywords
-            original_keywords = linkedin_module.KEYWORDS
+            self.update_status(job, "LinkedIn", 30, f"Searching for {len(job_titles)} job titles on LinkedIn...")
             
+            def on_page(keyword, page, cards, qualified):
+                lease.page_done()
+                job.page_done("LinkedIn", keyword, page, cards, qualified)
+            
+            # Every dashboard run exports all the jobs it finds, seen before or not. Each job
+            # writes its own file, so jobs for the same platform can run side by side.
+            sink = open_job_sink(job_output_path("linkedin", job.id), CSV_FIELDNAMES)
+            is_duplicate = JobLinkDeduper()
+            failed = False
             try:
-                # Replace with user-defined keywords
-                linkedin_module.KEYWORDS = job_titles
-                
-                self.update_status("LinkedIn", 30, f"Searching for {len(job_titles)} job titles on LinkedIn...")
-                
-                # Execute the main scraping logic
-                linkedin_module.driver.quit()  # Close any existing driver
-                
-                # Reinitialize driver
-                options = linkedin_module.webdriver.ChromeOptions()
-                options.add_argument("--start-maximized")
-                options.add_argument("--disable-blink-features=AutomationControlled")
-                options.add_argument("--disable-notifications")
-                options.add_argument(f"user-agent={linkedin_module.random_user_agent()}")
-                
-                linkedin_module.driver = linkedin_module.webdriver.Chrome(options=options)
-                linkedin_module.wait = linkedin_module.WebDriverWait(linkedin_module.driver, 15)
-                
-                # Run the scraping process
                 total_keywords = len(job_titles)
                 for idx, keyword in enumerate(job_titles):
-                    self.update_status("LinkedIn", 30 + (idx / total_keywords) * 60, 
-                                     f"Searching: {keyword} ({idx+1}/{total_keywords})")
-                    
-                    print(f"Searching: {keyword}")
-                    
-                    for page in range(linkedin_module.MAX_PAGES):
-                        start = page * linkedin_module.JOBS_PER_PAGE
-                        url = linkedin_module.build_url(keyword, start)
-                        print(f"Page {page + 1}, URL: {url}")
-                        linkedin_module.driver.get(url)
-                        time.sleep(linkedin_module.random.uniform(2.0, 4.0))
-
-                        linkedin_module.handle_popups()
-                        linkedin_module.close_login_popup()
-
-                        try:
-                            linkedin_module.wait.until(
-                                linkedin_module.EC.presence_of_all_elements_located(
-                                    (linkedin_module.By.CSS_SELECTOR, "ul.jobs-search__results-list li")
-                                )
-                            )
-                        except:
-                            print("No jobs found on this page.")
-                            continue
-
-                        cards = linkedin_module.driver.find_elements(
-                            linkedin_module.By.CSS_SELECTOR, "ul.jobs-search__results-list li"
-                        )
-                        print(f"Found {len(cards)} cards")
-
-                        for i, card in enumerate(cards):
-                            job_data = linkedin_module.extract_job_data(card)
-                            if job_data["jobUrl"] == "N/A" or job_data["jobUrl"] in linkedin_module.seen_links:
-                                continue
-
-                            linkedin_module.seen_links.add(job_data["jobUrl"])
-                            print(f"[{i+1}] {job_data['job_title'][:60]}")
-
-                            linkedin_module.writer.writerow([
-                                job_data["job_title"],
-                                job_data["company_name"],
-                                job_data["jobUrl"],
-                                job_data["salary"],
-                                job_data["location"],
-                                job_data["postedTime"],
-                                job_data["experienceLevel"]
-                            ])
-                            linkedin_module.csv_file.flush()
-
-                            linkedin_module.handle_popups()
-                            linkedin_module.close_login_popup()
-                            time.sleep(linkedin_module.random.uniform(1.0, 2.0))
-                
-                # Close resources
-                linkedin_module.csv_file.close()
-                linkedin_module.driver.quit()
-                
-                self.update_status("LinkedIn", 95, "Finalizing LinkedIn data...")
-                
-                # Check results
-                if os.path.exists(LINKEDIN_FILE):
-                    df = pd.read_csv(LINKEDIN_FILE)
-                    job_count = len(df)
-                    return True, f"LinkedIn scraping completed! Found {job_count} jobs."
-                else:
-                    return False, "LinkedIn scraping completed but no data file found."
-                    
-            except Exception as e:
-                return False, f"LinkedIn scraping error: {str(e)}"
+                    self.update_status(job, "LinkedIn", 30 + (idx / total_keywords) * 60,
+                                       f"Searching: {keyword} ({idx+1}/{total_keywords})")
+                    # Borrow a warm browser per keyword, so the pool can recycle it between
+                    # keywords once it has served too many pages or grown too large
+                    with driver_pool.lease() as lease:
+                        scraper = LinkedInScraper([keyword], driver=lease.driver, is_duplicate=is_duplicate,
+                                                  stop_event=job.stop_event, on_page=on_page)
+                        for job_data in scraper.iter_jobs():
+                            sink.write(job_data)
+                    job.check_cancelled()
+            except JobCancelled:
+                raise
+            except Exception:
+                failed = True
+                raise
             finally:
-                # Restore original keywords
-                linkedin_module.KEYWORDS = original_keywords
-                
+                # A failed scrape keeps the previous file; a cancelled one saves what it found
+                sink.close(commit=not failed)
+                if not failed:
+                    publish_job_output("linkedin", job.id)
+            
+            self.update_status(job, "LinkedIn", 95, "Finalizing LinkedIn data...")
+            return True, f"LinkedIn scraping completed! Found {sink.count} jobs."
+            
+        except JobCancelled:
+            raise
         except Exception as e:
-            return False, f"Failed to initialize LinkedIn scraper: {str(e)}"
+            return False, f"LinkedIn scraping error: {str(e)}"
     
-    def run_shine_scraper(self, job_titles):
+    def run_shine_scraper(self, job, job_titles):
         """Run Shine.com scraper with user-defined job titles"""
         try:
-            self.update_status("Shine", 10, "Starting Shine.com scraper...")
+            self.update_status(job, "Shine", 10, "Starting Shine.com scraper...")
             
-            # Import the Shine module
-            from main import job_roles as SHINE_DEFAULT_ROLES
             import main as main_module
             
-            # Store original job roles
-            original_roles = main_module.job_roles
-            
             try:
-                # Replace with user-defined job titles
-                main_module.job_roles = job_titles
-                
-                self.update_status("Shine", 20, f"Searching for {len(job_titles)} roles on Shine.com...")
-                
-                # Execute the main scraping function
-                main_module.seen_job_links = set()
-                
-                # Run the scraping process
-                shine_jobs = main_module.scrape_shine()
+                self.update_status(job, "Shine", 20, f"Searching for {len(job_titles)} roles on Shine.com...")
                 
-                self.update_status("Shine", 80, "Saving Shine.com data...")
+                # Run the scraping process, streaming jobs to this job's own file as pages
+                # finish; the roles and the in-run dedup are the job's own too
+                sink = main_module.open_job_sink(job_output_path("shine", job.id), main_module.SHINE_FIELDNAMES)
+                def on_page(role, page, cards, qualified):
+                    lease.page_done()
+                    job.page_done("Shine", role, page, cards, qualified)
                 
-                # Save results
-                main_module.save_to_csv(shine_jobs, 'remote_contract_software_jobs.csv')
+                is_duplicate = main_module.JobLinkDeduper()
+                failed = False
+                try:
+                    for role in job_titles:
+                        if job.stop_event.is_set():
+                            break
+                        # A lease per role lets the pool recycle the browser between roles
+                        with driver_pool.lease() as lease:
+                            main_module.scrape_shine(is_duplicate=is_duplicate, sink=sink, stop_event=job.stop_event,
+                                                     on_page=on_page, driver=lease.driver, roles=[role])
+                except JobCancelled:
+                    raise
+                except Exception:
+                    failed = True
+                    raise
+                finally:
+                    sink.close(commit=not failed)
+                self.update_status(job, "Shine", 80, "Saving Shine.com data...")
                 
                 # Check results
-                if os.path.exists(SHINE_FILE):
-                    job_count = len(shine_jobs)
+                if not failed and publish_job_output("shine", job.id):
+                    job_count = sink.count
                     return True, f"Shine.com scraping completed! Found {job_count} remote contract jobs."
                 else:
                     return False, "Shine.com scraping completed but no data file found."
                     
+            except JobCancelled:
+                raise
             except Exception as e:
                 return False, f"Shine.com scraping error: {str(e)}"
-            finally:
-                # Restore original job roles
-                main_module.job_roles = original_roles
                 
+        except JobCancelled:
+            raise
         except Exception as e:
             return False, f"Failed to initialize Shine.com scraper: {str(e)}"
+    
+    def run_job(self, job):
+        """Scrape every platform of a job in turn; returns per-platform results"""
+        job_titles = job.params["job_titles"]
+        results = {}
+        
+        for platform in job.params["platforms"]:
+            name = PLATFORM_NAMES[platform]
+            self.update_status(job, name, 5, f"Initializing {name} scraper...")
+            if platform == "linkedin":
+                success, message = self.run_linkedin_scraper(job, job_titles)
+            else:
+                success, message = self.run_shine_scraper(job, job_titles)
+            results[platform] = {"success": success, "message": message}
+            
+            time.sleep(1)  # Brief pause between platforms
+        
+        return results
 
 # Initialize scraper
 scraper = JobScraper()
+job_manager = JobManager()
+job_files = JobFileCache()
 
 @app.route('/')
 def index():
@@ -212,12 +198,7 @@ def index():
 
 @app.route('/start_scraping', methods=['POST'])
 def start_scraping():
-    """Start the scraping process"""
-    global scraping_status
-    
-    if scraping_status["is_running"]:
-        return jsonify({"success": False, "message": "Scraping is already in progress"})
-    
+    """Queue a scraping job and return its id"""
     data = request.json
     job_titles = data.get('job_titles', [])
     platforms = data.get('platforms', [])
@@ -228,88 +209,172 @@ def start_scraping():
     if not platforms:
         return jsonify({"success": False, "message": "Please select at least one platform"})
     
-    # Start scraping in a separate thread
-    def scrape_jobs():
-        global scraping_status
-        results = {}
-        
-        for platform in platforms:
-            if platform == "linkedin":
-                scraper.update_status("LinkedIn", 5, "Initializing LinkedIn scraper...")
-                success, message = scraper.run_linkedin_scraper(job_titles)
-                results["linkedin"] = {"success": success, "message": message}
-            elif platform == "shine":
-                scraper.update_status("Shine", 5, "Initializing Shine.com scraper...")
-                success, message = scraper.run_shine_scraper(job_titles)
-                results["shine"] = {"success": success, "message": message}
-            
-            time.sleep(1)  # Brief pause between platforms
-        
-        scraping_status["is_running"] = False
-        scraping_status["results"] = results
-        scraping_status["message"] = "Scraping completed"
+    unknown = [platform for platform in platforms if platform not in PLATFORM_NAMES]
+    if unknown:
+        return jsonify({"success": False, "message": f"Unknown platform: {', '.join(unknown)}"})
     
-    scraping_status["is_running"] = True
-    scraping_status["current_platform"] = None
-    scraping_status["progress"] = 0
-    scraping_status["message"] = "Starting scraping process..."
-    scraping_status["results"] = None
+    job = job_manager.submit(scraper.run_job, {"job_titles": job_titles, "platforms": platforms})
     
-    thread = threading.Thread(target=scrape_jobs)
-    thread.daemon = True
-    thread.start()
+    return jsonify({"success": True, "job_id": job.id, "message": "Scraping job queued"})
+
+@app.route('/scraping_status/<job_id>')
+def get_job_status(job_id):
+    """Get the status of one scraping job"""
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job"}), 404
+    return jsonify(job.snapshot())
+
+@app.route('/scraping_events/<job_id>')
+def job_events(job_id):
+    """Stream a job's status and per-page progress as Server-Sent Events until it finishes"""
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown job"}), 404
+    # A reconnecting EventSource resumes after the last event it received; an id
+    # that isn't a sequence number replays the stream from the start
+    try:
+        last_seq = max(0, int(request.headers.get('Last-Event-ID') or request.args.get('after') or 0))
+    except ValueError:
+        last_seq = 0
+    
+    def stream():
+        seq = last_seq
+        if not seq:
+            yield f"event: status\ndata: {json.dumps(job.snapshot())}\n\n"
+        while True:
+            events, finished = job.events_after(seq, timeout=SSE_HEARTBEAT_SECONDS)
+            for seq, kind, data in events:
+                yield f"id: {seq}\nevent: {kind}\ndata: {json.dumps(data)}\n\n"
+            if finished and not events:
+                return
+            if not events:
+                yield ": keep-alive\n\n"
     
-    return jsonify({"success": True, "message": "Scraping started successfully"})
+    return Response(stream(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 @app.route('/scraping_status')
 def get_scraping_status():
-    """Get current scraping status"""
-    return jsonify(scraping_status)
+    """Get the status of the most recent scraping job"""
+    job = job_manager.latest()
+    if job is None:
+        return jsonify({"is_running": False, "current_platform": None, "progress": 0, "message": "", "results": None})
+    return jsonify(job.snapshot())
+
+@app.route('/scraping_jobs')
+def list_jobs():
+    """Status of every queued, running and recently finished job"""
+    return jsonify({"jobs": job_manager.list(), "driver_pool": driver_pool.snapshot()})
+
+@app.route('/scraping_jobs/<job_id>/cancel', methods=['POST'])
+def cancel_job(job_id):
+    """Cancel a queued job or stop a running one at its next page"""
+    job = job_manager.cancel(job_id)
+    if job is None:
+        return jsonify({"success": False, "message": "Unknown job"}), 404
+    return jsonify({"success": True, "job_id": job.id, "message": "Cancellation requested"})
 
 @app.route('/download/<platform>')
 def download_file(platform):
-    """Download the scraped data"""
-    if platform == "linkedin":
-        file_path = LINKEDIN_FILE
-        filename = "linkedin_jobs.csv"
-    elif platform == "shine":
-        file_path = SHINE_FILE
-        filename = "shine_jobs.csv"
-    else:
+    """Stream the scraped data, optionally filtered, as csv/jsonl/parquet/xlsx, optionally gzipped
+
+    Query parameters: format, gzip=1, columns=a,b,c, store=archive to read
+    the Parquet archive instead of the CSV, and the preview filters
+    (company, title, date, experience, location).
+    """
+    file_path = PLATFORM_FILES.get(platform)
+    if file_path is None:
         return "Invalid platform", 400
     
-    if os.path.exists(file_path):
-        return send_file(file_path, as_attachment=True, download_name=filename)
-    else:
-        return "File not found", 404
+    fmt = request.args.get('format', 'csv').lower()
+    gzip = request.args.get('gzip', '').lower() in ('1', 'true', 'yes')
+    columns = [c.strip() for c in request.args.get('columns', '').split(',') if c.strip()]
+    filters = {name: request.args.get(name, '').strip() for name in FILTER_COLUMNS}
+    from_archive = request.args.get('store') == 'archive'
+    
+    try:
+        if from_archive:
+            available = job_export.archive_columns(platform)
+        elif os.path.exists(file_path):
+            available = job_export.csv_columns(file_path)
+        else:
+            return "File not found", 404
+        filters = job_export.check_export(available, fmt, filters, columns)
+    except FileNotFoundError as e:
+        return str(e), 404
+    except (KeyError, ValueError, ImportError) as e:
+        return str(e).strip("'\""), 400
+    
+    filename = job_export.export_filename(f"{platform}_jobs", fmt, gzip)
+    if fmt == 'csv' and not (gzip or columns or filters or from_archive):
+        # The file as it is on disk: let the server sendfile() it
+        return send_file(file_path, as_attachment=True, download_name=filename, mimetype='text/csv')
+    
+    chunks = job_export.archive_chunks(platform) if from_archive else job_export.csv_chunks(file_path)
+    stream = job_export.export_stream(chunks, fmt, filters, columns, gzip)
+    return Response(stream_with_context(stream), mimetype=job_export.export_mimetype(fmt, gzip),
+                    headers={'Content-Disposition': f'attachment; filename="{filename}"'})
 
 @app.route('/preview_data')
 def preview_data():
     """Preview the scraped data"""
     platform = request.args.get('platform')
     
-    if platform == "linkedin":
-        file_path = LINKEDIN_FILE
-    elif platform == "shine":
-        file_path = SHINE_FILE
-    else:
+    file_path = PLATFORM_FILES.get(platform)
+    if file_path is None:
         return jsonify({"error": "Invalid platform"})
     
     if os.path.exists(file_path):
         try:
-            df = pd.read_csv(file_path)
+            result = job_files.query(file_path, page=1, page_size=10)
             # Return first 10 rows as HTML table
-            preview_html = df.head(10).to_html(classes='table table-striped', index=False)
-            total_jobs = len(df)
+            preview_html = pd.DataFrame(result["rows"], columns=result["columns"]).to_html(
+                classes='table table-striped', index=False)
             return jsonify({
                 "success": True,
                 "preview": preview_html,
-                "total_jobs": total_jobs
+                "total_jobs": result["total_rows"]
             })
         except Exception as e:
             return jsonify({"error": f"Error reading file: {str(e)}"})
     else:
         return jsonify({"error": "File not found"})
 
+@app.route('/api/jobs/<platform>')
+def query_jobs(platform):
+    """Paginated JSON rows of a platform's data.
+
+    Query parameters: page, page_size, columns (comma separated) and the
+    substring filters company, title, date, experience and location.
+    """
+    file_path = PLATFORM_FILES.get(platform)
+    if file_path is None:
+        return jsonify({"error": "Invalid platform"}), 404
+    if not os.path.exists(file_path):
+        return jsonify({"error": "File not found"}), 404
+    
+    try:
+        page = int(request.args.get('page', 1))
+        page_size = int(request.args.get('page_size', DEFAULT_PAGE_SIZE))
+    except ValueError:
+        return jsonify({"error": "page and page_size must be integers"}), 400
+    columns = [c.strip() for c in request.args.get('columns', '').split(',') if c.strip()] or None
+    filters = {name: request.args.get(name, '').strip() for name in FILTER_COLUMNS}
+    
+    try:
+        result = job_files.query(file_path, page, page_size, columns, filters)
+    except KeyError as e:
+        return jsonify({"error": str(e).strip("'\"")}), 400
+    return jsonify({"success": True, "platform": platform, **result})
+
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    # The debug reloader re-runs this file in a child process that does the serving
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        driver_pool.start()
+    try:
+        app.run(debug=True, host='0.0.0.0', port=5000)
+    finally:
+        # Stop running scrapes at their next page instead of waiting them out
+        job_manager.shutdown()
+        driver_pool.close()
\ No newline at end of file
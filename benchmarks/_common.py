@@ -0,0 +1,67 @@
+"""
+Helpers shared by the benchmark scripts: synthetic LinkedIn exports and timing.
+"""
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+TRACKING = np.array(['', '?trk=public_jobs_topcard-title', '?refId=abc&trackingId=xyz', '?trk=guest_homepage'])
+HOSTS = np.array(['https://in.linkedin.com', 'https://www.linkedin.com', 'https://uk.linkedin.com'])
+
+
+def synthetic_export(num_rows, seed=0, locations=('India',)):
+    """LinkedIn-shaped rows, one distinct job per row, spread over 2000 companies and the given locations"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'job_title': [f'Software Engineer {i}' for i in range(num_rows)],
+        'company_name': np.array([f'Company {i}' for i in range(2000)])[rng.integers(0, 2000, num_rows)],
+        'jobUrl': [f'https://in.linkedin.com/jobs/view/{4_000_000_000 + i}' for i in range(num_rows)],
+        'location': np.array(locations)[rng.integers(0, len(locations), num_rows)],
+        'postedTime': '1 week ago',
+        'experienceLevel': 'Mid-Senior level',
+    })
+
+def synthetic_export_with_duplicates(num_rows, seed=0):
+    """LinkedIn-shaped rows: ~70% unique jobs, ~20% URL variants of them, ~10% reposts.
+
+    Returns the frame and the number of distinct jobs in it.
+    """
+    rng = np.random.default_rng(seed)
+    num_jobs = int(num_rows * 0.7)
+    job_ids = np.arange(4_000_000_000, 4_000_000_000 + num_jobs)
+    titles = np.array([f'Software Engineer {i}' for i in range(num_jobs)], dtype=object)
+    companies = np.array([f'Company {i % 50000}' for i in range(num_jobs)], dtype=object)
+    locations = np.array(['India', 'Bengaluru, Karnataka, India', 'Remote'], dtype=object)[job_ids % 3]
+
+    variants = rng.integers(0, num_jobs, int(num_rows * 0.2))
+    reposts = rng.integers(0, num_jobs, num_rows - num_jobs - len(variants))
+    source = np.concatenate([np.arange(num_jobs), variants, reposts])
+    ids = np.concatenate([job_ids, job_ids[variants], job_ids[-1] + 1 + np.arange(len(reposts))])
+    kind = np.repeat(['job', 'variant', 'repost'], [num_jobs, len(variants), len(reposts)])
+    order = rng.permutation(len(source))
+    source, ids, kind = source[order], ids[order], kind[order]
+
+    slugs = pd.Series(titles[source]).str.lower().str.replace(' ', '-') + '-at-company-'
+    urls = (pd.Series(HOSTS[rng.integers(0, len(HOSTS), len(source))]) + '/jobs/view/' + slugs
+            + ids.astype(str) + TRACKING[rng.integers(0, len(TRACKING), len(source))])
+    frame = pd.DataFrame({
+        'job_title': titles[source],
+        'company_name': companies[source],
+        'jobUrl': urls,
+        'location': locations[source],
+        'postedTime': '1 week ago',
+    })
+    return frame, num_jobs
+
+def measure(fn, *args):
+    """fn's result, wall time and peak traced memory; timed on a separate untraced run"""
+    start = time.perf_counter()
+    result = fn(*args)
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    fn(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, seconds, peak
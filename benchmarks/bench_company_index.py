@@ -0,0 +1,148 @@
+"""
+Benchmark the fuzzy company index: recall on perturbed names and query latency.
+
+Indexes the company names found in Data/ plus synthetic companies up to
+--companies, then queries perturbed spellings of indexed companies (spaces
+dropped, legal suffix added, one-character typo, punctuation) and reports
+recall@1 / recall@k, per-query latency, build/save/load times and index size,
+next to a brute-force Dice scan over every company. Also times resolve_keys
+per job on a job export where 20% of the company names are perturbed.
+
+Usage:
+    python benchmarks/bench_company_index.py [--companies N] [--queries N] [-k K] [--jobs N]
+"""
+import argparse
+import glob
+import os
+import random
+import sys
+import tempfile
+import time
+
+Base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(Base_dir)
+
+import numpy as np
+import pandas as pd
+
+from company_index import CompanyIndex, company_trigrams
+from company_names import canonical_company, canonical_company_column
+
+Data_dir = os.path.join(Base_dir, 'Data')
+
+COMPANY_COLUMNS = ('company_name', 'companyName', 'company name', 'Company Name')
+CONSONANTS = 'bcdfghjklmnprstvwxyz'
+VOWELS = 'aeiou'
+# Pronounceable brand syllables: consonant-vowel with an optional closing consonant
+SYLLABLES = [c + v + end for c in CONSONANTS for v in VOWELS for end in ('',) + tuple(CONSONANTS[:8])]
+WORDS = ('global', 'digital', 'data', 'cloud', 'soft', 'tech', 'info', 'software', 'analytics', 'networks')
+SUFFIXES = (' Inc', ' Pvt Ltd', ' LLC', ' Limited', ' Corporation', ' Technologies')
+
+
+def data_company_names():
+    names = set()
+    for path in glob.glob(os.path.join(Data_dir, '*.csv')):
+        header = pd.read_csv(path, nrows=0).columns
+        for column in COMPANY_COLUMNS:
+            if column in header:
+                names.update(pd.read_csv(path, usecols=[column])[column].dropna().astype(str))
+    return sorted(names)
+
+def synthetic_company_names(count, rng):
+    names = set()
+    while len(names) < count:
+        brand = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3)))
+        words = [brand] + rng.sample(WORDS, rng.randint(0, 2))
+        names.add(' '.join(word.capitalize() for word in words))
+    return sorted(names)
+
+def perturb(name, rng):
+    kind = rng.choice(('nospace', 'suffix', 'typo', 'punct'))
+    if kind == 'nospace' and ' ' in name:
+        return name.replace(' ', '')
+    if kind == 'suffix':
+        return name + rng.choice(SUFFIXES)
+    if kind == 'punct':
+        return name.replace(' ', rng.choice(('-', '.', ' & ', '  '))).upper()
+    i = rng.randrange(len(name))
+    op = rng.choice(('delete', 'substitute', 'transpose'))
+    if op == 'delete' and len(name) > 4:
+        return name[:i] + name[i + 1:]
+    if op == 'transpose' and i < len(name) - 1:
+        return name[:i] + name[i + 1] + name[i] + name[i + 2:]
+    return name[:i] + rng.choice('abcdefghijklmnopqrstuvwxyz') + name[i + 1:]
+
+def brute_force_search(query, keys, key_grams, k):
+    grams = company_trigrams(canonical_company(query))
+    scores = [2.0 * len(grams & other) / (len(grams) + len(other)) for other in key_grams]
+    top = np.argsort(scores)[::-1][:k]
+    return [keys[i] for i in top]
+
+def run_benchmark(num_companies, num_queries, k, num_jobs, seed=0):
+    rng = random.Random(seed)
+    names = data_company_names()
+    names += synthetic_company_names(max(0, num_companies - len(names)), rng)
+
+    start = time.perf_counter()
+    index = CompanyIndex.build(names)
+    build_seconds = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'company_index.npz')
+        start = time.perf_counter()
+        index.save(path)
+        save_seconds = time.perf_counter() - start
+        size = os.path.getsize(path)
+        start = time.perf_counter()
+        index = CompanyIndex.load(path)
+        load_seconds = time.perf_counter() - start
+
+    print(f"\nIndexed {len(index)} companies, {len(index.vocab)} trigrams, {len(index.postings)} postings")
+    print(f"build {build_seconds:.2f}s, save {save_seconds:.2f}s, load {load_seconds:.2f}s, "
+          f"{size / 2**20:.1f} MiB on disk")
+
+    targets = [name for name in rng.sample(names, min(num_queries, len(names))) if canonical_company(name)]
+    queries = [(perturb(name, rng), canonical_company(name)) for name in targets]
+
+    hits_at_1 = hits_at_k = 0
+    latencies = []
+    for query, expected in queries:
+        start = time.perf_counter()
+        results = index.search(query, k)
+        latencies.append(time.perf_counter() - start)
+        found = [key for key, _, _ in results]
+        hits_at_1 += bool(found) and found[0] == expected
+        hits_at_k += expected in found
+    latencies = np.array(latencies) * 1e6
+
+    print(f"\n{len(queries)} perturbed queries, k={k}")
+    print(f"recall@1 {hits_at_1 / len(queries):.1%}, recall@{k} {hits_at_k / len(queries):.1%}")
+    print(f"index search: mean {latencies.mean():.0f}us, p50 {np.percentile(latencies, 50):.0f}us, "
+          f"p99 {np.percentile(latencies, 99):.0f}us")
+
+    # Job exports: most companies are spelled like a lead company, some are perturbed or unknown
+    job_names = [rng.choice(names) for _ in range(num_jobs)]
+    job_names = [perturb(name, rng) if rng.random() < 0.2 else name for name in job_names]
+    job_keys = canonical_company_column(pd.Series(job_names))
+    start = time.perf_counter()
+    index.resolve_keys(job_keys)
+    resolve_us = (time.perf_counter() - start) / num_jobs * 1e6
+    print(f"resolve_keys: {num_jobs} jobs ({job_keys.nunique()} distinct), {resolve_us:.0f}us per job")
+
+    sample = queries[:min(50, len(queries))]
+    key_grams = [company_trigrams(key) for key in index.keys]
+    start = time.perf_counter()
+    brute_hits = sum(expected in brute_force_search(query, index.keys, key_grams, k) for query, expected in sample)
+    brute_us = (time.perf_counter() - start) / len(sample) * 1e6
+    print(f"brute-force scan: {brute_us:.0f}us per query ({brute_us / latencies.mean():.0f}x slower), "
+          f"recall@{k} {brute_hits / len(sample):.1%} on {len(sample)} queries")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the fuzzy company index")
+    parser.add_argument('--companies', type=int, default=100000)
+    parser.add_argument('--queries', type=int, default=2000)
+    parser.add_argument('-k', type=int, default=5)
+    parser.add_argument('--jobs', type=int, default=20000)
+    args = parser.parse_args()
+    run_benchmark(args.companies, args.queries, args.k, args.jobs)
@@ -0,0 +1,61 @@
+"""
+Benchmark the streaming dedup engine against cleaner.py's old drop_duplicates.
+
+Writes a synthetic LinkedIn export of --rows rows in which jobs reappear with
+other tracking parameters / country subdomains (same job id) or are reposted
+under a new id (same title, company and location), then runs the old
+whole-file drop_duplicates(subset=['jobUrl']) and dedup.dedup_csv (with
+fingerprint matching on) on it,
+reporting rows kept, wall time and peak tracemalloc memory, and how many of
+the planted duplicates each one removed.
+
+Usage:
+    python benchmarks/bench_dedup.py [--rows N] [--chunksize N]
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+Base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(Base_dir)
+
+import pandas as pd
+
+from _common import measure, synthetic_export_with_duplicates
+from dedup import DEDUP_CHUNK_ROWS, dedup_csv
+
+
+def drop_duplicates_by_url(input_path, output_path):
+    df = pd.read_csv(input_path)
+    cleaned = df.drop_duplicates(subset=['jobUrl'], keep='first')
+    cleaned.to_csv(output_path, index=False)
+    return len(cleaned)
+
+def streaming_dedup(input_path, output_path, chunksize):
+    return dedup_csv(input_path, output_path, chunksize, fingerprint=True).kept
+
+def run_benchmark(num_rows, chunksize):
+    frame, num_jobs = synthetic_export_with_duplicates(num_rows)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_path = os.path.join(tmp_dir, 'jobs.csv')
+        frame.to_csv(input_path, index=False)
+        del frame
+        print(f"\n{num_rows} rows ({os.path.getsize(input_path) / 2**20:.0f} MiB), "
+              f"{num_jobs} distinct jobs, {num_rows - num_jobs} planted duplicates")
+        print(f"{'method':>16} {'kept':>9} {'removed %':>10} {'seconds':>8} {'peak MiB':>9}")
+        for label, fn, args in (
+            ('drop_duplicates', drop_duplicates_by_url, (input_path, os.path.join(tmp_dir, 'old.csv'))),
+            ('dedup_csv', streaming_dedup, (input_path, os.path.join(tmp_dir, 'new.csv'), chunksize)),
+        ):
+            kept, seconds, peak = measure(fn, *args)
+            removed = (num_rows - kept) / (num_rows - num_jobs)
+            print(f"{label:>16} {kept:>9} {removed:>10.1%} {seconds:>8.2f} {peak / 2**20:>9.0f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the streaming job dedup engine")
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--chunksize', type=int, default=DEDUP_CHUNK_ROWS)
+    args = parser.parse_args()
+    run_benchmark(args.rows, args.chunksize)
@@ -0,0 +1,102 @@
+"""
+Benchmark start-to-first-page latency with and without the warm driver pool.
+
+Needs Chrome. For --runs runs, times the old path (resolve chromedriver
+through webdriver_manager, start a stealth Chrome, load the first results
+page, quit) against leasing a driver from a started DriverPool and loading
+the same page. Also times ChromeDriverManager().install() against the
+cached driver_pool.chromedriver_path().
+
+Usage:
+    python benchmarks/bench_driver_pool.py [--runs N] [--url URL]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+Base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(Base_dir)
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium_stealth import stealth
+from webdriver_manager.chrome import ChromeDriverManager
+
+from driver_pool import DriverPool, chromedriver_path
+from main import USER_AGENTS, create_stealth_driver, job_roles, shine_search_url
+
+
+def uncached_stealth_driver():
+    """main.create_stealth_driver as it was before the path cache"""
+    options = Options()
+    for argument in ("--headless=new", "--disable-gpu", "--window-size=1920,1080",
+                     "--disable-blink-features=AutomationControlled", "--disable-dev-shm-usage", "--no-sandbox",
+                     f"user-agent={random.choice(USER_AGENTS)}"):
+        options.add_argument(argument)
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+    stealth(driver, languages=["en-US", "en"], vendor="Google Inc.", platform="Win32",
+            webgl_vendor="Intel Inc.", renderer="Intel Iris OpenGL Engine", fix_hairline=True)
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    return driver
+
+def cold_first_page(url):
+    start = time.perf_counter()
+    driver = uncached_stealth_driver()
+    try:
+        driver.get(url)
+        return time.perf_counter() - start
+    finally:
+        driver.quit()
+
+def warm_first_page(pool, url):
+    start = time.perf_counter()
+    with pool.lease() as lease:
+        lease.driver.get(url)
+        lease.page_done()
+        return time.perf_counter() - start
+
+def summary(label, seconds):
+    print(f"{label:>26} median {statistics.median(seconds):>6.2f}s  min {min(seconds):>6.2f}s  max {max(seconds):>6.2f}s")
+
+def run_benchmark(runs, url):
+    install = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        ChromeDriverManager().install()
+        install.append(time.perf_counter() - start)
+    chromedriver_path()
+    cached = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        chromedriver_path()
+        cached.append(time.perf_counter() - start)
+
+    cold = [cold_first_page(url) for _ in range(runs)]
+
+    pool = DriverPool(create_stealth_driver, size=1)
+    pool.start()
+    pool.release(pool.acquire())  # wait until the driver is up
+    try:
+        warm = [warm_first_page(pool, url) for _ in range(runs)]
+    finally:
+        pool.close()
+
+    print(f"\n{runs} runs, first page {url}")
+    summary("ChromeDriverManager.install", install)
+    summary("cached chromedriver_path", cached)
+    summary("cold start + first page", cold)
+    summary("pool lease + first page", warm)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark warm driver pool start-to-first-page latency")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--url', default=shine_search_url(job_roles[0]))
+    args = parser.parse_args()
+    run_benchmark(args.runs, args.url)
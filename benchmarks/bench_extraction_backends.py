@@ -0,0 +1,74 @@
+"""
+Parity check and benchmark for the bs4 and lxml card-extraction backends.
+
+Runs every page of the Shine corpus (see bench_shine_parser.py) through both
+backends, reports any page where the qualified jobs differ, then times each
+backend. Exits non-zero when the backends disagree.
+
+Usage:
+    python benchmarks/bench_extraction_backends.py [corpus_dir] [--repeat N]
+"""
+import argparse
+import os
+import sys
+import time
+
+Base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(Base_dir)
+
+from bench_shine_parser import DEFAULT_CORPUS_DIR, build_synthetic_pages, load_recorded_pages, make_dedup
+
+import main
+
+
+def parse_page(page_source, backend):
+    parser = main.get_parser_backend(backend)
+    job_cards = parser['find_cards'](parser['load'](page_source))
+    return len(job_cards), main.parse_job_cards(job_cards, make_dedup(), backend)
+
+
+def check_parity(pages):
+    mismatches = 0
+    for idx, page_source in enumerate(pages):
+        expected = parse_page(page_source, 'bs4')
+        actual = parse_page(page_source, 'lxml')
+        if expected != actual:
+            mismatches += 1
+            print(f"Page {idx}: bs4 found {expected[0]} cards / {len(expected[1])} jobs, "
+                  f"lxml found {actual[0]} cards / {len(actual[1])} jobs")
+            for bs4_job, lxml_job in zip(expected[1], actual[1]):
+                for field in bs4_job:
+                    if bs4_job[field] != lxml_job[field]:
+                        print(f"  {field}: {bs4_job[field]!r} != {lxml_job[field]!r}")
+    return mismatches
+
+
+def time_backend(pages, backend, repeat):
+    cards = 0
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        for page_source in pages:
+            cards += parse_page(page_source, backend)[0]
+    duration = time.perf_counter() - start_time
+    return len(pages) * repeat / duration, cards / duration
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Compare bs4 and lxml Shine card extraction")
+    parser.add_argument('corpus_dir', nargs='?', default=DEFAULT_CORPUS_DIR)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    pages = load_recorded_pages(args.corpus_dir) or build_synthetic_pages()
+    mismatches = check_parity(pages)
+    print(f"Parity: {len(pages) - mismatches}/{len(pages)} pages identical")
+
+    for backend in ('bs4', 'lxml'):
+        pages_per_sec, cards_per_sec = time_backend(pages, backend, args.repeat)
+        print(f"{backend:<6} {pages_per_sec:8.1f} pages/sec {cards_per_sec:10.1f} cards/sec")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main_cli())
@@ -0,0 +1,74 @@
+"""
+Benchmark the Parquet job archive against the CSVs in Data/.
+
+Converts every known CSV into a temporary archive, then compares on-disk size
+and load time for: pd.read_csv of every file, load_jobs() of everything,
+and load_jobs() of one source with only the columns a join needs.
+
+Usage:
+    python benchmarks/bench_job_archive.py [--repeat N]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+Base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(Base_dir)
+
+import pandas as pd
+
+import job_archive
+
+Data_dir = os.path.join(Base_dir, 'Data')
+
+
+def dir_size(path):
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+def run_benchmark(repeat=5):
+    csv_paths = [os.path.join(Data_dir, name) for name in job_archive.CSV_SOURCES
+                 if os.path.exists(os.path.join(Data_dir, name))]
+    if not csv_paths:
+        print(f"No known CSVs in {Data_dir}")
+        return
+
+    with tempfile.TemporaryDirectory() as archive_dir:
+        for path in csv_paths:
+            job_archive.convert_csv(path, archive_dir=archive_dir)
+
+        csv_bytes = sum(os.path.getsize(path) for path in csv_paths)
+        parquet_bytes = dir_size(archive_dir)
+        print(f"\nSize: {csv_bytes / 1024:.0f} KiB CSV -> {parquet_bytes / 1024:.0f} KiB Parquet "
+              f"({parquet_bytes / csv_bytes:.0%})")
+
+        cases = [
+            ("pd.read_csv, all files", lambda: pd.concat([pd.read_csv(path) for path in csv_paths])),
+            ("load_jobs(), all sources", lambda: job_archive.load_jobs(archive_dir=archive_dir)),
+            ("pd.read_csv, linkedin files, 2 columns",
+             lambda: pd.concat([pd.read_csv(path, usecols=lambda c: c in ('company_name', 'jobUrl'))
+                                for path in csv_paths if job_archive.CSV_SOURCES[os.path.basename(path)] == 'linkedin'])),
+            ("load_jobs('linkedin', 2 columns)",
+             lambda: job_archive.load_jobs('linkedin', ['company_name', 'jobUrl'], archive_dir=archive_dir)),
+        ]
+        print(f"\n{'case':<42} {'best ms':>9} {'rows':>7} {'MiB in memory':>14}")
+        for label, fn in cases:
+            seconds, df = best_of(repeat, fn)
+            memory = df.memory_usage(deep=True).sum() / 2**20
+            print(f"{label:<42} {seconds * 1000:>9.1f} {len(df):>7} {memory:>14.2f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Compare the Parquet job archive with the Data/ CSVs")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    run_benchmark(args.repeat)
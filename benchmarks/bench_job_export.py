@@ -0,0 +1,69 @@
+"""
+Benchmark streaming job exports against materializing the whole export.
+
+Writes a synthetic LinkedIn export of --rows rows, then for each format
+(and gzipped CSV) times a filtered export built the old way - read_csv of
+the whole file, filter, encode into one buffer - against draining
+job_export.export_stream, reporting output size, wall time and peak
+tracemalloc memory.
+
+Usage:
+    python benchmarks/bench_job_export.py [--rows N] [--formats csv jsonl ...]
+"""
+import argparse
+import gzip
+import io
+import os
+import sys
+import tempfile
+
+Base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(Base_dir)
+
+import pandas as pd
+
+from _common import measure, synthetic_export
+from job_export import csv_chunks, export_stream
+
+FILTERS = {'location': 'india'}
+LOCATIONS = ('India', 'Remote', 'Bengaluru, India')
+
+
+def materialized(path, fmt, gzipped):
+    df = pd.read_csv(path, dtype=object, keep_default_na=False)
+    df = df[df['location'].str.lower().str.contains('india', regex=False)]
+    buffer = io.BytesIO()
+    if fmt == 'csv':
+        buffer.write(df.to_csv(index=False).encode('utf-8'))
+    elif fmt == 'jsonl':
+        buffer.write(df.to_json(orient='records', lines=True).encode('utf-8'))
+    elif fmt == 'parquet':
+        df.to_parquet(buffer, index=False)
+    else:
+        df.to_excel(buffer, index=False)
+    data = buffer.getvalue()
+    return len(gzip.compress(data) if gzipped else data)
+
+def streamed(path, fmt, gzipped):
+    return sum(len(block) for block in export_stream(csv_chunks(path), fmt, FILTERS, gzip=gzipped))
+
+def run_benchmark(num_rows, formats):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'jobs.csv')
+        synthetic_export(num_rows, locations=LOCATIONS).to_csv(path, index=False)
+        print(f"\n{num_rows} rows ({os.path.getsize(path) / 2**20:.0f} MiB), filter {FILTERS}")
+        print(f"{'format':>9} {'method':>13} {'out MiB':>8} {'seconds':>8} {'peak MiB':>9}")
+        for fmt in formats:
+            gzipped = fmt.endswith('.gz')
+            base = fmt[:-3] if gzipped else fmt
+            for label, fn in (('materialized', materialized), ('export_stream', streamed)):
+                size, seconds, peak = measure(fn, path, base, gzipped)
+                print(f"{fmt:>9} {label:>13} {size / 2**20:>8.1f} {seconds:>8.2f} {peak / 2**20:>9.0f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark streaming job exports")
+    parser.add_argument('--rows', type=int, default=500000)
+    parser.add_argument('--formats', nargs='+', default=['csv', 'csv.gz', 'jsonl', 'parquet'])
+    args = parser.parse_args()
+    run_benchmark(args.rows, args.formats)
@@ -0,0 +1,61 @@
+"""
+Benchmark the cached preview queries against re-reading the CSV per request.
+
+For synthetic LinkedIn exports of growing size, times the old /preview_data
+work (read_csv of the whole file, then head(10)) against JobFileCache
+queries once the file is cached: the first page, a later page, and a
+company filter (first run and memoized).
+
+Usage:
+    python benchmarks/bench_job_preview.py [--rows N ...] [--repeat N]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+Base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(Base_dir)
+
+import pandas as pd
+
+from _common import synthetic_export
+from job_preview import JobFileCache
+
+
+def best_ms(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+def run_benchmark(row_counts, repeat):
+    print(f"\n{'rows':>9} {'read_csv ms':>12} {'load ms':>8} {'page 1 ms':>10} {'page 100 ms':>12} "
+          f"{'filter ms':>10} {'filter again ms':>16}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for num_rows in row_counts:
+            path = os.path.join(tmp_dir, f'jobs_{num_rows}.csv')
+            synthetic_export(num_rows).to_csv(path, index=False)
+            cache = JobFileCache()
+
+            old = best_ms(lambda: pd.read_csv(path).head(10).to_dict('records'), repeat)
+            load = best_ms(lambda: cache.get(path), 1)
+            first = best_ms(lambda: cache.query(path, page=1, page_size=10), repeat)
+            later = best_ms(lambda: cache.query(path, page=100, page_size=10), repeat)
+            start = time.perf_counter()
+            cache.query(path, filters={'company': 'company 17'})
+            filtered = (time.perf_counter() - start) * 1000
+            again = best_ms(lambda: cache.query(path, page=2, filters={'company': 'company 17'}), repeat)
+            print(f"{num_rows:>9} {old:>12.1f} {load:>8.1f} {first:>10.2f} {later:>12.2f} "
+                  f"{filtered:>10.1f} {again:>16.2f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark cached, paginated job previews")
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000, 100000, 1000000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    run_benchmark(args.rows, args.repeat)
@@ -0,0 +1,112 @@
+"""
+Micro-benchmark for the single-pass keyword classifier behind meets_all_criteria.
+
+Compares main.JOB_KEYWORDS against the per-keyword `in` scans it replaced, using
+card-like texts built from the job CSVs in Data/, and checks both agree. Also
+checks that the Aho-Corasick and regex backends report exactly the keywords
+`keyword in text` finds (the automaton side is skipped without pyahocorasick);
+exits non-zero on any mismatch.
+
+Usage:
+    python benchmarks/bench_keyword_matcher.py [--repeat N]
+"""
+import argparse
+import csv
+import os
+import sys
+import time
+
+Base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(Base_dir)
+
+import main
+
+Data_dir = os.path.join(Base_dir, 'Data')
+SAMPLE_FILES = [
+    'remote_contract_software_jobs.csv',
+    'linkedin_jobs_old.csv',
+    'Linkedin Only India and remote and contract.csv',
+]
+
+
+def legacy_classify(job_text):
+    """The original has_excluded_keywords / is_remote_job / is_contract_job trio:
+    each call lowercased the text again and rebuilt its keyword list"""
+    results = []
+    for keywords in (main.EXCLUDED_KEYWORDS, main.REMOTE_KEYWORDS, main.CONTRACT_KEYWORDS):
+        job_text_lower = job_text.lower()
+        results.append(any(k in job_text_lower for k in list(keywords)))
+    return tuple(results)
+
+
+def single_pass_classify(job_text):
+    matches = main.JOB_KEYWORDS.classify(job_text)
+    return bool(matches['excluded']), bool(matches['remote']), bool(matches['contract'])
+
+
+def expected_matches(job_text):
+    job_text_lower = job_text.lower()
+    return {name: [k for k in keywords if k in job_text_lower] for name, keywords in main.JOB_KEYWORDS.groups.items()}
+
+
+def check_backends(texts):
+    """Mismatches against `keyword in text` per backend"""
+    backends = {'regex': main.KeywordClassifier(main.JOB_KEYWORDS.groups, automaton=False)}
+    if main.ahocorasick is not None:
+        backends['aho-corasick'] = main.KeywordClassifier(main.JOB_KEYWORDS.groups)
+    mismatches = {}
+    for name, classifier in backends.items():
+        mismatches[name] = 0
+        for text in texts:
+            expected, actual = expected_matches(text), classifier.classify(text)
+            if expected != actual:
+                mismatches[name] += 1
+                if mismatches[name] <= 3:
+                    print(f"{name}: {actual} != {expected} for {text[:80]!r}")
+    return mismatches
+
+
+def load_card_texts():
+    texts = []
+    for filename in SAMPLE_FILES:
+        with open(os.path.join(Data_dir, filename), newline='', encoding='utf-8-sig') as f:
+            for row in csv.DictReader(f):
+                texts.append(' '.join(value for value in row.values() if value))
+    return texts
+
+
+def time_it(func, texts, repeat):
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            func(text)
+    return time.perf_counter() - start_time
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Benchmark keyword classification per card")
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    texts = load_card_texts()
+    mismatches = sum(1 for text in texts if legacy_classify(text) != single_pass_classify(text))
+    backend = 'aho-corasick' if main.JOB_KEYWORDS.automaton is not None else 'regex'
+    print(f"Backend:          {backend}")
+    print(f"Card texts:       {len(texts)} (mismatches vs legacy: {mismatches})")
+    parity = check_backends(texts + ['Contractor role, permanent position', 'full-time contract-to-hire'])
+    for name, count in parity.items():
+        print(f"{name + ':':<17} {count} mismatches vs `keyword in text`")
+    if main.ahocorasick is None:
+        print("aho-corasick:     skipped (pyahocorasick not installed)")
+
+    calls = len(texts) * args.repeat
+    legacy = time_it(legacy_classify, texts, args.repeat)
+    single = time_it(single_pass_classify, texts, args.repeat)
+    print(f"Legacy scans:     {legacy / calls * 1e6:.2f} us/card")
+    print(f"Single pass:      {single / calls * 1e6:.2f} us/card")
+    print(f"Speedup:          {legacy / single:.2f}x")
+    sys.exit(1 if mismatches or any(parity.values()) else 0)
+
+
+if __name__ == '__main__':
+    main_cli()
@@ -0,0 +1,185 @@
+"""
+Benchmark the vectorized jobs x leads join against the iterrows loop it replaced.
+
+First checks, on the jobs and leads in Data/, that lead_join produces the same
+CSV as the legacy hr.py / l_hr.py loop when both are keyed by the legacy
+normalizers (hr.py: legal suffixes only; l_hr.py: also generic words such as
+'solutions' or 'systems'). Then reports how switching to the shared
+canonical_company key changes the matches - companies that only match under
+one of the keys, and the rows blank names used to join - and checks that the
+scalar and vectorized canonical_company paths agree. Finally times both joins
+on synthetic data of growing size (the loop only up to --legacy-max-leads, as
+it is O(jobs x leads)).
+
+Usage:
+    python benchmarks/bench_lead_join.py [--jobs N] [--leads N ...] [--companies N]
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+Base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(Base_dir)
+
+import numpy as np
+import pandas as pd
+
+import lead_join
+from company_names import canonical_company, canonical_company_column
+
+Data_dir = os.path.join(Base_dir, 'Data')
+
+
+# --- The normalizers and loop from hr.py / l_hr.py before lead_join ---
+
+BASIC_SUFFIXES = r'\b(inc\.?|incorporated|limited|ltd\.?|llc|corp\.?|corporation|private|pvt\.?)\b'
+EXTENDED_SUFFIXES = (r'\b(inc\.?|incorporated|ltd\.?|llc|corp\.?|corporation|private|pvt\.?|llp|group|services'
+                     r'|technologies|consulting|consultancy|solutions|labs|systems)\b')
+
+def legacy_normalize(name, extended=False):
+    """hr.py's normalize_company_name, or l_hr.py's with extended=True"""
+    if not isinstance(name, str):
+        return ""
+    name = name.lower().strip()
+    if extended:
+        name = re.sub(EXTENDED_SUFFIXES, '', name)
+        name = re.sub(r'[^a-z0-9\s]', ' ', name)
+        name = re.sub(r'\s+', ' ', name).strip()
+        return name
+    name = re.sub(BASIC_SUFFIXES, '', name)
+    return name.strip()
+
+def legacy_join(jobs_df, leads_df, column_map, key='norm_company'):
+    """The iterrows loop, matching on a key column both frames already carry"""
+    output_rows = []
+    for _, job_row in jobs_df.iterrows():
+        matching_hr = leads_df[leads_df[key] == job_row[key]]
+        for _, hr_row in matching_hr.iterrows():
+            row = {col: '' for col in lead_join.TARGET_COLUMNS}
+            for column, (kind, source) in column_map.items():
+                if kind == lead_join.CONST:
+                    row[column] = source
+                elif kind == lead_join.VERIFIED:
+                    value = hr_row.get(source)
+                    row[column] = 'Verified' if pd.notna(value) and value else ''
+                else:
+                    row[column] = (job_row if kind == lead_join.JOB else hr_row).get(source, '')
+            output_rows.append(row)
+    return pd.DataFrame(output_rows, columns=lead_join.TARGET_COLUMNS)
+
+def with_keys(df, normalize):
+    df = df.copy()
+    df['norm_company'] = df['company_name'].map(normalize)
+    return df
+
+def vectorized_join(jobs_df, leads_df, column_map, key='company_key'):
+    if key == 'company_key':
+        jobs_df = jobs_df.assign(company_key=canonical_company_column(jobs_df['company_name']))
+        leads_df = leads_df.assign(company_key=canonical_company_column(leads_df['company_name']))
+    return lead_join.join_jobs_to_leads(jobs_df, leads_df, column_map, job_key=key, lead_key=key)
+
+def matched_companies(jobs_df, leads_df, key):
+    """Job company names that find at least one lead under key"""
+    lead_keys = set(leads_df[key]) - {''}
+    return set(jobs_df.loc[jobs_df[key].isin(lead_keys), 'company_name'].dropna())
+
+
+def check_parity():
+    leads_path = os.path.join(Data_dir, 'Linked leads.csv')
+    cases = [
+        ('hr.py', 'remote_contract_software_jobs.csv', lead_join.SHINE_JOB_COLUMN_MAP, False),
+        ('l_hr.py', 'linkedin_jobs_old.csv', lead_join.LINKEDIN_JOB_COLUMN_MAP, True),
+    ]
+    ok = True
+    for label, jobs_file, column_map, extended in cases:
+        jobs_path = os.path.join(Data_dir, jobs_file)
+        if not (os.path.exists(jobs_path) and os.path.exists(leads_path)):
+            print(f"{label}: skipped, missing {jobs_file} or Linked leads.csv")
+            continue
+        jobs_df, leads_df = pd.read_csv(jobs_path), pd.read_csv(leads_path)
+        legacy_jobs = with_keys(jobs_df, lambda name: legacy_normalize(name, extended))
+        legacy_leads = with_keys(leads_df, lambda name: legacy_normalize(name, extended))
+
+        # Same keys on both sides: the join itself must not change anything but blank names,
+        # which the loop matched to each other and lead_join never joins
+        blank = legacy_leads['norm_company'].eq('')
+        expected = legacy_join(legacy_jobs, legacy_leads[~blank], column_map).to_csv(index=False)
+        actual = vectorized_join(legacy_jobs, legacy_leads, column_map, key='norm_company').to_csv(index=False)
+        same = expected == actual
+        ok &= same
+        blank_rows = legacy_jobs['norm_company'].eq('').sum() * blank.sum()
+        print(f"{label}: {actual.count(chr(10)) - 1} rows on the legacy keys, "
+              f"{'identical' if same else 'MISMATCH'} CSV output ({blank_rows} blank-name rows no longer joined)")
+
+        # Expected differences from the canonical key
+        canonical_jobs = jobs_df.assign(norm_company=canonical_company_column(jobs_df['company_name']))
+        canonical_leads = leads_df.assign(norm_company=canonical_company_column(leads_df['company_name']))
+        before = matched_companies(legacy_jobs, legacy_leads, 'norm_company')
+        after = matched_companies(canonical_jobs, canonical_leads, 'norm_company')
+        rows = len(vectorized_join(jobs_df, leads_df, column_map))
+        print(f"{label}: canonical key gives {rows} rows; {len(after - before)} job companies now match "
+              f"{sorted(after - before)[:5]}, {len(before - after)} no longer match {sorted(before - after)[:5]}")
+
+        names = pd.concat([jobs_df['company_name'], leads_df['company_name']], ignore_index=True)
+        same_keys = names.map(canonical_company).tolist() == canonical_company_column(names).tolist()
+        ok &= same_keys
+        print(f"{label}: scalar and vectorized company keys {'identical' if same_keys else 'MISMATCH'}")
+    return ok
+
+def synthetic_frames(num_jobs, num_leads, num_companies, seed=0):
+    rng = np.random.default_rng(seed)
+    suffixes = np.array(['', ' Pvt Ltd', ' Inc.', ' LLC', ' Limited', ' Corporation'])
+    companies = np.array([f'Company {i}' for i in range(num_companies)], dtype=object)
+    job_companies = companies[rng.integers(0, num_companies, num_jobs)] + suffixes[rng.integers(0, len(suffixes), num_jobs)]
+    jobs_df = pd.DataFrame({
+        'job_title': 'Software Engineer',
+        'company_name': job_companies,
+        'job_link': [f'https://www.shine.com/jobs/{i}' for i in range(num_jobs)],
+        'experience': '3-5',
+        'salary': 'Not Disclosed',
+        'date_posted': '2025-10-28',
+    })
+    lead_companies = companies[rng.integers(0, num_companies, num_leads)] + suffixes[rng.integers(0, len(suffixes), num_leads)]
+    leads_df = pd.DataFrame({
+        'first_name': 'Asha',
+        'last_name': 'Rao',
+        'job_title': 'HR Manager',
+        'company_name': lead_companies,
+        'email': np.where(rng.random(num_leads) < 0.8, 'hr@example.com', None),
+        'company_size': rng.integers(10, 5000, num_leads),
+        'city': 'Bengaluru',
+    })
+    return jobs_df, leads_df
+
+def time_call(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+def run_benchmark(num_jobs, lead_sizes, num_companies, legacy_max_leads):
+    print(f"\n{'leads':>10} {'jobs':>8} {'output rows':>12} {'vectorized s':>13} {'legacy s':>10}")
+    for num_leads in lead_sizes:
+        jobs_df, leads_df = synthetic_frames(num_jobs, num_leads, num_companies)
+        seconds, output = time_call(vectorized_join, jobs_df, leads_df, lead_join.SHINE_JOB_COLUMN_MAP)
+        legacy = '-'
+        if num_leads <= legacy_max_leads:
+            legacy_jobs = jobs_df.head(max(1, num_jobs // 100))
+            legacy_seconds, _ = time_call(legacy_join, with_keys(legacy_jobs, legacy_normalize),
+                                          with_keys(leads_df, legacy_normalize), lead_join.SHINE_JOB_COLUMN_MAP)
+            # Extrapolate from 1% of the jobs; the loop is linear in jobs
+            legacy = f"~{legacy_seconds * num_jobs / len(legacy_jobs):.0f}"
+        print(f"{num_leads:>10} {num_jobs:>8} {len(output):>12} {seconds:>13.2f} {legacy:>10}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the jobs x HR leads join")
+    parser.add_argument('--jobs', type=int, default=20000)
+    parser.add_argument('--leads', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--companies', type=int, default=50000)
+    parser.add_argument('--legacy-max-leads', type=int, default=100000)
+    args = parser.parse_args()
+    parity_ok = check_parity()
+    run_benchmark(args.jobs, args.leads, args.companies, args.legacy_max_leads)
+    sys.exit(0 if parity_ok else 1)
@@ -0,0 +1,76 @@
+"""
+Compare the streaming (chunked) jobs x leads merge with the in-memory one.
+
+Writes a synthetic leads CSV of --leads rows, then runs l_hr.py's in-memory
+path (read the whole CSV, join) and lead_join.stream_jobs_to_leads on it,
+reporting wall time and peak tracemalloc memory for each, and checks that
+both produce the same rows (the streamed file is grouped by leads chunk, so
+rows are compared after sorting).
+
+Usage:
+    python benchmarks/bench_leads_stream.py [--leads N] [--jobs N] [--chunksize N]
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+Base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(Base_dir)
+
+import pandas as pd
+
+import lead_join
+from _common import measure
+from bench_lead_join import synthetic_frames
+from company_names import company_key_column
+
+
+def in_memory_merge(jobs_df, leads_path, output_path):
+    leads_df = pd.read_csv(leads_path)
+    leads_df['company_key'] = company_key_column(leads_df)
+    output = lead_join.join_jobs_to_leads(jobs_df, leads_df, lead_join.SHINE_JOB_COLUMN_MAP)
+    output.to_csv(output_path, index=False)
+    return len(output)
+
+def streaming_merge(jobs_df, leads_path, output_path, chunksize):
+    rows, _ = lead_join.stream_jobs_to_leads(jobs_df, leads_path, output_path,
+                                             lead_join.SHINE_JOB_COLUMN_MAP, chunksize=chunksize)
+    return rows
+
+def sorted_rows(path):
+    df = pd.read_csv(path, dtype=str, keep_default_na=False)
+    return df.sort_values(list(df.columns)).reset_index(drop=True)
+
+def run_benchmark(num_leads, num_jobs, chunksize, num_companies=50000):
+    jobs_df, leads_df = synthetic_frames(num_jobs, num_leads, num_companies)
+    jobs_df['company_key'] = company_key_column(jobs_df)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        leads_path = os.path.join(tmp_dir, 'leads.csv')
+        leads_df.to_csv(leads_path, index=False)
+        del leads_df
+        print(f"\nLeads CSV: {num_leads} rows, {os.path.getsize(leads_path) / 2**20:.0f} MiB; {num_jobs} jobs")
+
+        memory_path = os.path.join(tmp_dir, 'in_memory.csv')
+        stream_path = os.path.join(tmp_dir, 'streamed.csv')
+        print(f"{'mode':>10} {'rows':>10} {'seconds':>8} {'peak MiB':>9}")
+        for label, fn, args in (
+            ('in-memory', in_memory_merge, (jobs_df, leads_path, memory_path)),
+            ('streaming', streaming_merge, (jobs_df, leads_path, stream_path, chunksize)),
+        ):
+            rows, seconds, peak = measure(fn, *args)
+            print(f"{label:>10} {rows:>10} {seconds:>8.2f} {peak / 2**20:>9.0f}")
+
+        same = sorted_rows(memory_path).equals(sorted_rows(stream_path))
+        print(f"streamed rows {'identical' if same else 'MISMATCH'} to the in-memory merge")
+    return same
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the streaming jobs x HR leads merge")
+    parser.add_argument('--leads', type=int, default=1000000)
+    parser.add_argument('--jobs', type=int, default=2000)
+    parser.add_argument('--chunksize', type=int, default=lead_join.LEADS_CHUNK_ROWS)
+    args = parser.parse_args()
+    sys.exit(0 if run_benchmark(args.leads, args.jobs, args.chunksize) else 1)
@@ -0,0 +1,124 @@
+"""
+Parity check and benchmark for LinkedIn's 'script' and 'elements' card extraction.
+
+Needs Chrome. Writes a synthetic LinkedIn results page of --cards cards
+(titles, companies, locations, dates, salaries, experience hints and
+missing fields mixed in), loads it in a headless stealth Chrome and reads
+every card with both modes: element by element (extract_job_url, then
+extract_job_data) and in one execute_script call (extract_page_fields).
+Reports any card whose fields differ, then the WebDriver round-trips and
+milliseconds per page of each mode. Exits non-zero when the modes disagree.
+
+Usage:
+    python benchmarks/bench_linkedin_extraction.py [--cards N] [--repeat N]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+Base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(Base_dir)
+
+from selenium.webdriver.common.by import By
+
+import linkedin
+from main import create_stealth_driver
+
+
+def synthetic_page(num_cards, seed=0):
+    rng = random.Random(seed)
+    cards = []
+    for i in range(num_cards):
+        attrs = ' aria-label="Senior role"' if rng.random() < 0.2 else ''
+        parts = [f'<li{attrs}><div class="base-card">']
+        if rng.random() < 0.95:
+            title = f'{rng.choice(["Junior", "Mid", "Python", "Staff"])} Engineer {i}'
+            parts.append(f'<a class="base-card__full-link" href="/jobs/view/{4_000_000_000 + i}?trk=guest">{title}</a>')
+        if rng.random() < 0.95:
+            parts.append(f'<h4 class="base-search-card__subtitle"><a>Company {i % 50} Pvt Ltd</a></h4>')
+        if rng.random() < 0.9:
+            parts.append('<span class="job-search-card__location">Bengaluru, Karnataka, India</span>')
+        if rng.random() < 0.9:
+            parts.append('<time datetime="2026-10-01T00:00:00">2 days ago</time>')
+        if rng.random() < 0.3:
+            parts.append('<div>₹ 20 LPA - 30 LPA</div>')
+        if rng.random() < 0.2:
+            parts.append('<p class="job-card-list__insight">Associate hiring</p>')
+        parts.append('</div></li>')
+        cards.append(''.join(parts))
+    return ('<html><body><ul class="jobs-search__results-list">' + ''.join(cards)
+            + '</ul></body></html>')
+
+def count_round_trips(driver):
+    """Wrap the driver's command executor; returns a dict whose 'count' grows per WebDriver command"""
+    counter = {'count': 0}
+    execute = driver.command_executor.execute
+
+    def counted(*args, **kwargs):
+        counter['count'] += 1
+        return execute(*args, **kwargs)
+
+    driver.command_executor.execute = counted
+    return counter
+
+def extract_elements(driver):
+    jobs = []
+    for card in driver.find_elements(By.CSS_SELECTOR, linkedin.CARD_SELECTOR):
+        if linkedin.extract_job_url(card) != "N/A":
+            jobs.append(linkedin.extract_job_data(card))
+    return jobs
+
+def extract_script(driver):
+    return [linkedin.job_from_fields(fields) for fields in linkedin.extract_page_fields(driver)
+            if linkedin.fields_job_url(fields) != "N/A"]
+
+def check_parity(elements_jobs, script_jobs):
+    mismatches = 0
+    if len(elements_jobs) != len(script_jobs):
+        print(f"elements found {len(elements_jobs)} jobs, script found {len(script_jobs)}")
+        mismatches += 1
+    for idx, (expected, actual) in enumerate(zip(elements_jobs, script_jobs)):
+        for field in expected:
+            if expected[field] != actual.get(field):
+                mismatches += 1
+                print(f"Card {idx} {field}: {expected[field]!r} != {actual.get(field)!r}")
+    return mismatches
+
+def run_benchmark(num_cards, repeat):
+    driver = create_stealth_driver()
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'linkedin_results.html')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(synthetic_page(num_cards))
+            driver.get('file://' + path)
+            counter = count_round_trips(driver)
+
+            results = {}
+            print(f"\n{num_cards} cards per page, best of {repeat}")
+            print(f"{'mode':>9} {'jobs':>5} {'round-trips':>12} {'ms/page':>9} {'ms/card':>8}")
+            for mode, extract in (('elements', extract_elements), ('script', extract_script)):
+                times = []
+                for _ in range(repeat):
+                    counter['count'] = 0
+                    start = time.perf_counter()
+                    results[mode] = extract(driver)
+                    times.append(time.perf_counter() - start)
+                ms = min(times) * 1000
+                print(f"{mode:>9} {len(results[mode]):>5} {counter['count']:>12} {ms:>9.1f} {ms / num_cards:>8.2f}")
+    finally:
+        driver.quit()
+    return check_parity(results['elements'], results['script'])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Compare LinkedIn card extraction element by element vs one execute_script")
+    parser.add_argument('--cards', type=int, default=linkedin.JOBS_PER_PAGE)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    mismatches = run_benchmark(args.cards, args.repeat)
+    print("Modes agree on every field" if not mismatches else f"{mismatches} mismatches")
+    sys.exit(1 if mismatches else 0)
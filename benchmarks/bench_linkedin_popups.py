@@ -0,0 +1,96 @@
+"""
+Benchmark LinkedIn popup handling: per-card DOM probes vs the in-page popup guard.
+
+Needs Chrome. Loads a synthetic results page (see bench_linkedin_extraction.py)
+in headless Chrome; the page opens a sign-in modal and a messaging bubble
+shortly after load, each closed by clicking it. Per page, the old handling
+ran handle_popups + close_login_popup after every card. The new handling
+installs POPUP_GUARD_JS once and lets its MutationObserver close what
+appears later. Reports WebDriver round-trips, seconds per page
+(including the click sleeps) and whether both popups ended up closed.
+
+Usage:
+    python benchmarks/bench_linkedin_popups.py [--cards N] [--pages N]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+Base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(Base_dir)
+
+from bench_linkedin_extraction import count_round_trips, synthetic_page
+
+import linkedin
+from main import create_stealth_driver
+
+POPUP_SCRIPT = """
+<script>
+setTimeout(() => {
+    const modal = document.createElement('div');
+    modal.className = 'sign-in-modal';
+    modal.textContent = 'Sign in to see more jobs';
+    modal.onclick = () => modal.remove();
+    document.body.appendChild(modal);
+}, 300);
+setTimeout(() => {
+    const bubble = document.createElement('button');
+    bubble.className = 'msg-overlay-bubble-header__control--close';
+    bubble.textContent = 'x';
+    bubble.onclick = () => bubble.remove();
+    document.body.appendChild(bubble);
+}, 600);
+</script>
+"""
+
+def popups_left(driver):
+    return driver.execute_script(
+        "return document.querySelectorAll('.sign-in-modal, .msg-overlay-bubble-header__control--close').length")
+
+def per_card_probes(driver, num_cards):
+    for _ in range(num_cards):
+        linkedin.handle_popups(driver)
+        linkedin.close_login_popup(driver)
+
+def popup_guard(driver, num_cards):
+    status = linkedin.guard_popups(driver)
+    if status is None or status['pending']:
+        linkedin.handle_popups(driver)
+        linkedin.close_login_popup(driver)
+
+def run_benchmark(num_cards, pages):
+    driver = create_stealth_driver()
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'linkedin_results.html')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(synthetic_page(num_cards).replace('</body>', POPUP_SCRIPT + '</body>'))
+            counter = count_round_trips(driver)
+
+            print(f"\n{num_cards} cards per page, {pages} pages")
+            print(f"{'method':>16} {'round-trips/page':>17} {'s/page':>8} {'popups left':>12}")
+            for label, handle in (('per-card probes', per_card_probes), ('popup guard', popup_guard)):
+                round_trips = seconds = left = 0
+                for _ in range(pages):
+                    driver.get('file://' + path)
+                    counter['count'] = 0
+                    start = time.perf_counter()
+                    handle(driver, num_cards)
+                    seconds += time.perf_counter() - start
+                    round_trips += counter['count']
+                    # The guard closes popups that appear after it was installed
+                    time.sleep(1.0)
+                    left += popups_left(driver)
+                print(f"{label:>16} {round_trips / pages:>17.0f} {seconds / pages:>8.2f} {left:>12}")
+    finally:
+        driver.quit()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Compare per-card popup probing with the in-page popup guard")
+    parser.add_argument('--cards', type=int, default=linkedin.JOBS_PER_PAGE)
+    parser.add_argument('--pages', type=int, default=3)
+    args = parser.parse_args()
+    run_benchmark(args.cards, args.pages)
@@ -0,0 +1,91 @@
+"""
+Benchmark the date, salary, experience and company parsers in main.py.
+
+Feeds the matching columns of every CSV in Data/ through each parser and
+reports throughput with the LRU cache bypassed (precompiled patterns only),
+on a cold cache and on a warm cache, plus the cache hit rate. Parsers that
+are not memoized (extract_experience_enhanced sees whole card texts in real
+runs) only get the uncached timing.
+
+Usage:
+    python benchmarks/bench_parsers.py [--repeat N]
+"""
+import argparse
+import csv
+import glob
+import os
+import sys
+import time
+
+Base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(Base_dir)
+
+import main
+
+Data_dir = os.path.join(Base_dir, 'Data')
+
+# parser name -> CSV columns (across the different exports) that feed it
+PARSER_COLUMNS = {
+    'clean_date_posted': ['date_posted', 'date posted', 'postedTime'],
+    'extract_salary_text': ['salary'],
+    'extract_experience_enhanced': ['experience', 'experienceLevel'],
+    'filter_experience': ['experience', 'experienceLevel'],
+    'clean_company_name': ['company_name', 'company name', 'companyName'],
+}
+
+
+def load_inputs():
+    inputs = {name: [] for name in PARSER_COLUMNS}
+    for path in sorted(glob.glob(os.path.join(Data_dir, '*.csv'))):
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            for row in csv.DictReader(f):
+                for name, columns in PARSER_COLUMNS.items():
+                    for column in columns:
+                        if row.get(column):
+                            inputs[name].append(row[column])
+    return inputs
+
+
+def time_calls(func, values, repeat):
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        for value in values:
+            func(value)
+    return time.perf_counter() - start_time
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Benchmark main.py field parsers over Data/")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    inputs = load_inputs()
+    print(f"{'parser':<30}{'inputs':>8}{'unique':>8}{'uncached':>12}{'cold':>12}{'warm':>12}{'hit rate':>10}")
+    for name, values in inputs.items():
+        func = getattr(main, name)
+        cached = main._clean_date_posted if name == 'clean_date_posted' else func
+        calls = len(values) * args.repeat
+        if not hasattr(cached, 'cache_info'):
+            raw = time_calls(func, values, args.repeat)
+            print(f"{name:<30}{len(values):>8}{len(set(values)):>8}{raw / calls * 1e6:>10.2f}us"
+                  f"{'-':>12}{'-':>12}{'-':>10}")
+            continue
+        # lru_cache keeps the undecorated function on __wrapped__
+        uncached = cached.__wrapped__
+        if name == 'clean_date_posted':
+            today = main.datetime.now().date()
+            uncached = lambda value, _parse=uncached: _parse(str(value), today)
+
+        raw = time_calls(uncached, values, args.repeat)
+        cached.cache_clear()
+        cold = time_calls(func, values, 1)
+        warm = time_calls(func, values, args.repeat)
+        info = cached.cache_info()
+        hit_rate = info.hits / (info.hits + info.misses)
+        print(f"{name:<30}{len(values):>8}{len(set(values)):>8}"
+              f"{raw / calls * 1e6:>10.2f}us{cold / len(values) * 1e6:>10.2f}us"
+              f"{warm / calls * 1e6:>10.2f}us{hit_rate:>10.1%}")
+
+
+if __name__ == '__main__':
+    main_cli()
@@ -0,0 +1,124 @@
+"""
+Benchmark the offline Shine card-parsing engine in main.py.
+
+Replays recorded Shine result pages (saved with scrape_shine(record_dir=...))
+through parse_shine_page and reports pages/sec, cards/sec and peak memory.
+When no recordings exist, a synthetic corpus is rendered from the rows in
+Data/remote_contract_software_jobs.csv so the benchmark can still run.
+
+Usage:
+    python benchmarks/bench_shine_parser.py [corpus_dir] [--repeat N]
+"""
+import argparse
+import csv
+import glob
+import html
+import os
+import sys
+import time
+import tracemalloc
+
+Base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(Base_dir)
+
+import main
+
+Data_dir = os.path.join(Base_dir, 'Data')
+DEFAULT_CORPUS_DIR = os.path.join(Data_dir, 'shine_pages')
+SAMPLE_CSV = os.path.join(Data_dir, 'remote_contract_software_jobs.csv')
+CARDS_PER_PAGE = 20
+
+CARD_TEMPLATE = """
+<div class="jobCard_jobCard__jjUmu white-box-border">
+  <div class="card_cName__mYnow company-name"><span>{company}</span></div>
+  <h2><a href="{path}">{title}</a></h2>
+  <ul class="card_features__wJid6">
+    <li class="card_item__YxRkV">{experience} Yrs</li>
+    <li class="card_item__YxRkV card_salary__kSm6K">{salary}</li>
+    <li class="card_item__YxRkV">Remote, Contract</li>
+  </ul>
+  <div class="card_postedTime__vDS3p"><span>{date_posted}</span></div>
+</div>"""
+
+
+def load_recorded_pages(corpus_dir):
+    return [open(path, 'rb').read() for path in sorted(glob.glob(os.path.join(corpus_dir, '*.html')))]
+
+
+def build_synthetic_pages():
+    """Render Shine-like result pages from jobs we already scraped"""
+    with open(SAMPLE_CSV, newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+
+    pages = []
+    for start in range(0, len(rows), CARDS_PER_PAGE):
+        cards = []
+        for row in rows[start:start + CARDS_PER_PAGE]:
+            link = row['job_link']
+            cards.append(CARD_TEMPLATE.format(
+                company=html.escape(row['company_name']),
+                path=html.escape(link.replace('https://www.shine.com', '')),
+                title=html.escape(row['job_title']),
+                experience=html.escape(row['experience']),
+                salary=html.escape(row['salary']),
+                date_posted=html.escape(row['date_posted']),
+            ))
+        pages.append(f"<html><body><div id='jobs'>{''.join(cards)}</div></body></html>")
+    return pages
+
+
+def make_dedup():
+    """Fresh per-page duplicate check so repeated runs don't filter everything out"""
+    seen = set()
+
+    def is_duplicate(job_link):
+        if job_link in seen:
+            return True
+        seen.add(job_link)
+        return False
+    return is_duplicate
+
+
+def run_benchmark(pages, repeat):
+    total_cards = 0
+    total_jobs = 0
+
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        for page_source in pages:
+            job_cards = main.find_job_cards(main.load_shine_html(page_source))
+            total_cards += len(job_cards)
+            total_jobs += len(main.parse_job_cards(job_cards, make_dedup()))
+    duration = time.perf_counter() - start_time
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total_pages = len(pages) * repeat
+    print(f"Pages parsed:     {total_pages}")
+    print(f"Cards parsed:     {total_cards}")
+    print(f"Qualified jobs:   {total_jobs}")
+    print(f"Elapsed:          {duration:.2f}s")
+    print(f"Pages/sec:        {total_pages / duration:.1f}")
+    print(f"Cards/sec:        {total_cards / duration:.1f}")
+    print(f"Peak memory:      {peak / (1024 * 1024):.2f} MiB")
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Benchmark offline Shine page parsing")
+    parser.add_argument('corpus_dir', nargs='?', default=DEFAULT_CORPUS_DIR)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    pages = load_recorded_pages(args.corpus_dir)
+    if pages:
+        print(f"Loaded {len(pages)} recorded pages from {args.corpus_dir}")
+    else:
+        pages = build_synthetic_pages()
+        print(f"No recorded pages in {args.corpus_dir}, using {len(pages)} synthetic pages from {SAMPLE_CSV}")
+
+    run_benchmark(pages, args.repeat)
+
+
+if __name__ == '__main__':
+    main_cli()
@@ -0,0 +1,128 @@
+"""
+Checkpoint of a long Shine scrape so a crashed run can be resumed.
+
+Two files under Data/: a small JSON state (completed roles and, for roles in
+progress, the next page to fetch) that is atomically replaced after every
+page, and an append-only JSONL log of the qualified jobs collected so far.
+The state records how many log lines it covers, so lines written after the
+last state save are ignored on resume.
+"""
+import json
+import os
+import threading
+from datetime import datetime
+
+from job_sink import AtomicPath
+
+Base_dir = os.path.dirname(os.path.abspath(__file__))
+Data_dir = os.path.join(Base_dir, 'Data')
+DEFAULT_CHECKPOINT_PATH = os.path.join(Data_dir, 'shine_checkpoint.json')
+
+
+class ScrapeCheckpoint:
+    def __init__(self, path=DEFAULT_CHECKPOINT_PATH, resume=False):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.jobs_path = os.path.splitext(path)[0] + '.jobs.jsonl'
+        self.lock = threading.Lock()
+
+        self.completed_roles = set()
+        self.in_progress = {}
+        self.role_jobs = {}
+        self.job_lines = 0
+
+        if resume and os.path.exists(self.path):
+            self._load()
+            print(f"Resuming from checkpoint {self.path}: {len(self.completed_roles)} roles done, "
+                  f"{len(self.in_progress)} in progress, {self.job_lines} jobs collected")
+        else:
+            if resume:
+                print(f"No checkpoint at {self.path}, starting from scratch")
+            self._reset_files()
+
+    def _load(self):
+        with open(self.path, encoding='utf-8') as f:
+            state = json.load(f)
+        self.completed_roles = set(state['completed_roles'])
+        self.in_progress = state['in_progress']
+        self.job_lines = state['job_lines']
+
+        lines_read = 0
+        if os.path.exists(self.jobs_path):
+            with open(self.jobs_path, encoding='utf-8') as f:
+                for line in f:
+                    if lines_read >= self.job_lines:
+                        break
+                    entry = json.loads(line)
+                    self.role_jobs.setdefault(entry['role'], []).append(entry['job'])
+                    lines_read += 1
+        # Drop anything appended after the last state save
+        self.job_lines = lines_read
+        with open(self.jobs_path, 'a+', encoding='utf-8') as f:
+            f.seek(0)
+            for _ in range(lines_read):
+                f.readline()
+            f.truncate(f.tell())
+
+    def _reset_files(self):
+        open(self.jobs_path, 'w', encoding='utf-8').close()
+        self._save_state()
+
+    def _save_state(self):
+        state = {
+            'completed_roles': sorted(self.completed_roles),
+            'in_progress': self.in_progress,
+            'job_lines': self.job_lines,
+            'updated_at': datetime.now().isoformat(timespec='seconds'),
+        }
+        with AtomicPath(self.path, suffix='.tmp') as tmp_path, open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def is_complete(self, role):
+        return role in self.completed_roles
+
+    def resume_point(self, role):
+        """(next page, consecutive zero pages) to continue this role from"""
+        progress = self.in_progress.get(role)
+        if progress is None:
+            return 1, 0
+        return progress['page'], progress['consecutive_zero']
+
+    def jobs_for(self, role):
+        """Jobs this role had collected before the resume; new pages are only kept on disk"""
+        return list(self.role_jobs.get(role, []))
+
+    def all_jobs(self):
+        return [job for jobs in self.role_jobs.values() for job in jobs]
+
+    def seed(self, is_duplicate):
+        """Mark checkpointed job links as seen so the resumed run doesn't collect them twice"""
+        for job in self.all_jobs():
+            is_duplicate(job['job_link'])
+
+    def record_page(self, role, page, qualified_jobs, consecutive_zero):
+        """Persist one finished page: its jobs first, then the state that points past them"""
+        with self.lock:
+            if qualified_jobs:
+                with open(self.jobs_path, 'a', encoding='utf-8') as f:
+                    for job in qualified_jobs:
+                        f.write(json.dumps({'role': role, 'job': job}, ensure_ascii=False) + '\n')
+                    f.flush()
+                    os.fsync(f.fileno())
+                self.job_lines += len(qualified_jobs)
+            self.in_progress[role] = {'page': page + 1, 'consecutive_zero': consecutive_zero}
+            self._save_state()
+
+    def complete_role(self, role):
+        with self.lock:
+            self.completed_roles.add(role)
+            self.in_progress.pop(role, None)
+            self._save_state()
+
+    def clear(self):
+        """Remove the checkpoint once the run has finished and its output is saved"""
+        for path in (self.path, self.jobs_path):
+            if os.path.exists(path):
+                os.remove(path)
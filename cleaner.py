@@ -1,33 +1,27 @@
 import pandas as pd
+from dedup import dedup_csv
 
-def remove_duplicates_by_joburl(input_file, output_file):
+def remove_duplicates_by_joburl(input_file, output_file, fingerprint=False):
+    """Stream input_file into output_file without repeated job ids (tracking params and
+    URL variants folded); with fingerprint, also without reposts of the same title,
+    company and location"""
     try:
-        # Read the CSV file
         print(f"Reading data from: {input_file}")
-        df = pd.read_csv(input_file)
-        
-        # Display original data info
-        print(f"Original data shape: {df.shape}")
-        print(f"Number of unique joburls: {df['jobUrl'].nunique()}")
-        
-        # Remove duplicates based on joburl column
-        df_cleaned = df.drop_duplicates(subset=['jobUrl'], keep='first')
-        
-        # Display cleaned data info
-        print(f"Cleaned data shape: {df_cleaned.shape}")
-        print(f"Number of duplicates removed: {len(df) - len(df_cleaned)}")
-        
-        # Save the cleaned data to new CSV file
-        df_cleaned.to_csv(output_file, index=False)
+        result = dedup_csv(input_file, output_file, fingerprint=fingerprint)
+
+        print(f"Original rows: {result.rows}")
+        print(f"Duplicate job ids removed: {result.id_duplicates}")
+        print(f"Near-duplicates removed: {result.fingerprint_duplicates}")
+        print(f"Cleaned rows: {result.kept}")
         print(f"Cleaned data saved to: {output_file}")
-        
-        return df_cleaned
-        
+
+        return result
+
     except FileNotFoundError:
         print(f"Error: Input file not found at {input_file}")
         return None
-    except KeyError:
-        print("Error: 'joburl' column not found in the CSV file")
+    except KeyError as e:
+        print(f"Error: {e}")
         return None
     except Exception as e:
         print(f"An error occurred: {e}")
@@ -40,13 +34,12 @@ cleaned_data = remove_duplicates_by_joburl(input_file, output_file)
 
 if cleaned_data is not None:
     print("\nProcess completed successfully!")
-    print(f"Final dataset has {len(cleaned_data)} unique job entries")
+    print(f"Final dataset has {cleaned_data.kept} unique job entries")
 else:
     print("\nProcess failed!")
 
 c=0
-for i in cleaned_data['companyName']:
-    if i=='Turing':
-        c+=1
+for chunk in pd.read_csv(output_file, usecols=['companyName'], chunksize=100000):
+    c += int((chunk['companyName'] == 'Turing').sum())
 
-print(f"\nNumber of job listings from Turing: {c}")
\ No newline at end of file
+print(f"\nNumber of job listings from Turing: {c}")
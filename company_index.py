@@ -0,0 +1,203 @@
+"""
+Fuzzy company-name index for matching scraped jobs to HR leads.
+
+Built once from the leads' company names: every canonical company key
+(company_names.canonical_company) is split into character trigrams, with
+spaces removed so "Insight Global" and "InsightGlobal Inc" share all of
+theirs, and an inverted index maps each trigram to the companies containing
+it. A query only touches the postings of its own trigrams and scores the
+candidates by Dice overlap, so a lookup costs a few postings merges rather
+than a scan of every lead company.
+
+The index is saved as a compressed .npz (no pickling) next to its leads
+file (index_path_for), so indexes of different leads files never replace
+each other, and rebuilt only when the leads file changed since.
+
+Usage:
+    python company_index.py build LEADS_CSV [--output PATH]
+    python company_index.py query NAME [NAME ...] (--leads LEADS_CSV | --index PATH) [-k K]
+"""
+import argparse
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from company_names import canonical_company, canonical_company_column
+from job_sink import AtomicPath
+from lead_join import LEADS_CHUNK_ROWS
+
+INDEX_SUFFIX = '.company_index.npz'
+
+# Dice score a job company needs before it is merged onto a lead company's key
+FUZZY_MIN_SCORE = 0.8
+
+
+def index_path_for(leads_path):
+    """Where the index of a leads file is saved, e.g. Data/Linked leads.csv -> Data/Linked leads.company_index.npz"""
+    return os.path.splitext(leads_path)[0] + INDEX_SUFFIX
+
+def company_trigrams(key):
+    """Trigrams of a canonical key with spaces removed and word-boundary padding"""
+    padded = f"${key.replace(' ', '')}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class CompanyIndex:
+    def __init__(self, keys, names, vocab, offsets, postings, gram_counts, meta=None):
+        self.keys = keys
+        self.names = names
+        self.vocab_ids = {gram: gram_id for gram_id, gram in enumerate(vocab)}
+        self.vocab = vocab
+        self.offsets = offsets
+        self.postings = postings
+        self.gram_counts = gram_counts
+        self.key_ids = {key: company_id for company_id, key in enumerate(keys)}
+        self.meta = meta or {}
+
+    @classmethod
+    def build(cls, company_names, meta=None):
+        """Index the distinct canonical keys of company_names, remembering the first spelling of each"""
+        names = pd.Series(company_names, dtype=object)
+        frame = pd.DataFrame({'key': canonical_company_column(names).to_numpy(), 'name': names.to_numpy()})
+        frame = frame[frame['key'].ne('')].drop_duplicates('key')
+        keys = frame['key'].tolist()
+        display_names = [str(name) for name in frame['name']]
+
+        gram_sets = [company_trigrams(key) for key in keys]
+        vocab = sorted(set().union(*gram_sets)) if gram_sets else []
+        vocab_ids = {gram: gram_id for gram_id, gram in enumerate(vocab)}
+        gram_ids = np.fromiter((vocab_ids[gram] for grams in gram_sets for gram in grams), dtype=np.int32)
+        gram_counts = np.fromiter((len(grams) for grams in gram_sets), dtype=np.int32, count=len(gram_sets))
+        company_ids = np.repeat(np.arange(len(keys), dtype=np.int32), gram_counts)
+
+        # CSR layout: postings[offsets[g]:offsets[g + 1]] are the companies containing trigram g
+        order = np.argsort(gram_ids, kind='stable')
+        postings = company_ids[order]
+        offsets = np.zeros(len(vocab) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(gram_ids, minlength=len(vocab)), out=offsets[1:])
+        return cls(keys, display_names, vocab, offsets, postings, gram_counts, meta)
+
+    @classmethod
+    def from_leads_csv(cls, leads_path, company_column='company_name', chunksize=LEADS_CHUNK_ROWS):
+        """Index a leads CSV, reading only its company column in chunks"""
+        names = {}  # distinct names in file order, so the first spelling of a company wins
+        for chunk in pd.read_csv(leads_path, usecols=[company_column], chunksize=chunksize):
+            names.update(dict.fromkeys(chunk[company_column].dropna()))
+        meta = {'source': os.path.abspath(leads_path), 'source_mtime': os.path.getmtime(leads_path),
+                'company_column': company_column}
+        return cls.build(list(names), meta)
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with AtomicPath(path) as tmp_path, open(tmp_path, 'wb') as f:
+            np.savez_compressed(
+                f,
+                keys=np.array(self.keys, dtype=str),
+                names=np.array(self.names, dtype=str),
+                vocab=np.array(self.vocab, dtype=str),
+                offsets=self.offsets,
+                postings=self.postings,
+                gram_counts=self.gram_counts,
+                meta=np.array(json.dumps(self.meta)),
+            )
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(data['keys'].tolist(), data['names'].tolist(), data['vocab'].tolist(),
+                       data['offsets'], data['postings'], data['gram_counts'], json.loads(str(data['meta'])))
+
+    @classmethod
+    def load_or_build(cls, leads_path, index_path=None, company_column='company_name'):
+        """Reuse the saved index (default: index_path_for(leads_path)) unless it was built from
+        another file or column, or the leads changed since"""
+        index_path = index_path or index_path_for(leads_path)
+        if os.path.exists(index_path):
+            index = cls.load(index_path)
+            if (index.meta.get('source') == os.path.abspath(leads_path)
+                    and index.meta.get('source_mtime') == os.path.getmtime(leads_path)
+                    and index.meta.get('company_column', company_column) == company_column):
+                return index
+        index = cls.from_leads_csv(leads_path, company_column)
+        index.save(index_path)
+        print(f"Built company index: {len(index)} companies, {len(index.vocab)} trigrams -> {index_path}")
+        return index
+
+    def __len__(self):
+        return len(self.keys)
+
+    def search(self, name, k=5, min_score=0.0, canonical=False):
+        """Top-k (company key, lead spelling, score) for a company name, best first.
+
+        Pass canonical=True when name is already a canonical company key.
+        """
+        key = name if canonical else canonical_company(name)
+        if not key:
+            return []
+        exact = self.key_ids.get(key)
+        if exact is not None and k == 1:
+            return [(key, self.names[exact], 1.0)]
+
+        grams = company_trigrams(key)
+        gram_ids = [self.vocab_ids[gram] for gram in grams if gram in self.vocab_ids]
+        if not gram_ids:
+            return []
+        candidates = np.concatenate([self.postings[self.offsets[g]:self.offsets[g + 1]] for g in gram_ids])
+        candidates, overlap = np.unique(candidates, return_counts=True)
+        scores = 2.0 * overlap / (len(grams) + self.gram_counts[candidates])
+
+        if len(scores) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return [(self.keys[candidates[i]], self.names[candidates[i]], float(scores[i]))
+                for i in top if scores[i] >= min_score]
+
+    def resolve_keys(self, keys, min_score=FUZZY_MIN_SCORE):
+        """Map each canonical key onto the closest indexed key scoring at least min_score.
+
+        Keys already in the index, blank keys and keys with no close match are kept as is.
+        """
+        keys = pd.Series(keys, dtype=object)
+        mapping = {}
+        for key in keys.dropna().unique():
+            if not key or key in self.key_ids:
+                continue
+            best = self.search(key, k=1, min_score=min_score, canonical=True)
+            if best:
+                mapping[key] = best[0][0]
+        if mapping:
+            print(f"Fuzzy company matching merged {len(mapping)} job companies onto lead companies")
+        return keys.replace(mapping) if mapping else keys
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description="Build or query the fuzzy company index")
+    commands = arg_parser.add_subparsers(dest='command', required=True)
+    build_parser = commands.add_parser('build', help="index the company names of a leads CSV")
+    build_parser.add_argument('leads_csv')
+    build_parser.add_argument('--output', help="index file (default: next to the leads CSV)")
+    build_parser.add_argument('--company-column', default='company_name')
+    query_parser = commands.add_parser('query', help="look up company names in a saved index")
+    query_parser.add_argument('names', nargs='+')
+    query_source = query_parser.add_mutually_exclusive_group(required=True)
+    query_source.add_argument('--leads', help="leads CSV whose saved index to query")
+    query_source.add_argument('--index', help="index file to query")
+    query_parser.add_argument('-k', type=int, default=5)
+    args = arg_parser.parse_args()
+
+    if args.command == 'build':
+        output = args.output or index_path_for(args.leads_csv)
+        index = CompanyIndex.from_leads_csv(args.leads_csv, args.company_column)
+        index.save(output)
+        print(f"Indexed {len(index)} companies ({len(index.vocab)} trigrams) to {output}")
+    else:
+        index = CompanyIndex.load(args.index or index_path_for(args.leads))
+        for name in args.names:
+            print(name)
+            for key, lead_name, score in index.search(name, args.k):
+                print(f"   {score:.2f}  {lead_name}  [{key}]")
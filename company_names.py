@@ -0,0 +1,130 @@
+"""
+Company-name normalization shared by the scrapers and the lead joins.
+
+Two forms:
+  clean_company_name(text)  - display name: job-board prefixes and artifacts
+                              removed, case kept ("Acme Technologies Pvt Ltd")
+  canonical_company(name)   - join key: lowercase, legal suffixes and generic
+                              words dropped, punctuation folded ("acme")
+
+The key is the broader of the two normalizers hr.py and l_hr.py used to
+carry. For hr.py (Shine jobs) that is a behaviour change: it used to drop
+legal suffixes only, so "Acme Solutions" and "Acme Systems" now both key
+to "acme" and join the same leads. On the files in Data/ the Shine join
+goes from 23 to 25 rows (one more company matched, none lost) and the
+LinkedIn join is unchanged; benchmarks/bench_lead_join.py reports the
+difference for any data.
+
+canonical_company is LRU-cached for per-card use in scrapers;
+canonical_company_column computes the same key for a whole pandas column,
+normalizing each distinct name once. Scrapers store the key with every job
+as company_key, and company_key_column reuses it instead of recomputing.
+"""
+import re
+from functools import lru_cache
+
+# Company names repeat heavily across cards and exports
+COMPANY_CACHE_SIZE = 4096
+
+COMPANY_PREFIXES = [re.compile(p, re.IGNORECASE) for p in (
+    r'^company:\s*',
+    r'^employer:\s*',
+    r'^at\s+',
+    r'^by\s+',
+    r'^posted by\s+',
+    r'^hiring:\s*',
+)]
+COMPANY_ARTIFACTS = [re.compile(p, re.IGNORECASE) for p in (
+    r'\s*\|\s*shine\.com.*$',
+    r'\s*-\s*shine\.com.*$',
+    r'\s*\(.*?\bverified\b.*?\)',
+    r'\s*★.*$',  # Remove ratings
+    r'\s*\d+\.\d+\s*$',  # Remove standalone ratings
+)]
+
+# Legal suffixes (hr.py) plus the generic words l_hr.py also dropped; see the module docstring
+COMPANY_STOPWORDS = (r'\b(inc\.?|incorporated|limited|ltd\.?|llc|llp|corp\.?|corporation|private|pvt\.?'
+                     r'|group|services|technologies|consulting|consultancy|solutions|labs|systems)\b')
+CANONICAL_PATTERNS = {
+    'stopwords': re.compile(COMPANY_STOPWORDS),
+    'non_alnum': re.compile(r'[^a-z0-9\s]'),
+    'whitespace': re.compile(r'\s+'),
+}
+# Placeholders scrapers write for a missing company; they must never join each other
+PLACEHOLDER_KEYS = {'not specified', 'n a', 'unknown'}
+
+COMPANY_KEY_COLUMN = 'company_key'
+
+
+@lru_cache(maxsize=COMPANY_CACHE_SIZE)
+def clean_company_name(company_text):
+    if not company_text or company_text == 'Not specified':
+        return 'Not specified'
+
+    # Remove common prefixes
+    for prefix in COMPANY_PREFIXES:
+        company_text = prefix.sub('', company_text)
+
+    # Remove job board artifacts
+    for artifact in COMPANY_ARTIFACTS:
+        company_text = artifact.sub('', company_text)
+
+    # Clean whitespace
+    company_text = ' '.join(company_text.split())
+    company_text = company_text.strip()
+
+    # Remove quotes if they wrap the entire name
+    if company_text.startswith('"') and company_text.endswith('"'):
+        company_text = company_text[1:-1]
+    if company_text.startswith("'") and company_text.endswith("'"):
+        company_text = company_text[1:-1]
+
+    # Validate: must be at least 2 characters and not just numbers
+    if len(company_text) < 2 or company_text.isdigit():
+        return 'Not specified'
+
+    return company_text
+
+@lru_cache(maxsize=COMPANY_CACHE_SIZE)
+def canonical_company(name):
+    """Join key for a company name; '' for missing names and placeholders"""
+    if not isinstance(name, str):
+        return ''
+    name = name.lower().strip()
+    name = CANONICAL_PATTERNS['stopwords'].sub('', name)
+    name = CANONICAL_PATTERNS['non_alnum'].sub(' ', name)
+    name = CANONICAL_PATTERNS['whitespace'].sub(' ', name).strip()
+    return '' if name in PLACEHOLDER_KEYS else name
+
+def canonical_company_column(names):
+    """canonical_company over a pandas column, with vectorized str ops on the distinct names"""
+    import numpy as np
+    import pandas as pd
+
+    names = pd.Series(names, dtype=object)
+    codes, uniques = pd.factorize(names, use_na_sentinel=True)
+    uniques = pd.Series(uniques, dtype=object)
+    uniques = uniques.where(uniques.map(type).eq(str), '').astype(str)
+    keys = (uniques.str.lower().str.strip()
+            .str.replace(COMPANY_STOPWORDS, '', regex=True)
+            .str.replace(r'[^a-z0-9\s]', ' ', regex=True)
+            .str.replace(r'\s+', ' ', regex=True)
+            .str.strip())
+    keys = keys.where(~keys.isin(PLACEHOLDER_KEYS), '')
+    # factorize marks missing values with -1, which picks the trailing ''
+    lookup = np.append(keys.to_numpy(dtype=object), '')
+    return pd.Series(lookup[codes], index=names.index, dtype=object)
+
+def company_key_column(df, name_column='company_name'):
+    """The stored company_key column when the export has one, else computed from name_column.
+
+    Rows with a blank stored key (older rows appended to a newer file) are filled in.
+    """
+    if COMPANY_KEY_COLUMN not in df:
+        return canonical_company_column(df[name_column])
+    keys = df[COMPANY_KEY_COLUMN].astype(object)
+    missing = keys.isna() | keys.eq('')
+    if missing.any():
+        keys = keys.copy()
+        keys[missing] = canonical_company_column(df.loc[missing, name_column]).to_numpy()
+    return keys
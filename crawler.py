@@ -0,0 +1,271 @@
+"""
+Asyncio crawl engine for paginated job search results.
+
+Result pages are fetched concurrently with httpx under a global concurrency
+limit and a per-host requests-per-second budget, while parsing runs on a
+thread pool so BeautifulSoup/lxml work never blocks the event loop. Each site
+plugs in through a SearchSpec: a URL builder and a parse callback.
+
+Usage:
+    python crawler.py [--site shine|linkedin] [--concurrency N] [--rps R] [--max-pages N] [--history] [role ...]
+"""
+import argparse
+import asyncio
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode, urlsplit
+
+import httpx
+from bs4 import BeautifulSoup
+from selenium.common.exceptions import NoSuchElementException
+
+import linkedin
+import main
+from job_sink import open_job_sink
+from seen_index import SeenJobIndex
+
+
+class SearchSpec:
+    """One paginated search: page_url(page) builds the URL, parse(page_source, page)
+    returns (card_count, qualified_jobs)
+
+    Pages are parsed ahead of time and possibly past where the search stops,
+    so parse must not record anything as seen; is_duplicate(job[link_field])
+    is applied only to the jobs of pages that are kept.
+    """
+
+    def __init__(self, name, page_url, parse, is_duplicate, link_field, max_pages=300, max_consecutive_zero=5):
+        self.name = name
+        self.page_url = page_url
+        self.parse = parse
+        self.is_duplicate = is_duplicate
+        self.link_field = link_field
+        self.max_pages = max_pages
+        self.max_consecutive_zero = max_consecutive_zero
+        self.jobs = []
+        self.pages_fetched = 0
+
+
+class HostRateLimiter:
+    """Spaces requests to the same host at least 1/requests_per_second apart"""
+
+    def __init__(self, requests_per_second):
+        self.interval = 1.0 / requests_per_second
+        self.next_slot = {}
+        self.lock = asyncio.Lock()
+
+    async def wait(self, url):
+        host = urlsplit(url).netloc
+        loop = asyncio.get_running_loop()
+        async with self.lock:
+            now = loop.time()
+            slot = max(now, self.next_slot.get(host, now))
+            self.next_slot[host] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class AsyncCrawler:
+    def __init__(self, concurrency=8, requests_per_second=2.0, parse_workers=4, timeout=20):
+        self.concurrency = concurrency
+        self.requests_per_second = requests_per_second
+        self.parse_workers = parse_workers
+        self.timeout = timeout
+        self.stats = {'requests': 0, 'failures': 0, 'pages_parsed': 0}
+
+    async def fetch(self, client, url):
+        await self.rate_limiter.wait(url)
+        async with self.semaphore:
+            self.stats['requests'] += 1
+            try:
+                response = await client.get(url)
+            except httpx.HTTPError as e:
+                print(f"Fetch failed for {url}: {e}")
+                self.stats['failures'] += 1
+                return None
+        if response.status_code != 200:
+            print(f"HTTP {response.status_code} for {url}")
+            self.stats['failures'] += 1
+            return None
+        return response.text
+
+    async def fetch_and_parse(self, client, search, page):
+        page_source = await self.fetch(client, search.page_url(page))
+        if page_source is None:
+            return None
+        search.pages_fetched += 1
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self.executor, search.parse, page_source, page)
+        self.stats['pages_parsed'] += 1
+        return result
+
+    async def crawl_search(self, client, search):
+        """Fetch pages in windows of `concurrency` and consume them in page order,
+        stopping on the same conditions as the sequential scrapers; pages of the
+        window past the stop are cancelled or their results dropped unrecorded"""
+        page = 1
+        consecutive_zero_pages = 0
+        while page <= search.max_pages:
+            window = range(page, min(page + self.concurrency, search.max_pages + 1))
+            tasks = [asyncio.ensure_future(self.fetch_and_parse(client, search, p)) for p in window]
+            try:
+                for task in tasks:
+                    result = await task
+                    if not result or not result[0]:
+                        return search.jobs
+                    card_count, candidate_jobs = result
+                    qualified_jobs = [job for job in candidate_jobs
+                                      if not search.is_duplicate(job[search.link_field])]
+                    search.jobs.extend(qualified_jobs)
+                    consecutive_zero_pages = 0 if qualified_jobs else consecutive_zero_pages + 1
+                    if consecutive_zero_pages >= search.max_consecutive_zero:
+                        return search.jobs
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            page = window.stop
+        return search.jobs
+
+    async def run(self, searches):
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        self.rate_limiter = HostRateLimiter(self.requests_per_second)
+        headers = {
+            'User-Agent': random.choice(main.USER_AGENTS),
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9',
+        }
+        limits = httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency)
+        with ThreadPoolExecutor(max_workers=self.parse_workers) as self.executor:
+            async with httpx.AsyncClient(headers=headers, limits=limits, timeout=self.timeout,
+                                         follow_redirects=True) as client:
+                await asyncio.gather(*(self.crawl_search(client, search) for search in searches))
+        return searches
+
+    def crawl(self, searches):
+        """Run every search to completion and return them with .jobs filled in"""
+        start_time = time.perf_counter()
+        asyncio.run(self.run(searches))
+        duration = time.perf_counter() - start_time
+        print(f"Crawled {self.stats['pages_parsed']} pages ({self.stats['requests']} requests, "
+              f"{self.stats['failures']} failures) in {duration:.1f}s "
+              f"= {self.stats['requests'] / max(duration, 1e-9):.2f} req/s")
+        return searches
+
+
+# --- Site plug-ins ---
+
+def missing_link(job_link):
+    """is_duplicate for parsing ahead: rejects cards without a link, records nothing"""
+    return not job_link
+
+
+def shine_search(role, is_duplicate, backend=None, max_pages=300):
+    """Shine results, parsed by main.process_results_page"""
+    return SearchSpec(
+        name=role,
+        page_url=lambda page: main.shine_search_url(role, page),
+        parse=lambda page_source, page: main.process_results_page(page_source, role, page, backend, missing_link)[:2],
+        is_duplicate=is_duplicate,
+        link_field='job_link',
+        max_pages=max_pages,
+    )
+
+
+class SoupElement:
+    """Just enough of selenium's WebElement API on top of a BeautifulSoup tag for
+    linkedin.extract_job_data to run against fetched HTML"""
+
+    def __init__(self, tag):
+        self.tag = tag
+
+    def find_element(self, by, selector):
+        found = self.tag.select_one(selector)
+        if found is None:
+            raise NoSuchElementException(selector)
+        return SoupElement(found)
+
+    @property
+    def text(self):
+        return '\n'.join(self.tag.stripped_strings)
+
+    def get_attribute(self, name):
+        value = self.tag.get(name)
+        if isinstance(value, list):
+            return ' '.join(value)
+        return value
+
+
+LINKEDIN_GUEST_SEARCH_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+
+
+def linkedin_search(keyword, is_duplicate, base_params=None, max_pages=linkedin.MAX_PAGES,
+                    jobs_per_page=linkedin.JOBS_PER_PAGE):
+    """LinkedIn guest search results, parsed card by card with linkedin.extract_job_data"""
+    base_params = linkedin.BASE_PARAMS if base_params is None else base_params
+
+    def page_url(page):
+        params = {'keywords': keyword, **base_params, 'start': (page - 1) * jobs_per_page}
+        return f"{LINKEDIN_GUEST_SEARCH_URL}?{urlencode(params)}"
+
+    def parse(page_source, page):
+        soup = BeautifulSoup(page_source, 'html.parser')
+        cards = soup.select("ul.jobs-search__results-list li") or soup.select("li")
+        jobs = []
+        for card in cards:
+            job_data = linkedin.extract_job_data(SoupElement(card))
+            if job_data["jobUrl"] != "N/A":
+                jobs.append(job_data)
+        return len(cards), jobs
+
+    return SearchSpec(name=keyword, page_url=page_url, parse=parse, is_duplicate=is_duplicate, link_field='jobUrl',
+                      max_pages=max_pages)
+
+
+def crawl_shine(roles, concurrency=8, requests_per_second=2.0, backend=None, max_pages=300, is_duplicate=None):
+    is_duplicate = is_duplicate or main.JobLinkDeduper()
+    searches = [shine_search(role, is_duplicate, backend, max_pages) for role in roles]
+    AsyncCrawler(concurrency, requests_per_second).crawl(searches)
+    return [job for search in searches for job in search.jobs]
+
+
+def crawl_linkedin(keywords, concurrency=8, requests_per_second=2.0, max_pages=linkedin.MAX_PAGES, is_duplicate=None):
+    is_duplicate = is_duplicate or main.JobLinkDeduper()
+    searches = [linkedin_search(keyword, is_duplicate, max_pages=max_pages) for keyword in keywords]
+    AsyncCrawler(concurrency, requests_per_second).crawl(searches)
+    return [job for search in searches for job in search.jobs]
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description="Crawl Shine or LinkedIn search results concurrently")
+    arg_parser.add_argument('roles', nargs='*', help="roles to search (default: main.job_roles / linkedin.KEYWORDS)")
+    arg_parser.add_argument('--site', choices=['shine', 'linkedin'], default='shine')
+    arg_parser.add_argument('--concurrency', type=int, default=8)
+    arg_parser.add_argument('--rps', type=float, default=2.0, help="requests per second per host")
+    arg_parser.add_argument('--max-pages', type=int, help="pages per search (default: 300 on Shine, linkedin.MAX_PAGES)")
+    arg_parser.add_argument('--backend', choices=sorted(main.PARSER_BACKENDS), default=main.PARSER_BACKEND)
+    arg_parser.add_argument('--history', action='store_true',
+                            help="skip jobs seen by earlier --history runs; the output then holds only new jobs")
+    args = arg_parser.parse_args()
+
+    seen_index = SeenJobIndex(source=args.site) if args.history else None
+    is_duplicate = seen_index.is_duplicate if seen_index else None
+    saved = False
+    try:
+        if args.site == 'linkedin':
+            jobs = crawl_linkedin(args.roles or linkedin.KEYWORDS, args.concurrency, args.rps,
+                                  args.max_pages or linkedin.MAX_PAGES, is_duplicate)
+            sink = open_job_sink(linkedin.csv_path, linkedin.CSV_FIELDNAMES)
+            sink.write_many(jobs)
+            sink.close()
+            print(f"Saved {sink.count} LinkedIn jobs to {linkedin.csv_path}")
+        else:
+            jobs = crawl_shine(args.roles or main.job_roles, args.concurrency, args.rps, args.backend,
+                               args.max_pages or 300, is_duplicate)
+            main.save_to_csv(jobs, 'remote_contract_software_jobs.csv')
+        saved = True
+    finally:
+        if seen_index:
+            # Jobs only count as seen once they are saved
+            seen_index.close(commit=saved)
@@ -0,0 +1,208 @@
+"""
+Streaming duplicate removal for scraped job exports.
+
+Two keys per row:
+  job id       - the stable id in the job URL: LinkedIn's trailing numeric
+                 id (or currentJobId=), Shine's trailing id, otherwise the
+                 URL with scheme, www., query string, fragment and trailing
+                 slash removed. Catches the same job behind ?trk= and
+                 country-subdomain variants.
+  fingerprint  - normalized title + canonical company + location. Catches
+                 the same job reposted under a new id, but also merges
+                 genuinely different postings that share a title, so it is
+                 opt-in (--fingerprint).
+A row is a duplicate when a key in use matches an earlier row (kept or
+dropped). The input is read in chunks, and only 64-bit hashes of the keys
+are remembered, in sorted numpy runs (HashSet64), so memory grows by
+8 bytes per distinct key (briefly twice that while runs merge) however
+wide or long the input is.
+
+Usage:
+    python dedup.py INPUT_CSV OUTPUT_CSV [--chunksize N] [--fingerprint]
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from company_names import canonical_company_column
+from job_sink import AtomicPath
+
+DEDUP_CHUNK_ROWS = 100000
+
+# Column names used by the LinkedIn and Shine exports, first match wins
+URL_COLUMNS = ('jobUrl', 'job_link', 'job_url', 'url')
+TITLE_COLUMNS = ('job_title', 'title', 'jobTitle')
+COMPANY_COLUMNS = ('company_name', 'companyName')
+LOCATION_COLUMNS = ('location', 'job_location')
+
+# (source, literal marker, pattern) applied to lowercased URLs; the marker skips rows cheaply
+JOB_ID_PATTERNS = (
+    ('linkedin', 'linkedin.com/jobs/view/', r'linkedin\.com/jobs/view/(?:[^/?#]*-)?(\d+)'),
+    ('linkedin', 'currentjobid=', r'linkedin\.com/jobs/.*[?&]currentjobid=(\d+)'),
+    ('shine', 'shine.com/jobs/', r'shine\.com/jobs/.*/(\d+)/?(?:[?#]|$)'),
+)
+# Pattern strings rather than compiled regexes keep pandas on its vectorized string kernels
+URL_NOISE = (r'[?#].*$', r'^https?://(www\.)?', r'/+$')
+# Work-mode tags ("(Remote)", "[Contract]") vary between reposts of one job; other bracketed
+# text ("(Fluent in Python)") tells postings apart and is kept
+TITLE_NOISE = (r'[(\[]\s*(?:remote|contract|contractual|hybrid|wfh|work from home|urgent|'
+               r'immediate joiners?|full[- ]time|part[- ]time)\s*[)\]]')
+# Token separators, applied in order; '#', '+' and dots inside or in front of a word are
+# kept so C#, C++, C and .NET stay apart (pandas' Arrow regex engine has no lookahead)
+TEXT_SEPARATORS = (r'[^a-z0-9#+.]+', r'\.+(?:\s|$)', r'\s+')
+# Fixed 16-byte hash keys: hashes stay stable across runs, and an id never collides with a fingerprint
+ID_HASH_KEY = 'job-id-dedup-key'
+FINGERPRINT_HASH_KEY = 'job-fingerprints'
+
+
+def first_column(columns, candidates):
+    return next((column for column in candidates if column in columns), None)
+
+def text_column(values):
+    return pd.Series(values).fillna('').astype(str)
+
+def job_id_column(urls):
+    """Stable job id per URL ('source:id' or the stripped URL); '' for missing URLs"""
+    urls = text_column(urls).str.strip().str.lower()
+    ids = urls.copy()
+    found = pd.Series(False, index=urls.index)
+    for source, marker, pattern in JOB_ID_PATTERNS:
+        candidates = ~found & urls.str.contains(marker, regex=False)
+        if not candidates.any():
+            continue
+        matched = urls[candidates].str.extract(pattern, expand=False).dropna()
+        ids[matched.index] = source + ':' + matched
+        found[matched.index] = True
+    rest = ~found
+    if rest.any():
+        stripped = urls[rest]
+        for pattern in URL_NOISE:
+            stripped = stripped.str.replace(pattern, '', regex=True)
+        ids[rest] = stripped
+    return ids
+
+def normalized_text(values):
+    text = text_column(values).str.lower()
+    for pattern in TEXT_SEPARATORS:
+        text = text.str.replace(pattern, ' ', regex=True)
+    return text.str.strip()
+
+def fingerprint_column(titles, companies, locations=None):
+    """'title|company|location' per row; '' when the title or company is missing"""
+    titles = normalized_text(text_column(titles).str.lower().str.replace(TITLE_NOISE, ' ', regex=True))
+    companies = canonical_company_column(companies).to_numpy()
+    locations = normalized_text(locations) if locations is not None else ''
+    fingerprints = titles + '|' + companies + '|' + locations
+    return fingerprints.where(titles.ne('') & (companies != ''), '')
+
+def hash_keys(keys, hash_key=ID_HASH_KEY):
+    """64-bit hashes of string keys, with 0 standing for blank keys"""
+    keys = text_column(keys)
+    hashes = pd.util.hash_pandas_object(keys, index=False, hash_key=hash_key).to_numpy(copy=True)
+    hashes[hashes == 0] = 1
+    hashes[keys.eq('').to_numpy()] = 0
+    return hashes
+
+
+class HashSet64:
+    """Set of uint64 hashes stored as sorted numpy runs, merged like a binary counter
+    so there are at most log2(n) runs to search"""
+
+    def __init__(self):
+        self.runs = []
+
+    def __len__(self):
+        return sum(len(run) for run in self.runs)
+
+    @property
+    def nbytes(self):
+        return sum(run.nbytes for run in self.runs)
+
+    def contains(self, hashes):
+        found = np.zeros(len(hashes), dtype=bool)
+        for run in self.runs:
+            positions = np.searchsorted(run, hashes).clip(max=len(run) - 1)
+            found |= run[positions] == hashes
+        return found
+
+    def add(self, hashes):
+        run = np.unique(hashes)
+        run = run[~self.contains(run)]
+        if not len(run):
+            return
+        while self.runs and len(self.runs[-1]) <= 2 * len(run):
+            run = np.union1d(self.runs.pop(), run)
+        self.runs.append(run)
+
+
+class JobDeduplicator:
+    """Drops rows whose job id or fingerprint was seen earlier, chunk by chunk"""
+
+    def __init__(self, fingerprint=False):
+        self.fingerprint = fingerprint
+        self.seen = HashSet64()
+        self.rows = 0
+        self.kept = 0
+        self.id_duplicates = 0
+        self.fingerprint_duplicates = 0
+
+    def key_hashes(self, chunk):
+        columns = chunk.columns
+        url_column = first_column(columns, URL_COLUMNS)
+        if url_column is None:
+            raise KeyError(f"no job URL column (tried {', '.join(URL_COLUMNS)})")
+        keys = [hash_keys(job_id_column(chunk[url_column]))]
+        title_column = first_column(columns, TITLE_COLUMNS)
+        company_column = first_column(columns, COMPANY_COLUMNS)
+        if self.fingerprint and title_column and company_column:
+            location_column = first_column(columns, LOCATION_COLUMNS)
+            locations = chunk[location_column] if location_column else None
+            fingerprints = fingerprint_column(chunk[title_column], chunk[company_column], locations)
+            keys.append(hash_keys(fingerprints, FINGERPRINT_HASH_KEY))
+        return keys
+
+    def filter(self, chunk):
+        """The rows of chunk not seen before; remembers the keys of every row"""
+        duplicate = np.zeros(len(chunk), dtype=bool)
+        for kind, hashes in enumerate(self.key_hashes(chunk)):
+            present = hashes != 0
+            repeated = pd.Series(hashes).duplicated().to_numpy() | self.seen.contains(hashes)
+            repeated &= present & ~duplicate
+            if kind == 0:
+                self.id_duplicates += int(repeated.sum())
+            else:
+                self.fingerprint_duplicates += int(repeated.sum())
+            duplicate |= repeated
+            self.seen.add(hashes[present])
+        self.rows += len(chunk)
+        self.kept += int((~duplicate).sum())
+        return chunk[~duplicate]
+
+    def summary(self):
+        return (f"{self.rows} rows: {self.kept} kept, {self.id_duplicates} duplicate job ids, "
+                f"{self.fingerprint_duplicates} near-duplicates (same title, company and location); "
+                f"{len(self.seen)} keys in {self.seen.nbytes / 2**20:.1f} MiB")
+
+
+def dedup_csv(input_path, output_path, chunksize=DEDUP_CHUNK_ROWS, fingerprint=False):
+    """Stream input_path into output_path without duplicate jobs; returns the JobDeduplicator"""
+    deduplicator = JobDeduplicator(fingerprint)
+    with AtomicPath(output_path) as tmp_path, open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+        header = True
+        for chunk in pd.read_csv(input_path, chunksize=chunksize, dtype=str, keep_default_na=False):
+            deduplicator.filter(chunk).to_csv(f, index=False, header=header)
+            header = False
+    return deduplicator
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Remove duplicate and reposted jobs from a scraped CSV")
+    parser.add_argument('input_csv')
+    parser.add_argument('output_csv')
+    parser.add_argument('--chunksize', type=int, default=DEDUP_CHUNK_ROWS)
+    parser.add_argument('--fingerprint', action='store_true',
+                        help="also drop reposts with the same title, company and location under a new id")
+    args = parser.parse_args()
+    result = dedup_csv(args.input_csv, args.output_csv, args.chunksize, args.fingerprint)
+    print(result.summary())
@@ -0,0 +1,246 @@
+"""
+A pool of warm, stealth-patched Chrome drivers shared by the dashboard's scrape jobs.
+
+Starting Chrome costs seconds per scrape, and webdriver_manager looks up the
+latest chromedriver online every time install() is called. The pool launches
+its drivers in the background ahead of time and hands them out as leases:
+
+    pool = DriverPool(create_stealth_driver, size=2)
+    pool.start()
+    with pool.lease() as lease:
+        lease.driver.get(url)
+        lease.page_done()
+
+A driver is health-checked when it is handed out (a dead session is replaced
+transparently) and reset to a blank page with no cookies when it comes back.
+It is recycled - quit, and a replacement launched in the background - once
+it has served max_pages pages, its browser uses more than max_memory_mb, or
+it fails a health check. These are checked when the lease ends, so a long
+scrape should take one lease per batch of pages (the dashboard leases per
+role or keyword) rather than one for the whole run. Memory is the resident size of chromedriver and
+Chrome when psutil is installed, otherwise Chrome's own JS heap figure.
+"""
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+POOL_SIZE = 2
+# Pages a driver serves before it is recycled; long-lived Chrome sessions grow
+MAX_PAGES_PER_DRIVER = 200
+MAX_DRIVER_MEMORY_MB = 1500
+# Seconds acquire() waits for a driver when all of them are leased
+LEASE_TIMEOUT_SECONDS = 600
+
+_chromedriver_path = None
+_chromedriver_lock = threading.Lock()
+
+
+def chromedriver_path():
+    """Path of the chromedriver binary, resolved once per process
+
+    CHROMEDRIVER_PATH overrides webdriver_manager; the path is resolved again
+    if the binary has disappeared since.
+    """
+    global _chromedriver_path
+    with _chromedriver_lock:
+        if _chromedriver_path is None or not os.path.exists(_chromedriver_path):
+            _chromedriver_path = os.environ.get('CHROMEDRIVER_PATH')
+            if not _chromedriver_path:
+                from webdriver_manager.chrome import ChromeDriverManager
+                _chromedriver_path = ChromeDriverManager().install()
+        return _chromedriver_path
+
+def driver_memory_mb(driver):
+    """Memory used by the driver's browser in MiB, or None when it can't be read"""
+    try:
+        if psutil is not None:
+            service = psutil.Process(driver.service.process.pid)
+            processes = [service] + service.children(recursive=True)
+            return sum(process.memory_info().rss for process in processes) / 2**20
+        heap = driver.execute_script("return performance.memory ? performance.memory.usedJSHeapSize : null")
+        return heap / 2**20 if heap else None
+    except Exception:
+        return None
+
+
+class PooledDriver:
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+        self.leases = 0
+        self.started = time.monotonic()
+
+    def page_done(self, pages=1):
+        """Count pages loaded during this lease towards the recycling threshold"""
+        self.pages += pages
+
+
+class DriverPool:
+    def __init__(self, factory, size=POOL_SIZE, max_pages=MAX_PAGES_PER_DRIVER,
+                 max_memory_mb=MAX_DRIVER_MEMORY_MB):
+        self.factory = factory
+        self.size = size
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self.changed = threading.Condition()
+        self.idle = []
+        self.total = 0  # idle, leased and launching drivers
+        self.closed = False
+        self.stats = {'launched': 0, 'recycled': 0, 'failed_checks': 0, 'leases': 0, 'warm_leases': 0}
+
+    def start(self):
+        """Launch drivers in the background until size of them are running"""
+        with self.changed:
+            missing = 0 if self.closed else self.size - self.total
+            self.total += missing
+        for _ in range(missing):
+            threading.Thread(target=self._launch, name='driver-pool-launch', daemon=True).start()
+
+    def _launch(self):
+        try:
+            pooled = self._new_driver()
+        except Exception as e:
+            print(f"Driver pool: could not start a driver: {e}")
+            with self.changed:
+                self.total -= 1
+                self.changed.notify_all()
+            return
+        with self.changed:
+            if not self.closed:
+                self.idle.append(pooled)
+                self.changed.notify_all()
+                return
+            self.total -= 1
+        self._quit(pooled)
+
+    def _new_driver(self):
+        pooled = PooledDriver(self.factory())
+        with self.changed:
+            self.stats['launched'] += 1
+        return pooled
+
+    def healthy(self, pooled):
+        try:
+            pooled.driver.execute_script("return document.readyState")
+            return True
+        except Exception:
+            return False
+
+    def recycle_reason(self, pooled):
+        """Why a returned driver should be replaced, or None to keep it"""
+        if pooled.pages >= self.max_pages:
+            return f"{pooled.pages} pages"
+        if not self.healthy(pooled):
+            return "failed health check"
+        memory = driver_memory_mb(pooled.driver) if self.max_memory_mb else None
+        if memory is not None and memory > self.max_memory_mb:
+            return f"{memory:.0f} MiB"
+        return None
+
+    def acquire(self, timeout=LEASE_TIMEOUT_SECONDS):
+        """A healthy driver, launching one if the pool isn't full; TimeoutError if none frees up"""
+        deadline = time.monotonic() + timeout
+        while True:
+            with self.changed:
+                while True:
+                    if self.closed:
+                        raise RuntimeError("Driver pool is closed")
+                    if self.idle:
+                        pooled = self.idle.pop()
+                        break
+                    if self.total < self.size:
+                        self.total += 1
+                        pooled = None
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(f"No browser driver free after {timeout}s")
+                    self.changed.wait(remaining)
+
+            if pooled is None:
+                try:
+                    pooled = self._new_driver()
+                except Exception:
+                    with self.changed:
+                        self.total -= 1
+                        self.changed.notify_all()
+                    raise
+                warm = False
+            elif not self.healthy(pooled):
+                print("Driver pool: replacing a driver that failed its health check")
+                with self.changed:
+                    self.stats['failed_checks'] += 1
+                self._discard(pooled)
+                continue
+            else:
+                warm = True
+
+            pooled.leases += 1
+            with self.changed:
+                self.stats['leases'] += 1
+                self.stats['warm_leases'] += int(warm)
+            return pooled
+
+    def release(self, pooled):
+        """Return a leased driver: reset it for the next lease, or recycle it"""
+        reason = self.recycle_reason(pooled)
+        if reason is None:
+            try:
+                pooled.driver.delete_all_cookies()
+                pooled.driver.get("about:blank")
+            except Exception as e:
+                reason = f"reset failed: {e}"
+        if reason is not None:
+            print(f"Driver pool: recycling a driver after {pooled.leases} leases ({reason})")
+            with self.changed:
+                self.stats['recycled'] += 1
+            self._discard(pooled)
+            self.start()
+            return
+        with self.changed:
+            if not self.closed:
+                self.idle.append(pooled)
+                self.changed.notify_all()
+                return
+            self.total -= 1
+        self._quit(pooled)
+
+    @contextmanager
+    def lease(self, timeout=LEASE_TIMEOUT_SECONDS):
+        pooled = self.acquire(timeout)
+        try:
+            yield pooled
+        finally:
+            self.release(pooled)
+
+    def _discard(self, pooled):
+        with self.changed:
+            self.total -= 1
+            self.changed.notify_all()
+        self._quit(pooled)
+
+    def _quit(self, pooled):
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            print(f"Driver pool: error quitting a driver: {e}")
+
+    def snapshot(self):
+        with self.changed:
+            return {'size': self.size, 'running': self.total, 'idle': len(self.idle), **self.stats}
+
+    def close(self):
+        """Quit the idle drivers; leased ones are quit when they are released"""
+        with self.changed:
+            self.closed = True
+            idle, self.idle = self.idle, []
+            self.total -= len(idle)
+            self.changed.notify_all()
+        for pooled in idle:
+            self._quit(pooled)
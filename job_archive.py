@@ -0,0 +1,155 @@
+"""
+Columnar archive of scraped jobs under Data/archive.
+
+Jobs are stored as Parquet, partitioned hive-style by source and scrape date
+(Data/archive/source=shine/scrape_date=2025-10-28/<name>.parquet). Every
+column is kept as text, as in the CSVs it replaces, with company and location
+columns dictionary-encoded. load_jobs() only opens the partitions and reads
+the columns it is asked for.
+
+Usage:
+    python job_archive.py convert [--source S] [--date YYYY-MM-DD] [csv ...]
+    python job_archive.py list
+"""
+import argparse
+import os
+import re
+from datetime import date, datetime
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from job_sink import AtomicPath, arrow_text_schema
+
+Base_dir = os.path.dirname(os.path.abspath(__file__))
+Data_dir = os.path.join(Base_dir, 'Data')
+ARCHIVE_DIR = os.path.join(Data_dir, 'archive')
+
+# Source partition for each CSV already in Data/
+CSV_SOURCES = {
+    'remote_contract_software_jobs.csv': 'shine',
+    'linkedin_jobs_guest.csv': 'linkedin',
+    'linkedin_jobs_old.csv': 'linkedin',
+    'Linkedin Only India and remote and contract.csv': 'linkedin',
+    'merged_jobs_hr(2).csv': 'merged_hr',
+    'Linked leads.csv': 'hr_leads',
+}
+
+DATE_PARTITIONING = ds.partitioning(pa.schema([('scrape_date', pa.string())]), flavor='hive')
+
+
+def part_name(name):
+    """Filesystem-safe Parquet file stem from a CSV name or run label"""
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', os.path.splitext(os.path.basename(name))[0]).strip('_')
+
+def partition_path(source, scrape_date=None, name=None, archive_dir=ARCHIVE_DIR):
+    """Path of one Parquet file in the archive; name defaults to the current time"""
+    scrape_date = scrape_date or date.today().isoformat()
+    name = part_name(name) if name else datetime.now().strftime('run-%H%M%S')
+    return os.path.join(archive_dir, f'source={source}', f'scrape_date={scrape_date}', f'{name}.parquet')
+
+def to_archive_table(df):
+    """DataFrame as an all-text Arrow table with company/location columns dictionary-encoded"""
+    columns = [str(column) for column in df.columns]
+    text = df.astype(object).where(df.notna(), None)
+    data = {column: [None if value is None else str(value) for value in text[original]]
+            for column, original in zip(columns, df.columns)}
+    return pa.Table.from_pydict(data, schema=arrow_text_schema(columns))
+
+def write_jobs(df, source, scrape_date=None, name=None, archive_dir=ARCHIVE_DIR):
+    """Write a DataFrame into its source/date partition; the same name overwrites its earlier file"""
+    path = partition_path(source, scrape_date, name, archive_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with AtomicPath(path) as tmp_path:
+        pq.write_table(to_archive_table(df), tmp_path, compression='zstd')
+    return path
+
+def convert_csv(csv_path, source=None, scrape_date=None, archive_dir=ARCHIVE_DIR):
+    """Archive one CSV, dated by its modification time unless scrape_date is given"""
+    source = source or CSV_SOURCES.get(os.path.basename(csv_path))
+    if source is None:
+        raise ValueError(f"No source known for {csv_path}, pass one explicitly")
+    scrape_date = scrape_date or date.fromtimestamp(os.path.getmtime(csv_path)).isoformat()
+    df = pd.read_csv(csv_path, dtype=str, keep_default_na=False, na_values=[''])
+    path = write_jobs(df, source, scrape_date, name=csv_path, archive_dir=archive_dir)
+    print(f"Archived {len(df)} rows from {csv_path} to {path}")
+    return path
+
+def list_sources(archive_dir=ARCHIVE_DIR):
+    if not os.path.isdir(archive_dir):
+        return []
+    return sorted(entry[len('source='):] for entry in os.listdir(archive_dir) if entry.startswith('source='))
+
+def list_partitions(source, archive_dir=ARCHIVE_DIR):
+    source_dir = os.path.join(archive_dir, f'source={source}')
+    if not os.path.isdir(source_dir):
+        return []
+    return sorted(entry[len('scrape_date='):] for entry in os.listdir(source_dir) if entry.startswith('scrape_date='))
+
+def open_source(source, archive_dir=ARCHIVE_DIR):
+    """Dataset over one source; files written at different times may carry different columns
+
+    Raises FileNotFoundError when the source has no archived files yet.
+    """
+    source_dir = os.path.join(archive_dir, f'source={source}')
+    # Skip .parquet.part files that a running scraper is still writing
+    files = sorted(os.path.join(root, name) for root, _, names in os.walk(source_dir)
+                   for name in names if name.endswith('.parquet'))
+    if not files:
+        raise FileNotFoundError(f"No archive found for {source}")
+    schema = pa.unify_schemas([pq.read_schema(path) for path in files] + [DATE_PARTITIONING.schema])
+    return ds.dataset(files, schema=schema, format='parquet', partitioning=DATE_PARTITIONING,
+                      partition_base_dir=source_dir)
+
+def load_jobs(source=None, columns=None, since=None, until=None, archive_dir=ARCHIVE_DIR):
+    """Read archived jobs into a DataFrame.
+
+    source limits the read to one source partition (default: all), columns to
+    the listed columns (missing ones are skipped), and since/until
+    (YYYY-MM-DD, inclusive) to a range of scrape dates. Each row also gets
+    its source and scrape_date.
+    """
+    frames = []
+    for name in ([source] if source else list_sources(archive_dir)):
+        dates = [d for d in list_partitions(name, archive_dir)
+                 if (since is None or d >= since) and (until is None or d <= until)]
+        if not dates:
+            continue
+        dataset = open_source(name, archive_dir)
+        wanted = [column for column in columns if column in dataset.schema.names] if columns else None
+        if wanted is not None and 'scrape_date' not in wanted:
+            wanted.append('scrape_date')
+        table = dataset.to_table(columns=wanted, filter=ds.field('scrape_date').isin(dates))
+        frame = table.to_pandas()
+        frame['source'] = name
+        frames.append(frame)
+    if not frames:
+        return pd.DataFrame(columns=columns or [])
+    return pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description="Manage the Parquet job archive in Data/archive")
+    commands = arg_parser.add_subparsers(dest='command', required=True)
+    convert_parser = commands.add_parser('convert', help="archive CSVs (default: the known CSVs in Data/)")
+    convert_parser.add_argument('csv', nargs='*')
+    convert_parser.add_argument('--source', help="source partition for every CSV given")
+    convert_parser.add_argument('--date', help="scrape date partition (default: each file's modification date)")
+    commands.add_parser('list', help="show sources, partitions and row counts")
+    args = arg_parser.parse_args()
+
+    if args.command == 'convert':
+        csv_paths = args.csv or [os.path.join(Data_dir, name) for name in CSV_SOURCES
+                                 if os.path.exists(os.path.join(Data_dir, name))]
+        for csv_path in csv_paths:
+            convert_csv(csv_path, args.source, args.date)
+    else:
+        for name in list_sources():
+            try:
+                dataset = open_source(name)
+            except FileNotFoundError:
+                continue
+            print(f"{name}: {dataset.count_rows()} rows, {len(dataset.schema) - 1} columns, "
+                  f"dates {', '.join(list_partitions(name))}")
@@ -0,0 +1,203 @@
+"""
+Streaming exports of scraped jobs in CSV, JSONL, Parquet or XLSX, optionally gzipped.
+
+Rows are read in chunks - from a data CSV, or from a source partition of
+the Parquet archive (job_archive) - filtered with the dashboard's filters
+(job_preview.FILTER_COLUMNS) and encoded chunk by chunk into a generator of
+bytes, so an export is never materialized in memory whatever its size:
+
+    csv / jsonl  each chunk is encoded and yielded as it is read
+    parquet      a ParquetWriter writes one row group per chunk into a
+                 buffer that is drained after every chunk
+    xlsx         an openpyxl write-only workbook spools rows to a temporary
+                 file (XLSX is a zip, so it cannot be emitted incrementally),
+                 which is then streamed back and deleted
+    gzip         wraps any of these with an incremental zlib stream
+
+Parquet needs pyarrow and XLSX needs openpyxl; both are imported only when used.
+"""
+import importlib.util
+import io
+import os
+import tempfile
+import zlib
+
+import pandas as pd
+
+from job_preview import check_filters, filter_column, filter_mask
+
+EXPORT_CHUNK_ROWS = 50000
+# Bytes read per block when streaming a finished file back
+STREAM_BLOCK_BYTES = 256 * 1024
+
+EXPORT_FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'jsonl': ('application/x-ndjson', 'jsonl'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet'),
+    'xlsx': ('application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', 'xlsx'),
+}
+# Optional package each format needs
+EXPORT_DEPENDENCIES = {'parquet': 'pyarrow', 'xlsx': 'openpyxl'}
+
+
+def csv_columns(path):
+    return list(pd.read_csv(path, nrows=0).columns)
+
+def csv_chunks(path, chunksize=EXPORT_CHUNK_ROWS):
+    return pd.read_csv(path, dtype=object, keep_default_na=False, chunksize=chunksize)
+
+def archive_columns(source):
+    from job_archive import open_source
+
+    return open_source(source).schema.names
+
+def archive_chunks(source, chunksize=EXPORT_CHUNK_ROWS):
+    """Chunks of one archive source, read batch by batch from the Parquet files"""
+    from job_archive import open_source
+
+    for batch in open_source(source).to_batches(batch_size=chunksize):
+        yield batch.to_pandas().astype(object).fillna('')
+
+def check_export(available, fmt='csv', filters=None, columns=None):
+    """Validate an export against the source's columns before any bytes are sent
+
+    Errors raised once streaming has started can only truncate the response,
+    so they are raised here instead: ValueError for an unknown format,
+    ImportError when its package is missing, KeyError for unknown filters or
+    columns. Returns the non-empty filters.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"unknown format {fmt!r}, expected one of {', '.join(EXPORT_FORMATS)}")
+    if fmt in EXPORT_DEPENDENCIES and importlib.util.find_spec(EXPORT_DEPENDENCIES[fmt]) is None:
+        raise ImportError(f"{fmt} export needs {EXPORT_DEPENDENCIES[fmt]}: pip install {EXPORT_DEPENDENCIES[fmt]}")
+    filters = check_filters(filters)
+    for name in filters:
+        if filter_column(available, name) is None:
+            raise KeyError(f"this export has no {name} column")
+    missing = [column for column in columns or () if column not in available]
+    if missing:
+        raise KeyError(f"unknown column: {', '.join(missing)}")
+    return filters
+
+def filtered_chunks(chunks, filters=None, columns=None):
+    """Apply filters and the column selection to each chunk
+
+    Empty chunks are skipped, except the first, so that an export matching
+    nothing still carries its header.
+    """
+    filters = check_filters(filters)
+    first = True
+    for chunk in chunks:
+        if filters:
+            def lowered(name):
+                return chunk[filter_column(chunk.columns, name)].astype(str).str.lower()
+            chunk = chunk[filter_mask(lowered, filters)]
+        if columns:
+            chunk = chunk[columns]
+        if len(chunk) or first:
+            yield chunk
+        first = False
+
+
+class _DrainBuffer(io.RawIOBase):
+    """Write-only file that hands out what was written since the last drain"""
+
+    def __init__(self):
+        self.parts = []
+        self.position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.parts.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def drain(self):
+        data = b''.join(self.parts)
+        self.parts = []
+        return data
+
+
+def encode_csv(chunks):
+    header = True
+    for chunk in chunks:
+        yield chunk.to_csv(index=False, header=header).encode('utf-8')
+        header = False
+
+def encode_jsonl(chunks):
+    for chunk in chunks:
+        if len(chunk):
+            yield chunk.to_json(orient='records', lines=True, force_ascii=False).rstrip('\n').encode('utf-8') + b'\n'
+
+def encode_parquet(chunks):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    buffer = _DrainBuffer()
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk.astype(str), preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(buffer, table.schema, compression='zstd')
+            writer.write_table(table)
+            yield buffer.drain()
+    finally:
+        if writer is not None:
+            writer.close()
+    yield buffer.drain()
+
+def encode_xlsx(chunks):
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('jobs')
+    header = True
+    for chunk in chunks:
+        if header:
+            sheet.append(list(chunk.columns))
+            header = False
+        for row in chunk.itertuples(index=False, name=None):
+            sheet.append(row)
+
+    fd, tmp_path = tempfile.mkstemp(suffix='.xlsx')
+    os.close(fd)
+    try:
+        workbook.save(tmp_path)
+        with open(tmp_path, 'rb') as f:
+            while block := f.read(STREAM_BLOCK_BYTES):
+                yield block
+    finally:
+        os.remove(tmp_path)
+
+ENCODERS = {
+    'csv': encode_csv,
+    'jsonl': encode_jsonl,
+    'parquet': encode_parquet,
+    'xlsx': encode_xlsx,
+}
+
+
+def gzip_stream(blocks, level=6):
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits 31: gzip container
+    for block in blocks:
+        compressed = compressor.compress(block)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+def export_stream(chunks, fmt='csv', filters=None, columns=None, gzip=False):
+    """Bytes of the export, generated lazily from chunks (csv_chunks / archive_chunks); see check_export"""
+    blocks = ENCODERS[fmt](filtered_chunks(chunks, filters, columns))
+    return gzip_stream(blocks) if gzip else blocks
+
+def export_filename(name, fmt='csv', gzip=False):
+    return f"{name}.{EXPORT_FORMATS[fmt][1]}" + ('.gz' if gzip else '')
+
+def export_mimetype(fmt='csv', gzip=False):
+    return 'application/gzip' if gzip else EXPORT_FORMATS[fmt][0]
@@ -0,0 +1,239 @@
+"""
+Background scrape jobs for the web dashboard.
+
+Every /start_scraping request becomes a ScrapeJob with its own id, status,
+progress and cancel flag, run on a bounded thread pool: up to max_workers
+jobs run at once and the rest wait in the pool's queue. Status is read
+through ScrapeJob.snapshot(), which copies the fields under the job's lock,
+so request handlers never see a half-updated status.
+
+Jobs also keep a short numbered event log - status changes, one 'page'
+event per scraped results page (role, page, cards seen and qualified,
+running totals and throughput) and a final 'done' - that the dashboard
+follows over Server-Sent Events; events_after() blocks until there is
+something new, so streams wake on changes instead of polling.
+
+Cancelling a queued job drops it from the queue; a running job is asked to
+stop through its stop_event and finishes at its next check (between pages,
+cards or platforms). The pool's threads are not daemons, and shutdown()
+cancels whatever is still running so the process exits cleanly.
+"""
+import itertools
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+# Scrape jobs running at the same time; further jobs queue
+MAX_CONCURRENT_JOBS = 2
+# Finished jobs kept for status lookups before the oldest are forgotten
+MAX_FINISHED_JOBS = 50
+# Events kept per job for streams that connect late or reconnect
+MAX_JOB_EVENTS = 500
+
+QUEUED = 'queued'
+RUNNING = 'running'
+COMPLETED = 'completed'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+FINISHED_STATES = (COMPLETED, FAILED, CANCELLED)
+
+
+class JobCancelled(Exception):
+    """Raised inside a job's work when it was asked to stop"""
+
+
+class ScrapeJob:
+    def __init__(self, params):
+        self.id = uuid.uuid4().hex[:12]
+        self.params = params
+        self.lock = threading.Lock()
+        self.changed = threading.Condition(self.lock)
+        self.events = deque(maxlen=MAX_JOB_EVENTS)
+        self.event_seq = 0
+        self.stop_event = threading.Event()
+        self.future = None
+        self.state = QUEUED
+        self.current_platform = None
+        self.progress = 0
+        self.message = "Queued"
+        self.results = None
+        self.error = None
+        self.created_at = datetime.now().isoformat(timespec='seconds')
+        self.started_at = None
+        self.finished_at = None
+        self.started = None  # perf_counter at start, for throughput
+        self.pages = 0
+        self.cards = 0
+        self.qualified = 0
+
+    @property
+    def cancelled(self):
+        return self.stop_event.is_set()
+
+    def check_cancelled(self):
+        if self.stop_event.is_set():
+            raise JobCancelled(f"Job {self.id} was cancelled")
+
+    def update(self, platform=None, progress=None, message=None):
+        """Report progress from the worker; raises JobCancelled once a stop was requested"""
+        with self.lock:
+            if platform is not None:
+                self.current_platform = platform
+            if progress is not None:
+                self.progress = round(progress)
+            if message is not None:
+                self.message = message
+            self._publish('status', self._status())
+        self.check_cancelled()
+
+    def page_done(self, platform, role, page, cards, qualified):
+        """Record one scraped results page and publish a 'page' event; never raises"""
+        with self.lock:
+            self.pages += 1
+            self.cards += cards
+            self.qualified += qualified
+            elapsed = time.perf_counter() - self.started if self.started else 0
+            self._publish('page', {
+                'platform': platform,
+                'role': role,
+                'page': page,
+                'cards': cards,
+                'qualified': qualified,
+                'total_pages': self.pages,
+                'total_cards': self.cards,
+                'total_qualified': self.qualified,
+                'cards_per_minute': round(self.cards * 60 / elapsed, 1) if elapsed else None,
+                'pages_per_minute': round(self.pages * 60 / elapsed, 2) if elapsed else None,
+            })
+
+    def events_after(self, seq, timeout=None):
+        """Events numbered after seq, waiting up to timeout for one; also whether the job is finished"""
+        with self.changed:
+            if self.event_seq <= seq and self.state not in FINISHED_STATES:
+                self.changed.wait(timeout)
+            return [event for event in self.events if event[0] > seq], self.state in FINISHED_STATES
+
+    def _publish(self, kind, data):
+        # Caller holds self.lock
+        self.event_seq += 1
+        self.events.append((self.event_seq, kind, data))
+        self.changed.notify_all()
+
+    def _status(self):
+        return {'state': self.state, 'current_platform': self.current_platform,
+                'progress': self.progress, 'message': self.message}
+
+    def snapshot(self):
+        with self.lock:
+            return self._snapshot()
+
+    def _snapshot(self):
+        return {
+            'job_id': self.id,
+            'state': self.state,
+            'is_running': self.state in (QUEUED, RUNNING),
+            'current_platform': self.current_platform,
+            'progress': self.progress,
+            'message': self.message,
+            'results': self.results,
+            'error': self.error,
+            'pages': self.pages,
+            'cards': self.cards,
+            'qualified': self.qualified,
+            'params': self.params,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+        }
+
+    def _set(self, **fields):
+        with self.lock:
+            for name, value in fields.items():
+                setattr(self, name, value)
+            self._publish('status', self._status())
+
+    def _finish(self, state, message, **fields):
+        with self.lock:
+            for name, value in fields.items():
+                setattr(self, name, value)
+            self.state = state
+            self.message = message
+            self.finished_at = datetime.now().isoformat(timespec='seconds')
+            self._publish('done', self._snapshot())
+
+
+class JobManager:
+    def __init__(self, max_workers=MAX_CONCURRENT_JOBS, max_finished=MAX_FINISHED_JOBS):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='scrape-job')
+        self.max_finished = max_finished
+        self.lock = threading.Lock()
+        self.jobs = {}  # job id -> ScrapeJob, in submission order
+
+    def submit(self, work, params):
+        """Queue work(job) as a new job and return it; work reports through job.update"""
+        job = ScrapeJob(params)
+        with self.lock:
+            self.jobs[job.id] = job
+            self._forget_finished()
+        job.future = self.executor.submit(self._run, job, work)
+        return job
+
+    def _run(self, job, work):
+        if job.cancelled:
+            job._finish(CANCELLED, "Cancelled before it started")
+            return
+        job._set(state=RUNNING, message="Starting...", started_at=datetime.now().isoformat(timespec='seconds'),
+                 started=time.perf_counter())
+        try:
+            results = work(job)
+        except JobCancelled:
+            job._finish(CANCELLED, "Cancelled")
+        except Exception as e:
+            print(f"Scrape job {job.id} failed: {e}")
+            job._finish(FAILED, f"Failed: {e}", error=str(e))
+        else:
+            if job.cancelled:
+                job._finish(CANCELLED, "Cancelled", results=results)
+            else:
+                job._finish(COMPLETED, "Scraping completed", progress=100, results=results)
+
+    def get(self, job_id):
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def latest(self):
+        with self.lock:
+            return next(reversed(self.jobs.values()), None)
+
+    def list(self):
+        with self.lock:
+            jobs = list(self.jobs.values())
+        return [job.snapshot() for job in jobs]
+
+    def cancel(self, job_id):
+        """Ask a job to stop; returns the job, or None for an unknown id"""
+        job = self.get(job_id)
+        if job is None:
+            return None
+        job.stop_event.set()
+        if job.future is not None and job.future.cancel():
+            job._finish(CANCELLED, "Cancelled before it started")
+        elif job.state == RUNNING:
+            job._set(message="Cancelling...")
+        return job
+
+    def _forget_finished(self):
+        finished = [job_id for job_id, job in self.jobs.items() if job.state in FINISHED_STATES]
+        for job_id in itertools.islice(finished, max(0, len(finished) - self.max_finished)):
+            del self.jobs[job_id]
+
+    def shutdown(self, wait=True):
+        with self.lock:
+            jobs = list(self.jobs.values())
+        for job in jobs:
+            if job.state not in FINISHED_STATES:
+                self.cancel(job.id)
+        self.executor.shutdown(wait=wait, cancel_futures=True)
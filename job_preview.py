@@ -0,0 +1,146 @@
+"""
+Cached, paginated queries over the scraped job CSVs for the dashboard.
+
+Each file is parsed once (all columns as text) and kept in memory until
+its mtime or size changes; os.replace-based writers (job_sink) swap the
+file atomically, so a changed stat always means a complete new file.
+Filters are case-insensitive substring matches on a logical column -
+company, title, date, experience, location - resolved against the
+LinkedIn or Shine column names. The matching row positions of recent
+filter combinations are memoized, so paging through a result only slices.
+
+    cache = JobFileCache()
+    cache.query(path, page=2, page_size=50, columns=['job_title'], filters={'company': 'andela'})
+"""
+import math
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_PAGE_SIZE = 25
+MAX_PAGE_SIZE = 500
+# Filter combinations per file whose matching rows are memoized
+MAX_CACHED_QUERIES = 64
+
+# Logical filter name -> column names used by the exports, first match wins
+FILTER_COLUMNS = {
+    'company': ('company_name', 'companyName'),
+    'title': ('job_title', 'title'),
+    'date': ('date_posted', 'postedTime', 'scrape_date'),
+    'experience': ('experience', 'experienceLevel'),
+    'location': ('location',),
+}
+
+
+def filter_column(columns, name):
+    """The column a logical filter applies to in a file with these columns, or None"""
+    return next((column for column in FILTER_COLUMNS.get(name, ()) if column in columns), None)
+
+def check_filters(filters):
+    """Drop empty filters; KeyError for names not in FILTER_COLUMNS"""
+    filters = {name: value for name, value in (filters or {}).items() if value}
+    unknown = set(filters) - set(FILTER_COLUMNS)
+    if unknown:
+        raise KeyError(f"unknown filter: {', '.join(sorted(unknown))}")
+    return filters
+
+def filter_mask(lowered_column, filters):
+    """Boolean row mask for filters; lowered_column(name) returns that filter's lowercased column"""
+    mask = None
+    for name, value in filters.items():
+        matches = lowered_column(name).str.contains(value.lower(), regex=False).to_numpy()
+        mask = matches if mask is None else mask & matches
+    return mask
+
+
+class CachedJobFile:
+    def __init__(self, path, stat):
+        self.path = path
+        self.stat_key = (stat.st_mtime_ns, stat.st_size)
+        # Object columns: taking a page of scattered rows from Arrow-backed strings costs O(file)
+        self.df = pd.read_csv(path, dtype=object, keep_default_na=False)
+        self.lowered = {}
+        self.queries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def _lowered(self, name):
+        column = filter_column(self.df.columns, name)
+        if column is None:
+            raise KeyError(f"this file has no {name} column")
+        if column not in self.lowered:
+            self.lowered[column] = self.df[column].astype(str).str.lower()
+        return self.lowered[column]
+
+    def matching_rows(self, filters):
+        """Row positions matching every filter, memoized per filter combination"""
+        key = tuple(sorted(filters.items()))
+        with self.lock:
+            if key in self.queries:
+                self.queries.move_to_end(key)
+                return self.queries[key]
+            mask = filter_mask(self._lowered, dict(key))
+            rows = np.arange(len(self.df)) if mask is None else np.flatnonzero(mask)
+            self.queries[key] = rows
+            if len(self.queries) > MAX_CACHED_QUERIES:
+                self.queries.popitem(last=False)
+            return rows
+
+
+class JobFileCache:
+    def __init__(self):
+        self.files = {}
+        # One lock per path serializes re-reads of that file; self.lock only guards the dicts
+        self.path_locks = {}
+        self.lock = threading.Lock()
+
+    def _fresh(self, path):
+        """The cached entry for path if the file hasn't changed since it was parsed"""
+        stat = os.stat(path)
+        with self.lock:
+            cached = self.files.get(path)
+        if cached is not None and cached.stat_key == (stat.st_mtime_ns, stat.st_size):
+            return cached
+        return None
+
+    def get(self, path):
+        """The parsed file, re-read only when its mtime or size changed"""
+        cached = self._fresh(path)
+        if cached is not None:
+            return cached
+        with self.lock:
+            path_lock = self.path_locks.setdefault(path, threading.Lock())
+        with path_lock:
+            # Another request may have re-read it while this one waited
+            cached = self._fresh(path)
+            if cached is None:
+                cached = CachedJobFile(path, os.stat(path))
+                with self.lock:
+                    self.files[path] = cached
+            return cached
+
+    def query(self, path, page=1, page_size=DEFAULT_PAGE_SIZE, columns=None, filters=None):
+        """One page of rows (as dicts) matching filters, restricted to columns"""
+        cached = self.get(path)
+        filters = check_filters(filters)
+        columns = columns or list(cached.df.columns)
+        missing = [column for column in columns if column not in cached.df]
+        if missing:
+            raise KeyError(f"unknown column: {', '.join(missing)}")
+
+        rows = cached.matching_rows(filters)
+        page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+        pages = max(1, math.ceil(len(rows) / page_size))
+        page = max(1, min(page, pages))
+        positions = rows[(page - 1) * page_size:page * page_size]
+        return {
+            'total_rows': len(cached.df),
+            'total_matches': len(rows),
+            'page': page,
+            'page_size': page_size,
+            'pages': pages,
+            'columns': columns,
+            'rows': cached.df.iloc[positions][columns].to_dict('records'),
+        }
@@ -0,0 +1,230 @@
+"""
+Streaming, append-only sinks for scraped jobs.
+
+Rows are buffered and written in batches - every flush_rows rows or once
+flush_seconds have passed since the last write, whichever comes first -
+instead of one write and flush per row. Output goes to `<path>.part` and is
+atomically renamed over `<path>` on close(), so readers never see a
+half-written file. close(commit=False) - or leaving a `with` block on an
+exception - discards the partial file and leaves the previous output in place.
+
+Backends are picked by file extension: .csv, .jsonl, .sqlite3/.db and, when
+pyarrow is installed, .parquet (one row group per batch). AtomicPath gives
+the same write-aside-then-rename to other writers (archive files, merged
+leads, dedup output, the company index, checkpoints).
+"""
+import csv
+import json
+import os
+import sqlite3
+import threading
+import time
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+
+class AtomicPath:
+    """A file written next to path (path + suffix) and moved over path only once complete
+
+        with AtomicPath(path) as tmp_path:
+            write(tmp_path)
+
+    The block replaces path when it finishes and removes the partial file if it
+    raises, leaving the previous file in place. commit() and discard() do the
+    same for writers that outlive a block.
+    """
+
+    def __init__(self, path, suffix='.part'):
+        self.path = path
+        self.part_path = path + suffix
+
+    def commit(self):
+        os.replace(self.part_path, self.path)
+
+    def discard(self):
+        if os.path.exists(self.part_path):
+            os.remove(self.part_path)
+
+    def __enter__(self):
+        return self.part_path
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+
+
+class JobSink:
+    """Base sink: subclasses implement _open, _write_rows and _close"""
+
+    def __init__(self, path, fieldnames, flush_rows=200, flush_seconds=5.0):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.target = AtomicPath(path)
+        self.part_path = self.target.part_path
+        self.fieldnames = list(fieldnames)
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self.lock = threading.Lock()
+        self.buffer = []
+        self.rows_written = 0
+        self.batches = 0
+        self.last_flush = time.monotonic()
+        self.closed = False
+        self._open()
+
+    @property
+    def count(self):
+        """Rows accepted so far, flushed or still buffered"""
+        return self.rows_written + len(self.buffer)
+
+    def write(self, job):
+        self.write_many([job])
+
+    def write_many(self, jobs):
+        with self.lock:
+            self.buffer.extend(jobs)
+            if len(self.buffer) >= self.flush_rows or time.monotonic() - self.last_flush >= self.flush_seconds:
+                self._flush()
+
+    def _flush(self):
+        if self.buffer:
+            rows = [{field: job.get(field, '') for field in self.fieldnames} for job in self.buffer]
+            self._write_rows(rows)
+            self.rows_written += len(rows)
+            self.batches += 1
+            self.buffer = []
+        self.last_flush = time.monotonic()
+
+    def flush(self):
+        with self.lock:
+            self._flush()
+
+    def close(self, commit=True):
+        """Flush, then move the finished file into place. An empty run, or commit=False, keeps the
+        previous output."""
+        with self.lock:
+            if self.closed:
+                return
+            self._flush()
+            self._close()
+            self.closed = True
+        if not commit:
+            self.target.discard()
+            print(f"Discarded {self.rows_written} unsaved jobs, {self.path} left as it was")
+        elif self.rows_written:
+            self.target.commit()
+            print(f"Successfully saved {self.rows_written} jobs to {self.path} ({self.batches} batched writes)")
+        else:
+            self.target.discard()
+            print(f"No jobs to save for {self.path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(commit=exc_type is None)
+
+
+class CsvJobSink(JobSink):
+    def _open(self):
+        self.file = open(self.part_path, 'w', newline='', encoding='utf-8')
+        self.writer = csv.DictWriter(self.file, fieldnames=self.fieldnames)
+        self.writer.writeheader()
+
+    def _write_rows(self, rows):
+        self.writer.writerows(rows)
+        self.file.flush()
+
+    def _close(self):
+        os.fsync(self.file.fileno())
+        self.file.close()
+
+
+class JsonlJobSink(JobSink):
+    def _open(self):
+        self.file = open(self.part_path, 'w', encoding='utf-8')
+
+    def _write_rows(self, rows):
+        self.file.write(''.join(json.dumps(row, ensure_ascii=False) + '\n' for row in rows))
+        self.file.flush()
+
+    def _close(self):
+        os.fsync(self.file.fileno())
+        self.file.close()
+
+
+class SqliteJobSink(JobSink):
+    def _open(self):
+        if os.path.exists(self.part_path):
+            os.remove(self.part_path)
+        self.conn = sqlite3.connect(self.part_path, check_same_thread=False)
+        columns = [f'"{field}"' for field in self.fieldnames]
+        self.conn.execute(f"CREATE TABLE jobs ({', '.join(column + ' TEXT' for column in columns)})")
+        self.insert_sql = (f"INSERT INTO jobs ({', '.join(columns)}) "
+                           f"VALUES ({', '.join('?' for _ in columns)})")
+
+    def _write_rows(self, rows):
+        self.conn.executemany(self.insert_sql, [tuple(row.values()) for row in rows])
+        self.conn.commit()
+
+    def _close(self):
+        self.conn.close()
+
+
+# Low-cardinality text columns stored as Arrow dictionaries (read back as pandas categoricals)
+DICTIONARY_COLUMNS = {
+    'company', 'company_name', 'companyname', 'company_name_for_emails',
+    'location', 'city', 'state', 'country', 'company_city', 'company_state', 'company_country',
+}
+
+def is_dictionary_column(name):
+    return name.strip().lower().replace(' ', '_') in DICTIONARY_COLUMNS
+
+def arrow_text_schema(fieldnames):
+    """Every column as text, company/location columns dictionary-encoded"""
+    return pa.schema([
+        (field, pa.dictionary(pa.int32(), pa.string()) if is_dictionary_column(field) else pa.string())
+        for field in fieldnames
+    ])
+
+
+class ParquetJobSink(JobSink):
+    def _open(self):
+        if pq is None:
+            raise ImportError("pyarrow is required for .parquet output (pip install pyarrow)")
+        self.schema = arrow_text_schema(self.fieldnames)
+        self.writer = pq.ParquetWriter(self.part_path, self.schema, compression='zstd')
+
+    def _write_rows(self, rows):
+        columns = {field: [None if row[field] in ('', None) else str(row[field]) for row in rows]
+                   for field in self.fieldnames}
+        self.writer.write_table(pa.Table.from_pydict(columns, schema=self.schema))
+
+    def _close(self):
+        self.writer.close()
+
+
+SINK_BACKENDS = {
+    '.csv': CsvJobSink,
+    '.jsonl': JsonlJobSink,
+    '.sqlite3': SqliteJobSink,
+    '.db': SqliteJobSink,
+    '.parquet': ParquetJobSink,
+}
+
+# --output choices and the extension each one writes
+SINK_FORMATS = {'csv': '.csv', 'jsonl': '.jsonl', 'sqlite': '.sqlite3', 'parquet': '.parquet'}
+
+
+def open_job_sink(path, fieldnames, flush_rows=200, flush_seconds=5.0):
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in SINK_BACKENDS:
+        raise ValueError(f"No job sink for {extension!r} files (expected one of {', '.join(sorted(SINK_BACKENDS))})")
+    return SINK_BACKENDS[extension](path, fieldnames, flush_rows, flush_seconds)
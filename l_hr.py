@@ -1,6 +1,10 @@
+import os
 import pandas as pd
-import re
 from pathlib import Path
+from company_index import CompanyIndex
+from company_names import company_key_column
+from lead_join import (LINKEDIN_JOB_COLUMN_MAP, counted_matches, join_jobs_to_leads, match_counts,
+                       stream_jobs_to_leads)
 
 # ----------------------------------------------------------------------
 # 1. FILE PATHS (YOUR PATHS)
@@ -11,102 +15,42 @@ target_path = r"C:\Sathvik-py\Talrn\job_scraper\Data\other half.csv"       # For
 out_dir     = r"C:\Sathvik-py\Talrn\job_scraper\Data"                       # Output folder
 output_file = "l_hr.csv"                                                   # Output filename
 
+# Leads exports larger than this are merged chunk by chunk instead of loaded whole
+STREAM_LEADS_ABOVE_BYTES = 256 * 2**20
 
-def normalise_company(name: str) -> str:
-    if not isinstance(name, str):
-        return ""
-    name = name.lower().strip()
+stream_leads = os.path.getsize(leads_path) > STREAM_LEADS_ABOVE_BYTES
 
-    name = re.sub(r'\b(inc\.?|incorporated|ltd\.?|llc|corp\.?|corporation|private|pvt\.?|llp|group|services|technologies|consulting|consultancy|solutions|labs|systems)\b', '', name)
-
-    name = re.sub(r'[^a-z0-9\s]', ' ', name)
-    name = re.sub(r'\s+', ' ', name).strip()
-    return name
-
-leads_df = pd.read_csv(leads_path)
 jobs_df  = pd.read_csv(jobs_path)
-target_df = pd.read_csv(target_path)
-leads_df['norm_company'] = leads_df['company_name'].apply(normalise_company)
-jobs_df['norm_company']  = jobs_df['company_name'].apply(normalise_company)
-
-jobs_df = jobs_df[jobs_df['norm_company'] != 'turing']
-
-hr_lookup = {}
-for _, row in leads_df.iterrows():
-    key = row['norm_company']
-    if key not in hr_lookup:
-        hr_lookup[key] = []
-    hr_lookup[key].append(row.to_dict())
-
-target_columns = target_df.columns.tolist()
-
-output_rows = []
-
-for _, job in jobs_df.iterrows():
-    job_norm = job['norm_company']
-    company_linkedin = job.get('companyUrl', '')
-
-    if job_norm not in hr_lookup:
-        continue 
-
-    for hr in hr_lookup[job_norm]:
-        row = {col: '' for col in target_columns}
-        row['job title']       = job.get('job_title', '')
-        row['company name']    = job.get('company_name', '')
-        row['job link']        = job.get('jobUrl', '')
-        row['experience']      = job.get('experienceLevel', '')
-        row['salary']          = job.get('salary', '')
-        row['date posted']     = job.get('postedTime', '')
-        row['company_norm']    = job.get('company_name', '')
-        row['Company Name']    = job.get('company_name', '')
-        row['Company Name for Emails'] = job.get('company_name', '')
-
-        row['First Name']      = hr.get('first_name', '')
-        row['Last Name']       = hr.get('last_name', '')
-        row['Title']           = hr.get('job_title', '')
-        row['Email']           = hr.get('email', '')
-        row['Email Status']    = 'Verified' if pd.notna(hr.get('email')) and hr.get('email') else ''
-        row['Seniority']       = hr.get('seniority_level', '')
-        row['# Employees']     = hr.get('company_size', '')
-        row['Industry']        = hr.get('industry', '')
-        row['Keywords']        = hr.get('keywords', '')
-        row['Website']         = hr.get('company_website', '')
-        row['Company Linkedin Url'] = company_linkedin  
-        row['City']            = hr.get('city', '')
-        row['State']           = hr.get('state', '')
-        row['Country']         = hr.get('country', '')
-        row['Company Address'] = hr.get('company_full_address', '')
-        row['Company City']    = hr.get('company_city', '')
-        row['Company State']   = hr.get('company_state', '')
-        row['Company Country'] = hr.get('company_country', '')
-        row['Company Phone']   = hr.get('company_phone', '')
-        row['Mobile Phone']    = hr.get('company_phone', '')
-        row['Technologies']    = hr.get('company_technologies', '')
-        row['Annual Revenue']  = hr.get('company_annual_revenue', '')
-        row['Total Funding']   = hr.get('company_total_funding', '')
-        row['Secondary Email'] = hr.get('personal_email', '')
+target_columns = pd.read_csv(target_path, nrows=0).columns.tolist()
+jobs_df['company_key']  = company_key_column(jobs_df)
 
-        row['Stage'] = 'Cold'
+# Fold near-miss spellings ("InsightGlobal", typos) onto the leads' company keys
+company_index = CompanyIndex.load_or_build(leads_path)
+jobs_df['company_key'] = company_index.resolve_keys(jobs_df['company_key']).to_numpy()
 
-        output_rows.append(row)
-
-
-matched_companies = set(jobs_df[jobs_df['norm_company'].isin(hr_lookup.keys())]['company_name'])
-print("\nMATCHED COMPANIES:")
-for c in sorted(matched_companies):
-    job_count = len(jobs_df[jobs_df['norm_company'] == normalise_company(c)])
-    hr_count = len(hr_lookup.get(normalise_company(c), []))
-    print(f"   • {c} → {job_count} job(s) × {hr_count} HR = {job_count * hr_count} row(s)")
-
-
-final_df = pd.DataFrame(output_rows, columns=target_columns)
+jobs_df = jobs_df[jobs_df['company_key'] != 'turing']
 
 # Ensure output directory exists
 Path(out_dir).mkdir(parents=True, exist_ok=True)
 output_path = Path(out_dir) / output_file
 
-final_df.to_csv(output_path, index=False)
+if stream_leads:
+    print(f"Streaming {os.path.getsize(leads_path) / 2**20:,.0f} MiB of leads in chunks")
+    rows, lead_counts = stream_jobs_to_leads(jobs_df, leads_path, str(output_path),
+                                             LINKEDIN_JOB_COLUMN_MAP, target_columns)
+    matches = counted_matches(jobs_df, lead_counts)
+else:
+    leads_df = pd.read_csv(leads_path)
+    leads_df['company_key'] = company_key_column(leads_df)
+    final_df = join_jobs_to_leads(jobs_df, leads_df, LINKEDIN_JOB_COLUMN_MAP, target_columns)
+    final_df.to_csv(output_path, index=False)
+    rows = len(final_df)
+    matches = match_counts(jobs_df, leads_df)
+
+print("\nMATCHED COMPANIES:")
+for c, job_count, hr_count in matches:
+    print(f"   • {c} → {job_count} job(s) × {hr_count} HR = {job_count * hr_count} row(s)")
 
 print(f"SUCCESS!")
-print(f"   {len(final_df):,} rows merged")
-print(f"   Saved to: {output_path}")
\ No newline at end of file
+print(f"   {rows:,} rows merged")
+print(f"   Saved to: {output_path}")
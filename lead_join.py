@@ -0,0 +1,180 @@
+"""
+Join scraped jobs with HR leads on a normalized company name.
+
+Replaces the per-job iterrows loops in hr.py and l_hr.py: both sides are
+keyed by company_names.canonical_company (the company_key stored by the
+scrapers, or computed per distinct name with vectorized string ops), joined
+with a single hash merge, and the output columns are filled from a
+declarative column map instead of building a dict per row. Blank keys
+(missing or placeholder company names) never match.
+
+A column map sends each output column to its source:
+    (JOB, 'job_title')     - a column of the jobs frame
+    (LEAD, 'email')        - a column of the leads frame
+    (VERIFIED, 'email')    - 'Verified' when that lead column is non-empty
+    (CONST, 'Cold')        - the same value on every row
+Output columns not in the map are left empty, as are missing source columns.
+
+stream_jobs_to_leads does the same join against a leads CSV too large for
+memory: the jobs stay in memory, the leads are read in chunks (only the
+columns the map needs), each chunk is reduced to the leads whose company has
+jobs, joined, and appended to the output file, so peak memory is one chunk
+plus the jobs whatever the size of the leads export.
+"""
+import numpy as np
+import pandas as pd
+
+from company_names import COMPANY_KEY_COLUMN, company_key_column
+from job_sink import AtomicPath
+
+# Leads rows per chunk in the streaming join and other chunked reads of leads exports
+LEADS_CHUNK_ROWS = 100000
+
+JOB = 'job'
+LEAD = 'lead'
+VERIFIED = 'verified'
+CONST = 'const'
+
+# Column order of the merged jobs + leads export (Apollo import layout)
+TARGET_COLUMNS = [
+    'job title', 'company name', 'job link', 'experience', 'salary', 'date posted', 'company_norm',
+    'First Name', 'Last Name', 'Title', 'Company Name', 'Company Name for Emails', 'Email', 'Email Status',
+    'Primary Email Source', 'Primary Email Verification Source', 'Email Confidence', 'Primary Email Catch-all Status',
+    'Primary Email Last Verified At', 'Seniority', 'Departments', 'Contact Owner', 'Work Direct Phone',
+    'Home Phone', 'Mobile Phone', 'Corporate Phone', 'Other Phone', 'Stage', 'Lists', 'Last Contacted',
+    'Account Owner', '# Employees', 'Industry', 'Keywords', 'Person Linkedin Url', 'Website',
+    'Company Linkedin Url', 'Facebook Url', 'Twitter Url', 'City', 'State', 'Country', 'Company Address',
+    'Company City', 'Company State', 'Company Country', 'Company Phone', 'Technologies', 'Annual Revenue',
+    'Total Funding', 'Latest Funding', 'Latest Funding Amount', 'Last Raised At', 'Subsidiary of',
+    'Email Sent', 'Email Open', 'Email Bounced', 'Replied', 'Demoed', 'Number of Retail Locations',
+    'Apollo Contact Id', 'Apollo Account Id', 'Secondary Email', 'Secondary Email Source',
+    'Secondary Email Status', 'Secondary Email Verification Source', 'Tertiary Email', 'Tertiary Email Source',
+    'Tertiary Email Status', 'Tertiary Email Verification Source', 'Unnamed: 63', 'Unnamed: 64'
+]
+
+# Lead-side columns shared by both job exports
+LEAD_COLUMN_MAP = {
+    'First Name': (LEAD, 'first_name'),
+    'Last Name': (LEAD, 'last_name'),
+    'Title': (LEAD, 'job_title'),
+    'Email': (LEAD, 'email'),
+    'Email Status': (VERIFIED, 'email'),
+    'Seniority': (LEAD, 'seniority_level'),
+    '# Employees': (LEAD, 'company_size'),
+    'Industry': (LEAD, 'industry'),
+    'Keywords': (LEAD, 'keywords'),
+    'Website': (LEAD, 'company_website'),
+    'City': (LEAD, 'city'),
+    'State': (LEAD, 'state'),
+    'Country': (LEAD, 'country'),
+    'Company Address': (LEAD, 'company_full_address'),
+    'Company City': (LEAD, 'company_city'),
+    'Company State': (LEAD, 'company_state'),
+    'Company Country': (LEAD, 'company_country'),
+    'Company Phone': (LEAD, 'company_phone'),
+    'Mobile Phone': (LEAD, 'company_phone'),
+    'Technologies': (LEAD, 'company_technologies'),
+    'Annual Revenue': (LEAD, 'company_annual_revenue'),
+    'Total Funding': (LEAD, 'company_total_funding'),
+    'Secondary Email': (LEAD, 'personal_email'),
+    'Stage': (CONST, 'Cold'),
+}
+
+# Jobs in main.py's export layout (job_link, experience, date_posted) - used by hr.py
+SHINE_JOB_COLUMN_MAP = {
+    'job title': (JOB, 'job_title'),
+    'company name': (JOB, 'company_name'),
+    'job link': (JOB, 'job_link'),
+    'experience': (JOB, 'experience'),
+    'salary': (JOB, 'salary'),
+    'date posted': (JOB, 'date_posted'),
+    'company_norm': (JOB, 'company_name'),
+    'Company Name': (JOB, 'company_name'),
+    'Company Name for Emails': (JOB, 'company_name'),
+    **LEAD_COLUMN_MAP,
+    'Company Linkedin Url': (LEAD, 'company_linkedin'),
+}
+
+# Jobs in the LinkedIn export layout (jobUrl, experienceLevel, postedTime) - used by l_hr.py
+LINKEDIN_JOB_COLUMN_MAP = {
+    **SHINE_JOB_COLUMN_MAP,
+    'job link': (JOB, 'jobUrl'),
+    'experience': (JOB, 'experienceLevel'),
+    'date posted': (JOB, 'postedTime'),
+    'Company Linkedin Url': (JOB, 'companyUrl'),
+}
+
+
+def join_jobs_to_leads(jobs_df, leads_df, column_map, target_columns=TARGET_COLUMNS,
+                       job_key=COMPANY_KEY_COLUMN, lead_key=COMPANY_KEY_COLUMN):
+    """One output row per (job, lead) pair sharing a company key, in job order.
+
+    Both frames must already carry their key column (see company_names.company_key_column).
+    """
+    job_columns = sorted({source for kind, source in column_map.values() if kind == JOB and source in jobs_df})
+    lead_columns = sorted({source for kind, source in column_map.values()
+                           if kind in (LEAD, VERIFIED) and source in leads_df})
+
+    jobs = jobs_df[job_columns].set_axis([f'job:{c}' for c in job_columns], axis=1)
+    jobs['_key'] = jobs_df[job_key].to_numpy()
+    leads = leads_df[lead_columns].set_axis([f'lead:{c}' for c in lead_columns], axis=1)
+    leads['_key'] = leads_df[lead_key].to_numpy()
+    leads = leads[leads['_key'].ne('')]
+    merged = jobs.merge(leads, on='_key', how='inner', sort=False)
+
+    output = {}
+    for column in target_columns:
+        kind, source = column_map.get(column, (CONST, ''))
+        if kind == CONST:
+            output[column] = source
+        elif kind == VERIFIED:
+            values = merged.get(f'lead:{source}')
+            if values is None:
+                output[column] = ''
+            else:
+                filled = values.notna() & values.astype(str).ne('')
+                output[column] = np.where(filled, 'Verified', '')
+        else:
+            output[column] = merged.get(f'{kind}:{source}', '')
+    return pd.DataFrame(output, index=merged.index, columns=target_columns)
+
+def stream_jobs_to_leads(jobs_df, leads_path, output_path, column_map, target_columns=TARGET_COLUMNS,
+                         company_column='company_name', job_key=COMPANY_KEY_COLUMN, chunksize=LEADS_CHUNK_ROWS):
+    """join_jobs_to_leads against a leads CSV read in chunks, appending each chunk's rows to output_path.
+
+    Rows come out grouped by leads chunk (job order within a chunk) instead of strictly in
+    job order. The output is written to a .part file and moved into place when complete.
+    Returns (rows written, lead count per matched company key) - the counts feed match_counts.
+    """
+    header = pd.read_csv(leads_path, nrows=0).columns
+    wanted = {source for kind, source in column_map.values() if kind in (LEAD, VERIFIED)}
+    wanted |= {company_column, COMPANY_KEY_COLUMN}
+    usecols = [column for column in header if column in wanted]
+    job_keys = pd.Index(jobs_df[job_key].unique())
+
+    rows = 0
+    lead_counts = pd.Series(0, index=job_keys, dtype='int64')
+    with AtomicPath(output_path) as tmp_path, open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+        pd.DataFrame(columns=target_columns).to_csv(f, index=False)
+        for chunk in pd.read_csv(leads_path, usecols=usecols, chunksize=chunksize):
+            chunk[COMPANY_KEY_COLUMN] = company_key_column(chunk, company_column).to_numpy()
+            chunk = chunk[chunk[COMPANY_KEY_COLUMN].isin(job_keys)]
+            if chunk.empty:
+                continue
+            lead_counts = lead_counts.add(chunk[COMPANY_KEY_COLUMN].value_counts(), fill_value=0)
+            output = join_jobs_to_leads(jobs_df, chunk, column_map, target_columns, job_key=job_key)
+            output.to_csv(f, index=False, header=False)
+            rows += len(output)
+    return rows, lead_counts[lead_counts.gt(0) & lead_counts.index.to_series().ne('')].astype('int64')
+
+def match_counts(jobs_df, leads_df, company_column='company_name', key=COMPANY_KEY_COLUMN):
+    """(company, job count, lead count) for every job company that has leads, sorted by name"""
+    lead_counts = leads_df.loc[leads_df[key].ne(''), key].value_counts()
+    return counted_matches(jobs_df, lead_counts, company_column, key)
+
+def counted_matches(jobs_df, lead_counts, company_column='company_name', key=COMPANY_KEY_COLUMN):
+    """match_counts from precomputed lead counts per company key (see stream_jobs_to_leads)"""
+    job_counts = jobs_df[key].value_counts()
+    matched = jobs_df.loc[jobs_df[key].isin(lead_counts.index), [company_column, key]]
+    matched = matched.drop_duplicates(company_column).sort_values(company_column)
+    return [(company, job_counts[norm], lead_counts[norm]) for company, norm in matched.itertuples(index=False)]
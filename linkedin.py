@@ -1,4 +1,21 @@
-import csv
+"""
+LinkedIn job search scraper (logged-out search pages, driven through Chrome).
+
+Importing this module has no side effects: Chrome is only started when a
+LinkedInScraper first needs it, and each scraper carries its own keywords,
+search parameters, driver and duplicate filter, so several can run at once.
+
+    scraper = LinkedInScraper(keywords=['Python Developer'], max_pages=2)
+    try:
+        for job in scraper.iter_jobs():
+            ...
+    finally:
+        scraper.close()
+
+Run as a script to scrape KEYWORDS into Data/linkedin_jobs_guest.csv:
+    python linkedin.py [--max-pages N] [--history] [--extraction script|elements] [keyword ...]
+"""
+import argparse
 import time
 import os
 import random
@@ -6,6 +23,10 @@ from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from seen_index import SeenJobIndex, normalize_job_url
+from job_sink import open_job_sink
+from company_names import canonical_company
 
 # CONFIG
 KEYWORDS = ["Software Developer", "Software Engineer", "Backend Developer", "Frontend Developer", "Full Stack Developer"," DevOps Engineer", "Cloud Engineer", "Data Engineer", "Machine Learning Engineer",
@@ -13,6 +34,8 @@ KEYWORDS = ["Software Developer", "Software Engineer", "Backend Developer", "Fro
 EXP_FILTER = "3,4,5,6"
 MAX_PAGES = 4
 JOBS_PER_PAGE = 25
+# Seconds to wait for the results list to appear
+WAIT_SECONDS = 15
 
 BASE_PARAMS = {
     "location": "India",
@@ -28,43 +51,97 @@ USER_AGENTS = [
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
 ]
 
-def random_user_agent():
-    return random.choice(USER_AGENTS)
-
-options = webdriver.ChromeOptions()
-options.add_argument("--start-maximized")
-options.add_argument("--disable-blink-features=AutomationControlled")
-options.add_argument("--disable-notifications")
-options.add_argument(f"user-agent={random_user_agent()}")
-
-driver = webdriver.Chrome(options=options)
-wait = WebDriverWait(driver, 15)
+CARD_SELECTOR = "ul.jobs-search__results-list li"
 
 base_dir = os.path.dirname(os.path.abspath(__file__))
 data_dir = os.path.join(base_dir, 'Data')
-os.makedirs(data_dir, exist_ok=True)
 
+CSV_FIELDNAMES = ["job_title", "company_name", "jobUrl", "salary", "location", "postedTime", "experienceLevel",
+                  "company_key"]
 csv_path = os.path.join(data_dir, "linkedin_jobs_guest.csv")
-csv_file = open(csv_path, "w", newline="", encoding="utf-8")
-writer = csv.writer(csv_file)
-writer.writerow(["job_title", "company_name", "jobUrl", "salary", "location", "postedTime", "experienceLevel"])
 
-seen_links = set()
+def random_user_agent():
+    return random.choice(USER_AGENTS)
+
+def create_driver():
+    options = webdriver.ChromeOptions()
+    options.add_argument("--start-maximized")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("--disable-notifications")
+    options.add_argument(f"user-agent={random_user_agent()}")
+    return webdriver.Chrome(options=options)
 
-def build_url(keyword, start):
+def build_url(keyword, start, base_params=BASE_PARAMS):
     kw = keyword.replace(" ", "%20")
-    params = "&".join([f"{k}={v}" for k, v in BASE_PARAMS.items()])
+    params = "&".join([f"{k}={v}" for k, v in base_params.items()])
     return f"https://www.linkedin.com/jobs/search/?keywords={kw}&{params}&start={start}"
 
-def handle_popups():
-    popup_selectors = [
-        "button[aria-label='Dismiss']",
-        ".msg-overlay-bubble-header__control--close",
-        "button[data-test-modal-close-btn]",
-        ".artdeco-modal__dismiss",
-        "button[aria-label='Close']"
-    ]
-    for selector in popup_selectors:
+# Dismiss/close buttons clicked when displayed
+POPUP_SELECTORS = [
+    "button[aria-label='Dismiss']",
+    ".msg-overlay-bubble-header__control--close",
+    "button[data-test-modal-close-btn]",
+    ".artdeco-modal__dismiss",
+    "button[aria-label='Close']"
+]
+# Login/signup modals and their close buttons, clicked when not hidden by CSS
+LOGIN_POPUP_SELECTORS = [
+    "div.sign-in-modal",
+    "div#base-contextual-sign-in-modal",
+    "div.join-form",
+    "div.artdeco-modal__overlay",
+    "div[role='dialog']",
+    "button[aria-label='Dismiss']",
+    "button[data-test-modal-close-btn]",
+    "button[aria-label='Close']",
+    ".modal__dismiss",
+]
+
+# Installed once per page load: sweeps for the popups handle_popups and close_login_popup
+# look for, then a MutationObserver re-sweeps (debounced) whenever the DOM changes, so
+# popups are closed inside the page instead of by probing it from Python. Each element is
+# clicked once; one that is still showing after its click is reported as pending.
+POPUP_GUARD_JS = """
+const [popupSelectors, loginSelectors] = arguments;
+let guard = window.__jobPopupGuard;
+if (!guard) {
+    const hidden = el => {
+        const s = window.getComputedStyle(el);
+        return s.visibility === 'hidden' || s.display === 'none' || s.opacity === '0';
+    };
+    const displayed = el => !hidden(el) && el.getClientRects().length > 0;
+    guard = window.__jobPopupGuard = {dismissed: 0, clicked: new Set(), scheduled: false};
+    guard.pending = () => Array.from(guard.clicked).filter(el => el.isConnected && !hidden(el)).length;
+    guard.sweep = () => {
+        guard.scheduled = false;
+        const candidates = [];
+        for (const selector of popupSelectors) {
+            document.querySelectorAll(selector).forEach(el => displayed(el) && candidates.push(el));
+        }
+        for (const selector of loginSelectors) {
+            document.querySelectorAll(selector).forEach(el => !hidden(el) && candidates.push(el));
+        }
+        for (const el of candidates) {
+            if (guard.clicked.has(el)) continue;
+            guard.clicked.add(el);
+            try { el.click(); guard.dismissed++; } catch (e) {}
+        }
+    };
+    new MutationObserver(() => {
+        if (!guard.scheduled) {
+            guard.scheduled = true;
+            setTimeout(guard.sweep, 50);
+        }
+    }).observe(document.documentElement, {childList: true, subtree: true, attributes: true,
+                                           attributeFilter: ['class', 'style']});
+}
+guard.sweep();
+return {dismissed: guard.dismissed, pending: guard.pending()};
+"""
+
+
+def handle_popups(driver):
+    for selector in POPUP_SELECTORS:
         for btn in driver.find_elements(By.CSS_SELECTOR, selector):
             try:
                 if btn.is_displayed():
@@ -73,24 +150,12 @@ def handle_popups():
             except:
                 pass
 
-def close_login_popup():
+def close_login_popup(driver):
     """Accurately detect and close visible LinkedIn login/signup popups."""
     try:
-        login_selectors = [
-            "div.sign-in-modal",
-            "div#base-contextual-sign-in-modal",
-            "div.join-form",
-            "div.artdeco-modal__overlay",
-            "div[role='dialog']",
-            "button[aria-label='Dismiss']",
-            "button[data-test-modal-close-btn]",
-            "button[aria-label='Close']",
-            ".modal__dismiss",
-        ]
-
         closed_any = False
 
-        for selector in login_selectors:
+        for selector in LOGIN_POPUP_SELECTORS:
             elements = driver.find_elements(By.CSS_SELECTOR, selector)
             for el in elements:
                 try:
@@ -114,8 +179,108 @@ def close_login_popup():
     except Exception:
         return False
 
+def guard_popups(driver):
+    """Install POPUP_GUARD_JS on the current page (a no-op if it already is) and sweep now
 
-def extract_job_data(card):
+    Returns {'dismissed': n, 'pending': n} for the page so far, or None when
+    the script could not run.
+    """
+    try:
+        return driver.execute_script(POPUP_GUARD_JS, POPUP_SELECTORS, LOGIN_POPUP_SELECTORS)
+    except Exception as e:
+        print(f"Popup guard failed: {e}")
+        return None
+
+
+TITLE_SELECTOR = "a.base-card__full-link, a.job-card-list__title, a.job-card-container__link"
+COMPANY_SELECTOR = "span.base-search-card__subtitle, .job-card-container__company-name, h4.base-search-card__subtitle a"
+LOCATION_SELECTOR = "span.job-search-card__location"
+INSIGHT_SELECTOR = "p.job-card-list__insight"
+
+SALARY_MARKERS = ["₹", "LPA", "lpa", "per month", "CTC"]
+EXPERIENCE_KEYWORDS = {
+    "intern": "Internship",
+    "entry": "Entry level",
+    "associate": "Associate",
+    "junior": "Junior",
+    "mid": "Mid-Senior level",
+    "senior": "Senior",
+    "manager": "Manager",
+    "lead": "Lead",
+    "director": "Director",
+    "executive": "Executive"
+}
+
+# Everything extract_job_data reads, for every card on the page, in one round-trip.
+# innerText is what WebElement.text returns; el.href is the resolved URL get_attribute gives.
+EXTRACT_CARDS_JS = """
+const [cardSelector, titleSelector, companySelector, locationSelector, insightSelector] = arguments;
+return Array.from(document.querySelectorAll(cardSelector), card => {
+    const title = card.querySelector(titleSelector);
+    const company = card.querySelector(companySelector);
+    const location = card.querySelector(locationSelector);
+    const posted = card.querySelector('time');
+    const insight = card.querySelector(insightSelector);
+    return {
+        title: title ? title.innerText : null,
+        href: title ? (title.href || title.getAttribute('href')) : null,
+        company: company ? company.innerText : null,
+        location: location ? location.innerText : null,
+        datetime: posted ? posted.getAttribute('datetime') : null,
+        text: card.innerText,
+        aria_label: card.getAttribute('aria-label'),
+        title_attr: card.getAttribute('title'),
+        insight: insight ? insight.innerText : null,
+    };
+});
+"""
+EXTRACTION_MODES = ('script', 'elements')
+
+
+def extract_job_url(card):
+    """Just the job URL, so known cards can be skipped before full extraction"""
+    try:
+        title_el = card.find_element(By.CSS_SELECTOR, TITLE_SELECTOR)
+        return title_el.get_attribute("href").split("?")[0]
+    except:
+        return "N/A"
+
+
+def card_fields(card):
+    """The raw values of one card read through the WebElement API, as EXTRACT_CARDS_JS returns them"""
+    def find(selector):
+        try:
+            return card.find_element(By.CSS_SELECTOR, selector)
+        except:
+            return None
+
+    def read(getter):
+        try:
+            return getter()
+        except:
+            return None
+
+    title, company, location, posted, insight = (find(selector) for selector in (
+        TITLE_SELECTOR, COMPANY_SELECTOR, LOCATION_SELECTOR, "time", INSIGHT_SELECTOR))
+    return {
+        "title": read(lambda: title.text) if title else None,
+        "href": read(lambda: title.get_attribute("href")) if title else None,
+        "company": read(lambda: company.text) if company else None,
+        "location": read(lambda: location.text) if location else None,
+        "datetime": read(lambda: posted.get_attribute("datetime")) if posted else None,
+        "text": read(lambda: card.text),
+        "aria_label": read(lambda: card.get_attribute("aria-label")),
+        "title_attr": read(lambda: card.get_attribute("title")),
+        "insight": read(lambda: insight.text) if insight else None,
+    }
+
+
+def fields_job_url(fields):
+    """extract_job_url for a card's raw fields"""
+    return fields["href"].split("?")[0] if fields["title"] is not None and fields["href"] is not None else "N/A"
+
+
+def job_from_fields(fields):
     job_data = {
         "job_title": "N/A",
         "company_name": "N/A",
@@ -126,143 +291,227 @@ def extract_job_data(card):
         "experienceLevel": "N/A"
     }
 
-    try:
-        title_el = card.find_element(By.CSS_SELECTOR, "a.base-card__full-link, a.job-card-list__title, a.job-card-container__link")
-        job_data["job_title"] = title_el.text.strip()
-        job_data["jobUrl"] = title_el.get_attribute("href").split("?")[0]
-    except:
-        pass
-
-    try:
-        company_el = card.find_element(By.CSS_SELECTOR, "span.base-search-card__subtitle, .job-card-container__company-name, h4.base-search-card__subtitle a")
-        job_data["company_name"] = company_el.text.strip()
-    except:
-        pass
-
-    try:
-        loc = card.find_element(By.CSS_SELECTOR, "span.job-search-card__location")
-        job_data["location"] = loc.text.strip()
-    except:
-        pass
-
-    try:
-        posted = card.find_element(By.CSS_SELECTOR, "time")
-        job_data["postedTime"] = posted.get_attribute("datetime").split("T")[0]
-    except:
-        pass
+    if fields["title"] is not None:
+        job_data["job_title"] = fields["title"].strip()
+        job_data["jobUrl"] = fields_job_url(fields)
+    if fields["company"] is not None:
+        job_data["company_name"] = fields["company"].strip()
+    if fields["location"] is not None:
+        job_data["location"] = fields["location"].strip()
+    if fields["datetime"] is not None:
+        job_data["postedTime"] = fields["datetime"].split("T")[0]
 
     # Extract salary text if visible
-    try:
-        full_text = card.text
-        if any(s in full_text for s in ["₹", "LPA", "lpa", "per month", "salary", "CTC"]):
-            for line in full_text.split("\n"):
-                if any(s in line for s in ["₹", "LPA", "lpa", "per month", "CTC"]):
-                    job_data["salary"] = line.strip()
-                    break
-    except:
-        pass
-
-    # Extract experience level more intelligently
-    try:
-        exp_keywords = {
-            "intern": "Internship",
-            "entry": "Entry level",
-            "associate": "Associate",
-            "junior": "Junior",
-            "mid": "Mid-Senior level",
-            "senior": "Senior",
-            "manager": "Manager",
-            "lead": "Lead",
-            "director": "Director",
-            "executive": "Executive"
-        }
-
-        text = card.text.lower()
+    full_text = fields["text"] or ""
+    if any(s in full_text for s in SALARY_MARKERS + ["salary"]):
+        for line in full_text.split("\n"):
+            if any(s in line for s in SALARY_MARKERS):
+                job_data["salary"] = line.strip()
+                break
 
-        # Check aria-labels or hidden tags if visible text fails
-        hidden_attrs = []
-        for attr in ["aria-label", "title"]:
-            try:
-                val = card.get_attribute(attr)
-                if val:
-                    hidden_attrs.append(val.lower())
-            except:
-                pass
-        combined_text = text + " " + " ".join(hidden_attrs)
+    # Experience level from the card text, or aria-label/title if the visible text has none
+    hidden_attrs = [value.lower() for value in (fields["aria_label"], fields["title_attr"]) if value]
+    combined_text = full_text.lower() + " " + " ".join(hidden_attrs)
+    for key, label in EXPERIENCE_KEYWORDS.items():
+        if key in combined_text:
+            job_data["experienceLevel"] = label
+            break
 
-        for key, label in exp_keywords.items():
-            if key in combined_text:
+    # Try fallback from description preview (sometimes visible in hover cards)
+    if job_data["experienceLevel"] == "N/A" and fields["insight"] is not None:
+        desc = fields["insight"].lower()
+        for key, label in EXPERIENCE_KEYWORDS.items():
+            if key in desc:
                 job_data["experienceLevel"] = label
                 break
-    except:
-        pass
-
-    # Try fallback from description preview (sometimes visible in hover cards)
-    if job_data["experienceLevel"] == "N/A":
-        try:
-            desc = card.find_element(By.CSS_SELECTOR, "p.job-card-list__insight").text.lower()
-            for key, label in exp_keywords.items():
-                if key in desc:
-                    job_data["experienceLevel"] = label
-                    break
-        except:
-            pass
 
+    job_data["company_key"] = canonical_company(job_data["company_name"]) if job_data["company_name"] != "N/A" else ""
     return job_data
 
 
-try:
-    for keyword in KEYWORDS:
-        print("Searching:", keyword)
-        for page in range(MAX_PAGES):
-            start = page * JOBS_PER_PAGE
-            url = build_url(keyword, start)
-            print(" Page", page + 1, "URL:", url)
-            driver.get(url)
-            time.sleep(random.uniform(2.0, 4.0))
-
-            handle_popups()
-            close_login_popup()
-
-            try:
-                wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "ul.jobs-search__results-list li")))
-            except:
-                print("No jobs found on this page.")
-                continue
+def extract_job_data(card):
+    return job_from_fields(card_fields(card))
+
+
+def extract_page_fields(driver):
+    """Raw fields of every card on the loaded results page, in a single execute_script call"""
+    return driver.execute_script(EXTRACT_CARDS_JS, CARD_SELECTOR, TITLE_SELECTOR, COMPANY_SELECTOR,
+                                 LOCATION_SELECTOR, INSIGHT_SELECTOR)
+
+class LinkedInScraper:
+    """Scrape LinkedIn job searches with one (lazily started) Chrome
+
+    is_duplicate(job_url) defaults to skipping URLs this scraper has already
+    yielded; pass SeenJobIndex.is_duplicate to also skip earlier runs. A
+    driver passed in belongs to the caller and is left open by close().
+    Setting stop_event ends iter_jobs() at the next card, and
+    on_page(keyword, page, cards, qualified) reports each results page.
+
+    extraction='script' reads every card of a page in one execute_script
+    call (EXTRACT_CARDS_JS); 'elements' reads them through find_element and
+    get_attribute, one WebDriver round-trip per value.
+
+    Popups are closed by POPUP_GUARD_JS, installed once per results page,
+    which keeps watching the page for new ones; popup_stats counts what it
+    dismissed and how often the Python-side probes had to step in.
+    """
+
+    def __init__(self, keywords=None, base_params=None, max_pages=MAX_PAGES, jobs_per_page=JOBS_PER_PAGE,
+                 driver=None, driver_factory=create_driver, is_duplicate=None, stop_event=None, on_page=None,
+                 extraction='script'):
+        if extraction not in EXTRACTION_MODES:
+            raise ValueError(f"unknown extraction {extraction!r}, expected one of {', '.join(EXTRACTION_MODES)}")
+        self.keywords = list(KEYWORDS if keywords is None else keywords)
+        self.base_params = dict(BASE_PARAMS if base_params is None else base_params)
+        self.max_pages = max_pages
+        self.jobs_per_page = jobs_per_page
+        self.driver_factory = driver_factory
+        self._driver = driver
+        self.owns_driver = driver is None
+        self.is_duplicate = is_duplicate or self._seen_before
+        self.seen = set()
+        self.stop_event = stop_event
+        self.on_page = on_page
+        self.extraction = extraction
+        self.popup_stats = {'dismissed': 0, 'fallbacks': 0}
+
+    @property
+    def driver(self):
+        if self._driver is None:
+            self._driver = self.driver_factory()
+        return self._driver
+
+    @property
+    def stopped(self):
+        return self.stop_event is not None and self.stop_event.is_set()
+
+    def _seen_before(self, job_url):
+        normalized = normalize_job_url(job_url)
+        if normalized in self.seen:
+            return True
+        self.seen.add(normalized)
+        return False
 
-            cards = driver.find_elements(By.CSS_SELECTOR, "ul.jobs-search__results-list li")
-            print(" Found", len(cards), "cards")
+    def build_url(self, keyword, start):
+        return build_url(keyword, start, self.base_params)
+
+    def dismiss_popups(self):
+        """Let the in-page popup guard close popups; probe the DOM from Python only
+        when the guard is unavailable or reports a popup its click didn't close"""
+        status = guard_popups(self.driver)
+        if status is not None:
+            self.popup_stats['dismissed'] += status['dismissed']
+            if not status['pending']:
+                return
+        self.popup_stats['fallbacks'] += 1
+        handle_popups(self.driver)
+        close_login_popup(self.driver)
+
+    def page_cards(self, keyword, page):
+        """The cards of one results page - raw field dicts with 'script' extraction,
+        WebElements with 'elements' - or None when it shows none"""
+        url = self.build_url(keyword, page * self.jobs_per_page)
+        print(" Page", page + 1, "URL:", url)
+        self.driver.get(url)
+        time.sleep(random.uniform(2.0, 4.0))
+
+        self.dismiss_popups()
 
-            for i, card in enumerate(cards):
-                job_data = extract_job_data(card)
-                if job_data["jobUrl"] == "N/A" or job_data["jobUrl"] in seen_links:
+        try:
+            WebDriverWait(self.driver, WAIT_SECONDS).until(
+                EC.presence_of_all_elements_located((By.CSS_SELECTOR, CARD_SELECTOR)))
+        except TimeoutException:
+            print("No jobs found on this page.")
+            return None
+        if self.extraction == 'script':
+            return extract_page_fields(self.driver)
+        return self.driver.find_elements(By.CSS_SELECTOR, CARD_SELECTOR)
+
+    def iter_jobs(self, keywords=None):
+        """Yield new jobs (dicts with CSV_FIELDNAMES) page by page; keywords default to self.keywords"""
+        if self.extraction == 'script':
+            card_url, card_job = fields_job_url, job_from_fields
+        else:
+            card_url, card_job = extract_job_url, extract_job_data
+        for keyword in self.keywords if keywords is None else keywords:
+            print("Searching:", keyword)
+            for page in range(self.max_pages):
+                if self.stopped:
+                    return
+                cards = self.page_cards(keyword, page)
+                if cards is None:
                     continue
-
-                seen_links.add(job_data["jobUrl"])
-                print(f"  [{i+1}] {job_data['job_title'][:60]}")
-
-                writer.writerow([
-                    job_data["job_title"],
-                    job_data["company_name"],
-                    job_data["jobUrl"],
-                    job_data["salary"],
-                    job_data["location"],
-                    job_data["postedTime"],
-                    job_data["experienceLevel"]
-                ])
-                csv_file.flush()
-
-                handle_popups()
-                close_login_popup()
-                time.sleep(random.uniform(1.0, 2.0))
-
-except KeyboardInterrupt:
-    print("Interrupted by user.")
-except Exception as e:
-    import traceback
-    traceback.print_exc()
-    print("Unexpected error:", e)
-finally:
-    csv_file.close()
-    driver.quit()
-    print("Scraping finished. Output saved to linkedin_jobs_guest.csv")
+                print(" Found", len(cards), "cards")
+
+                qualified = 0
+                for i, card in enumerate(cards):
+                    if self.stopped:
+                        return
+                    job_url = card_url(card)
+                    if job_url == "N/A" or self.is_duplicate(job_url):
+                        continue
+
+                    job_data = card_job(card)
+                    print(f"  [{i+1}] {job_data['job_title'][:60]}")
+                    qualified += 1
+                    yield job_data
+
+                if self.on_page:
+                    self.on_page(keyword, page + 1, len(cards), qualified)
+                # Paced per page rather than per card: the page was read in one go
+                time.sleep(random.uniform(2.0, 4.0))
+
+    def close(self):
+        if self._driver is not None and self.owns_driver:
+            self._driver.quit()
+        self._driver = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main(keywords=None, max_pages=MAX_PAGES, use_history=False, output_path=csv_path, extraction='script'):
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    # Rows are written in batches and the file is swapped into place on close
+    sink = open_job_sink(output_path, CSV_FIELDNAMES)
+    # Persistent across runs; also covers duplicates within this run
+    seen_index = SeenJobIndex(source='linkedin') if use_history else None
+    scraper = LinkedInScraper(keywords, max_pages=max_pages,
+                              is_duplicate=seen_index.is_duplicate if seen_index else None, extraction=extraction)
+    failed = False
+    try:
+        for job_data in scraper.iter_jobs():
+            sink.write(job_data)
+    except KeyboardInterrupt:
+        print("Interrupted by user.")
+    except Exception as e:
+        failed = True
+        import traceback
+        traceback.print_exc()
+        print("Unexpected error:", e)
+    finally:
+        # A failed run keeps the previous output; an interrupted one saves the jobs found so far
+        sink.close(commit=not failed)
+        if seen_index:
+            # Jobs only count as seen once they are in the saved output
+            seen_index.close(commit=not failed)
+        scraper.close()
+        print(f"Scraping finished. {0 if failed else sink.count} jobs saved to {output_path}")
+        print(f"Popups dismissed in-page: {scraper.popup_stats['dismissed']}, "
+              f"DOM probe fallbacks: {scraper.popup_stats['fallbacks']}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Scrape LinkedIn job searches into Data/linkedin_jobs_guest.csv")
+    parser.add_argument('keywords', nargs='*', help="keywords to search (default: KEYWORDS)")
+    parser.add_argument('--max-pages', type=int, default=MAX_PAGES)
+    parser.add_argument('--history', action='store_true',
+                        help="skip jobs seen by earlier --history runs; the output then holds only new jobs")
+    parser.add_argument('--output', default=csv_path)
+    parser.add_argument('--extraction', choices=EXTRACTION_MODES, default='script',
+                        help="read each page's cards in one execute_script call, or element by element")
+    args = parser.parse_args()
+    main(args.keywords or None, args.max_pages, args.history, args.output, args.extraction)
@@ -5,6 +5,9 @@ import os
 import random
 import logging
 import json
+import argparse
+import queue
+import threading
 from datetime import datetime
 from bs4 import BeautifulSoup
 from selenium import webdriver
@@ -16,9 +19,26 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException,
 from selenium_stealth import stealth
 from tqdm import tqdm
 import re
-from webdriver_manager.chrome import ChromeDriverManager
+from functools import lru_cache
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.action_chains import ActionChains
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from seen_index import SeenJobIndex, normalize_job_url
+from checkpoint import ScrapeCheckpoint
+from job_sink import SINK_FORMATS, open_job_sink
+from company_names import canonical_company, clean_company_name
+from driver_pool import chromedriver_path
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
 
 
 try:
@@ -286,6 +306,12 @@ job_roles = [
 
 seen_job_links = set()
 
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+]
+
 def create_stealth_driver():
     """Create a selenium driver with stealth settings"""
     options = Options()
@@ -298,14 +324,9 @@ def create_stealth_driver():
     options.add_argument("--disable-dev-shm-usage")
     options.add_argument("--no-sandbox")
     
-    user_agents = [
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    ]
-    options.add_argument(f'user-agent={random.choice(user_agents)}')
+    options.add_argument(f'user-agent={random.choice(USER_AGENTS)}')
     
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+    driver = webdriver.Chrome(service=Service(chromedriver_path()), options=options)
     
     stealth(driver,
             languages=["en-US", "en"],
@@ -318,72 +339,170 @@ def create_stealth_driver():
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
     return driver
 
+# --- Keyword Classification Engine ---
+
+REMOTE_KEYWORDS = [
+    'remote', 'work from home', 'wfh', 'work-from-home', 
+    'virtual', 'telecommute', 'work anywhere', 'distributed team'
+]
+
+CONTRACT_KEYWORDS = [
+    'contract', 'freelance', 'temporary', '6 month', '12 month',
+    'contractor', 'contract basis', 'project basis', 'short term',
+    'contract to hire', 'c2h', 'contractual', 'fixed term'
+]
+
+EXCLUDED_KEYWORDS = [
+    # CRITICAL: Exclude ALL full-time jobs
+    'full time', 'full-time', 'fulltime', 
+    'permanent', 'permanent position', 'permanent role',
+    'direct hire', 'employee', 'employment',
+    # Exclude on-site jobs
+    'on-site', 'onsite', 'on site',
+    'work from office', 'office based', 'office-based',
+    'in-office', 'in office',
+    'must relocate', 'relocation required',
+    # Exclude hybrid jobs
+    'hybrid',
+    # Exclude part-time
+    'part-time', 'part time', 'parttime'
+]
+
+def build_keyword_pattern(keywords):
+    """Fold keywords into a prefix trie and render it as one regex alternation"""
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def render(node):
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # A keyword ends here, so everything below is an optional longer match
+        return f'(?:{body})?' if '' in node else body
+
+    return render(trie)
+
+class KeywordClassifier:
+    """Match text against several keyword groups in a single pass.
+
+    Keywords are compiled once into an Aho-Corasick automaton (pyahocorasick)
+    or, when that isn't installed (or automaton=False), a trie-shaped regex
+    wrapped in a lookahead. The lookahead only reports the longest keyword at
+    each position, so the keywords that are prefixes of it are added back.
+    Both report every keyword occurring anywhere in the text, the same as
+    `keyword in text`, while the text is only lowercased and scanned once.
+    """
+
+    def __init__(self, groups, automaton=True):
+        self.groups = {name: list(dict.fromkeys(keywords)) for name, keywords in groups.items()}
+        self.keyword_groups = {}
+        for name, keywords in self.groups.items():
+            for keyword in keywords:
+                if self.keyword_groups.setdefault(keyword, name) != name:
+                    raise ValueError(f"Keyword '{keyword}' is listed in more than one group")
+
+        if automaton and ahocorasick is not None:
+            self.automaton = ahocorasick.Automaton()
+            for keyword in self.keyword_groups:
+                self.automaton.add_word(keyword, keyword)
+            self.automaton.make_automaton()
+            self.pattern = None
+        else:
+            self.automaton = None
+            self.pattern = re.compile(f"(?=({build_keyword_pattern(self.keyword_groups)}))")
+            # Every keyword matching where a longer one does: "contractor" also holds "contract"
+            self.prefixes = {keyword: [other for other in self.keyword_groups if keyword.startswith(other)]
+                             for keyword in self.keyword_groups}
+
+    def find_keywords(self, text):
+        """Yield every keyword occurrence in already-lowercased text"""
+        if self.automaton is not None:
+            for _, keyword in self.automaton.iter(text):
+                yield keyword
+        else:
+            for longest in self.pattern.findall(text):
+                yield from self.prefixes[longest]
+
+    def classify(self, text):
+        """Return {group: [matched keywords]} for every group, in the group's keyword order"""
+        found = set(self.find_keywords(text.lower())) if text else set()
+        return {name: [keyword for keyword in keywords if keyword in found]
+                for name, keywords in self.groups.items()}
+
+JOB_KEYWORDS = KeywordClassifier({
+    'remote': REMOTE_KEYWORDS,
+    'contract': CONTRACT_KEYWORDS,
+    'excluded': EXCLUDED_KEYWORDS,
+})
+
+# --- Compiled Pattern Registry ---
+
+# Upper bound on memoized parser results; card fields like "2 days ago" or
+# "Not Disclosed" repeat constantly, full card texts mostly don't.
+PARSER_CACHE_SIZE = 4096
+
+PATTERNS = {
+    'exp_range': re.compile(r'(\d+)\s*[-–—to]+\s*(\d+)'),
+    'exp_plus': re.compile(r'(\d+)\s*\+'),
+    'exp_years': re.compile(r'(\d+)\s*(?:years?|yrs?|y)\b'),
+    'exp_extract': [
+        (re.compile(r'(\d+)\s*[-–—to]+\s*(\d+)\s*(?:years?|yrs?|y)\s*(?:of)?\s*(?:experience|exp)?'),
+         lambda m: f"{m.group(1)}-{m.group(2)}"),
+        (re.compile(r'(\d+)\s*\+\s*(?:years?|yrs?|y)\s*(?:of)?\s*(?:experience|exp)?'),
+         lambda m: f"{m.group(1)}+"),
+        (re.compile(r'(\d+)\s*(?:years?|yrs?|y)(?:\s+(?:of)?\s*(?:experience|exp))?'),
+         lambda m: m.group(1)),
+    ],
+    'exp_number': re.compile(r'\b(\d+)\s*(?=years?|yrs?|y\b)'),
+    'relative_time': re.compile(r'\d+\s*(day|hour|week|month|ago)'),
+    'card_dates': [re.compile(p, re.IGNORECASE) for p in (
+        r'(posted|active|updated)?\s*:?\s*(\d+\s+(?:day|days|hour|hours|week|weeks|month|months)\s+ago)',
+        r'(today|yesterday|just now)',
+        r'(\d+[dDhHwWmM])\s+ago',
+        r'posted\s+on\s+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    )],
+    'date_prefixes': [re.compile(p, re.IGNORECASE) for p in (
+        r'^(posted|active|updated|date|time|employer)\s*:?\s*',
+        r'^\|\s*',
+        r'^-\s*',
+    )],
+    'date_ago': re.compile(r'(\d+)\s*(day|days|hour|hours|week|weeks|month|months)\s*ago', re.IGNORECASE),
+    'date_today': re.compile(r'\btoday\b', re.IGNORECASE),
+    'date_yesterday': re.compile(r'\byesterday\b', re.IGNORECASE),
+    'date_just_now': re.compile(r'\bjust\s+now\b', re.IGNORECASE),
+    'date_abbr': re.compile(r'(\d+)\s*([dDhHwWmM])'),
+    'date_iso': re.compile(r'(\d{4})-(\d{2})-(\d{2})'),
+    'date_digits': re.compile(r'^\d+$'),
+    'date_numeric': re.compile(r'(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})'),
+    'punctuation': re.compile(r'[^\w\s]'),
+    'salary': [re.compile(p, re.IGNORECASE) for p in (
+        r"₹?\s?[\d,\.]+(?:\s?[-–to]+\s?[\d,\.]+)?\s?(?:LPA|PA|per annum|lakhs|lakh|k|K|₹)?",
+        r"\$[\d,\.]+(?:\s?[-–to]+\s?[\d,\.]+)?\s?(?:per year|per annum|yearly)?",
+        r"[\d,\.]+\s?(?:to|[-–])\s?[\d,\.]+\s?(?:USD|INR|EUR|GBP|AED)?",
+    )],
+}
+
 # --- MODIFIED Job Filtering Functions ---
 
 def is_remote_job(job_text):
     """Check if job is remote/work from home"""
-    if not job_text:
-        return False
-    
-    job_text_lower = job_text.lower()
-    remote_keywords = [
-        'remote', 'work from home', 'wfh', 'work-from-home', 
-        'virtual', 'telecommute', 'work anywhere', 'distributed team'
-    ]
-    
-    return any(keyword in job_text_lower for keyword in remote_keywords)
+    return bool(JOB_KEYWORDS.classify(job_text)['remote'])
 
 def is_contract_job(job_text):
     """Check if job is contract/freelance"""
-    if not job_text:
-        return False
-    
-    job_text_lower = job_text.lower()
-    contract_keywords = [
-        'contract', 'freelance', 'temporary', '6 month', '12 month',
-        'contractor', 'contract basis', 'project basis', 'short term',
-        'contract to hire', 'c2h', 'contractual', 'fixed term'
-    ]
-    
-    return any(keyword in job_text_lower for keyword in contract_keywords)
+    return bool(JOB_KEYWORDS.classify(job_text)['contract'])
 
 def has_excluded_keywords(job_text):
     if not job_text:
         return True
-    
-    job_text_lower = job_text.lower()
-    
-    # CRITICAL: Exclude ALL full-time jobs
-    fulltime_keywords = [
-        'full time', 'full-time', 'fulltime', 
-        'permanent', 'permanent position', 'permanent role',
-        'direct hire', 'employee', 'employment'
-    ]
-    
-    # Exclude on-site jobs
-    onsite_keywords = [
-        'on-site', 'onsite', 'on site',
-        'work from office', 'office based', 'office-based',
-        'in-office', 'in office',
-        'must relocate', 'relocation required'
-    ]
-    
-    # Exclude hybrid jobs
-    hybrid_keywords = ['hybrid']
-
-    # Exclude part-time
-    parttime_keywords = ['part-time', 'part time', 'parttime']
-    
-    # Combine all exclusion keywords
-    all_excluded = fulltime_keywords + onsite_keywords + hybrid_keywords + parttime_keywords
-    
-    # Check if any excluded keyword exists
-    for keyword in all_excluded:
-        if keyword in job_text_lower:
-            return True
-    
-    return False
+    return bool(JOB_KEYWORDS.classify(job_text)['excluded'])
 
+@lru_cache(maxsize=PARSER_CACHE_SIZE)
 def filter_experience(exp_text):
     """Filter for 2+ years experience"""
     if not exp_text or exp_text == "0" or exp_text == "Not specified":
@@ -397,7 +516,7 @@ def filter_experience(exp_text):
         return False
 
     # Handle ranges like "2-5 years"
-    range_match = re.search(r'(\d+)\s*[-–—to]+\s*(\d+)', exp_text_lower)
+    range_match = PATTERNS['exp_range'].search(exp_text_lower)
     if range_match:
         try:
             min_exp = int(range_match.group(1))
@@ -406,7 +525,7 @@ def filter_experience(exp_text):
             return False
 
     # Handle "3+" or "3+ years"
-    plus_match = re.search(r'(\d+)\s*\+', exp_text_lower)
+    plus_match = PATTERNS['exp_plus'].search(exp_text_lower)
     if plus_match:
         try:
             exp = int(plus_match.group(1))
@@ -415,7 +534,7 @@ def filter_experience(exp_text):
             return False
 
     # Handle simple numbers like "3 years"
-    num_match = re.search(r'(\d+)\s*(?:years?|yrs?|y)\b', exp_text_lower)
+    num_match = PATTERNS['exp_years'].search(exp_text_lower)
     if num_match:
         try:
             exp = int(num_match.group(1))
@@ -430,15 +549,14 @@ def meets_all_criteria(job_title, company_name, job_text, experience_text):
     if not job_title or not job_text:
         return False
     
+    matches = JOB_KEYWORDS.classify(job_text)
+    
     # STEP 1: Check EXCLUSIONS first (if any excluded keyword found, reject immediately)
-    if has_excluded_keywords(job_text):
+    if matches['excluded']:
         return False
     
     # STEP 2: Check INCLUSIONS (MUST have BOTH Remote AND Contract)
-    is_remote = is_remote_job(job_text)
-    is_contract = is_contract_job(job_text)
-    
-    if not (is_remote and is_contract):
+    if not (matches['remote'] and matches['contract']):
         return False
     
     # STEP 3: Check experience requirement (must be 2+ years)
@@ -488,10 +606,7 @@ def extract_company_name(card):
         all_elements = card.find_all(['div', 'span', 'p', 'h3', 'h4', 'h5'])
         for elem in all_elements:
             text = elem.get_text(strip=True)
-            # Skip if text is too short, looks like a date, or contains common job-related terms
-            if (text and len(text) > 2 and 
-                not any(word in text.lower() for word in ['apply', 'job', 'posted', 'days ago']) and
-                not re.search(r'\d+\s*(day|hour|week|month|ago)', text.lower())):
+            if looks_like_company_name(text):
                 company_name = text
                 break
     
@@ -500,50 +615,11 @@ def extract_company_name(card):
     
     return company_name if company_name and company_name != 'Not specified' else 'Not specified'
 
-def clean_company_name(company_text):
-    if not company_text or company_text == 'Not specified':
-        return 'Not specified'
-    
-    # Remove common prefixes
-    prefixes_to_remove = [
-        r'^company:\s*',
-        r'^employer:\s*',
-        r'^at\s+',
-        r'^by\s+',
-        r'^posted by\s+',
-        r'^hiring:\s*',
-    ]
-    
-    for prefix in prefixes_to_remove:
-        company_text = re.sub(prefix, '', company_text, flags=re.IGNORECASE)
-    
-    # Remove job board artifacts
-    artifacts_to_remove = [
-        r'\s*\|\s*shine\.com.*$',
-        r'\s*-\s*shine\.com.*$',
-        r'\s*\(.*?\bverified\b.*?\)',
-        r'\s*★.*$',  # Remove ratings
-        r'\s*\d+\.\d+\s*$',  # Remove standalone ratings
-    ]
-    
-    for artifact in artifacts_to_remove:
-        company_text = re.sub(artifact, '', company_text, flags=re.IGNORECASE)
-    
-    # Clean whitespace
-    company_text = ' '.join(company_text.split())
-    company_text = company_text.strip()
-    
-    # Remove quotes if they wrap the entire name
-    if company_text.startswith('"') and company_text.endswith('"'):
-        company_text = company_text[1:-1]
-    if company_text.startswith("'") and company_text.endswith("'"):
-        company_text = company_text[1:-1]
-    
-    # Validate: must be at least 2 characters and not just numbers
-    if len(company_text) < 2 or company_text.isdigit():
-        return 'Not specified'
-    
-    return company_text
+def looks_like_company_name(text):
+    """Skip if text is too short, looks like a date, or contains common job-related terms"""
+    return bool(text and len(text) > 2 and
+                not any(word in text.lower() for word in ['apply', 'job', 'posted', 'days ago']) and
+                not PATTERNS['relative_time'].search(text.lower()))
 
 def extract_date_posted(card):
     date_posted = 'Not specified'
@@ -586,15 +662,8 @@ def extract_date_posted(card):
     
     # Strategy 3: Search for date patterns in entire card text
     card_text = card.get_text()
-    date_patterns = [
-        r'(posted|active|updated)?\s*:?\s*(\d+\s+(?:day|days|hour|hours|week|weeks|month|months)\s+ago)',
-        r'(today|yesterday|just now)',
-        r'(\d+[dDhHwWmM])\s+ago',
-        r'posted\s+on\s+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-    ]
-    
-    for pattern in date_patterns:
-        match = re.search(pattern, card_text, re.IGNORECASE)
+    for pattern in PATTERNS['card_dates']:
+        match = pattern.search(card_text)
         if match:
             # Get the captured date part (usually last group)
             date_str = match.group(match.lastindex) if match.lastindex > 1 else match.group(0)
@@ -620,22 +689,21 @@ def clean_date_posted(date_text):
     if not date_text:
         return "Not specified"
     
-    date_text = str(date_text).strip()
+    # ISO dates are rendered relative to today, so today is part of the cache key
+    return _clean_date_posted(str(date_text), datetime.now().date())
+
+@lru_cache(maxsize=PARSER_CACHE_SIZE)
+def _clean_date_posted(date_text, today):
+    date_text = date_text.strip()
     
     # Remove common prefixes
-    prefixes = [
-        r'^(posted|active|updated|date|time|employer)\s*:?\s*',
-        r'^\|\s*',
-        r'^-\s*',
-    ]
-    for prefix in prefixes:
-        date_text = re.sub(prefix, '', date_text, flags=re.IGNORECASE)
+    for prefix in PATTERNS['date_prefixes']:
+        date_text = prefix.sub('', date_text)
     
     date_text = date_text.strip()
     
     # Pattern 1: "X days/hours/weeks/months ago"
-    pattern1 = r'(\d+)\s*(day|days|hour|hours|week|weeks|month|months)\s*ago'
-    match1 = re.search(pattern1, date_text, re.IGNORECASE)
+    match1 = PATTERNS['date_ago'].search(date_text)
     if match1:
         num = match1.group(1)
         unit = match1.group(2).lower()
@@ -654,15 +722,14 @@ def clean_date_posted(date_text):
         
         return f"{num} {unit} ago"
     
-    if re.search(r'\btoday\b', date_text, re.IGNORECASE):
+    if PATTERNS['date_today'].search(date_text):
         return "Today"
-    if re.search(r'\byesterday\b', date_text, re.IGNORECASE):
+    if PATTERNS['date_yesterday'].search(date_text):
         return "Yesterday"
-    if re.search(r'\bjust\s+now\b', date_text, re.IGNORECASE):
+    if PATTERNS['date_just_now'].search(date_text):
         return "Just now"
     
-    pattern3 = r'(\d+)\s*([dDhHwWmM])'
-    match3 = re.search(pattern3, date_text)
+    match3 = PATTERNS['date_abbr'].search(date_text)
     if match3:
         num = match3.group(1)
         unit_abbr = match3.group(2).lower()
@@ -680,12 +747,10 @@ def clean_date_posted(date_text):
         
         return f"{num} {unit} ago"
     
-    iso_pattern = r'(\d{4})-(\d{2})-(\d{2})'
-    iso_match = re.search(iso_pattern, date_text)
+    iso_match = PATTERNS['date_iso'].search(date_text)
     if iso_match:
         try:
-            date_obj = datetime.strptime(iso_match.group(0), '%Y-%m-%d')
-            today = datetime.now()
+            date_obj = datetime.strptime(iso_match.group(0), '%Y-%m-%d').date()
             diff = today - date_obj
             
             if diff.days == 0:
@@ -703,22 +768,22 @@ def clean_date_posted(date_text):
         except:
             pass
     
-    if re.match(r'^\d+$', date_text):
+    if PATTERNS['date_digits'].match(date_text):
         num = int(date_text)
         unit = 'day' if num == 1 else 'days'
         return f"{num} {unit} ago"
     
-    date_pattern = r'(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})'
-    date_match = re.search(date_pattern, date_text)
+    date_match = PATTERNS['date_numeric'].search(date_text)
     if date_match:
         return date_text  
     if len(date_text) > 2 and len(date_text) < 100:
-        cleaned = re.sub(r'[^\w\s]', '', date_text)
+        cleaned = PATTERNS['punctuation'].sub('', date_text)
         if cleaned:
             return cleaned.strip()
     
     return "Not specified"
 
+# Not memoized: it is called with whole card texts, which almost never repeat
 def extract_experience_enhanced(text):
     """Enhanced experience extraction with comprehensive patterns"""
     if not text:
@@ -726,17 +791,8 @@ def extract_experience_enhanced(text):
     
     text_lower = text.lower()
     
-    patterns = [
-        (r'(\d+)\s*[-–—to]+\s*(\d+)\s*(?:years?|yrs?|y)\s*(?:of)?\s*(?:experience|exp)?', 
-         lambda m: f"{m.group(1)}-{m.group(2)}"),
-        (r'(\d+)\s*\+\s*(?:years?|yrs?|y)\s*(?:of)?\s*(?:experience|exp)?', 
-         lambda m: f"{m.group(1)}+"),
-        (r'(\d+)\s*(?:years?|yrs?|y)(?:\s+(?:of)?\s*(?:experience|exp))?', 
-         lambda m: m.group(1)),
-    ]
-    
-    for pattern, handler in patterns:
-        matches = re.finditer(pattern, text_lower)
+    for pattern, handler in PATTERNS['exp_extract']:
+        matches = pattern.finditer(text_lower)
         for match in matches:
             try:
                 result = handler(match)
@@ -745,254 +801,992 @@ def extract_experience_enhanced(text):
             except:
                 continue
     
-    number_matches = re.findall(r'\b(\d+)\s*(?=years?|yrs?|y\b)', text_lower)
+    number_matches = PATTERNS['exp_number'].findall(text_lower)
     if number_matches:
         return number_matches[0]
     
     return "0"
 
+@lru_cache(maxsize=PARSER_CACHE_SIZE)
 def extract_salary_text(text):
     """Extract and normalize salary data from given raw text."""
     if not text:
         return "Not Disclosed"
     
     text = text.strip()
-    patterns = [
-        r"₹?\s?[\d,\.]+(?:\s?[-–to]+\s?[\d,\.]+)?\s?(?:LPA|PA|per annum|lakhs|lakh|k|K|₹)?",
-        r"\$[\d,\.]+(?:\s?[-–to]+\s?[\d,\.]+)?\s?(?:per year|per annum|yearly)?",
-        r"[\d,\.]+\s?(?:to|[-–])\s?[\d,\.]+\s?(?:USD|INR|EUR|GBP|AED)?",
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in PATTERNS['salary']:
+        match = pattern.search(text)
         if match:
             return match.group(0)
     
     return text
 
+def normalize_job_link(job_link):
+    return normalize_job_url(job_link)
+
 def is_duplicate_job(job_link):
     """Check if job link has already been processed"""
     if not job_link:
         return True
     
-    normalized_link = re.sub(r'\?.*$', '', job_link.strip().lower()).rstrip('/')
+    normalized_link = normalize_job_link(job_link)
     if normalized_link in seen_job_links:
         return True
     
     seen_job_links.add(normalized_link)
     return False
 
+# --- Offline Card Parsing Engine ---
 
-def scrape_shine():
-    
-    all_jobs = []
-    driver = create_stealth_driver()
-    
+def load_shine_html(source):
+    """Build a soup from raw page HTML given as a string, bytes or a file path"""
+    if isinstance(source, os.PathLike) or (
+            isinstance(source, str) and '<' not in source and os.path.isfile(source)):
+        with open(source, 'rb') as f:
+            source = f.read()
+    return BeautifulSoup(source, 'html.parser')
+
+def find_job_cards(soup):
+    """Locate the job cards on a Shine search results page"""
+    return (
+        soup.find_all('div', {'class': lambda x: x and 'jobCard' in str(x)}) or
+        soup.find_all('li', {'class': lambda x: x and 'job' in str(x).lower()}) or
+        soup.find_all('article') or
+        soup.find_all('div', attrs={'data-job-id': True}) or
+        []
+    )
+
+def shine_job_link(href):
+    """Absolute job URL from a card's href, or '' when it isn't a usable link"""
+    if href.startswith('/'):
+        return f"https://www.shine.com{href}"
+    if href.startswith('http'):
+        return href
+    return ''
+
+def extract_job_link(card):
+    link_elem = card.find('a', href=True)
+    return shine_job_link(link_elem.get('href', '')) if link_elem else ''
+
+def parse_job_card(card, is_duplicate=is_duplicate_job):
+    """Extract a single card, returning the job dict or None if it does not qualify"""
+    title_elem = (
+        card.find('h2') or card.find('h3') or
+        card.find('a', {'class': lambda x: x and 'title' in str(x).lower()}) or
+        card.find('strong') or card.find('span', {'class': lambda x: x and 'title' in str(x).lower()})
+    )
+    job_title = title_elem.get_text(strip=True) if title_elem else ''
+
+    if not job_title:
+        return None
+
+    # Skip cards seen earlier (this run or, with a SeenJobIndex, a previous one); untitled
+    # cards are dropped first so they are never recorded as seen
+    job_link = extract_job_link(card)
+    if is_duplicate(job_link):
+        return None
+
+    company_name = extract_company_name(card)
+
+    card_text = card.get_text(strip=True)
+
+    experience = extract_experience_enhanced(card_text)
+
+    if not meets_all_criteria(job_title, company_name, card_text, experience):
+        return None
+
+    salary = "Not Disclosed"
+    salary_elem = (
+        card.find('li', {'class': lambda x: x and 'salary' in str(x).lower()}) or
+        card.find('div', {'class': lambda x: x and 'salary' in str(x).lower()}) or
+        card.find('span', {'class': lambda x: x and 'salary' in str(x).lower()})
+    )
+    if salary_elem:
+        raw_salary = salary_elem.get_text(strip=True)
+        salary = extract_salary_text(raw_salary)
+
+    date_posted = extract_date_posted(card)
+
+    # Since we're only getting remote+contract jobs, work_type is always "Remote + Contract"
+    return {
+        'job_title': job_title,
+        'company_name': company_name,
+        'job_link': job_link,
+        'experience': experience,
+        'salary': salary,
+        'date_posted': date_posted,
+        'work_type': "Remote + Contract",
+        'company_key': canonical_company(company_name),
+    }
+
+def parse_job_cards(job_cards, is_duplicate=is_duplicate_job, backend=None):
+    """Run every card through the backend's card parser and return the qualified jobs"""
+    parse_card = get_parser_backend(backend)['parse_card']
+    jobs = []
+    for card in job_cards:
+        try:
+            job_data = parse_card(card, is_duplicate)
+        except Exception:
+            continue
+        if job_data:
+            jobs.append(job_data)
+    return jobs
+
+def parse_shine_page(source, is_duplicate=is_duplicate_job, backend=None):
+    """Parse a full Shine results page (HTML string, bytes or file path) without a browser"""
+    parser = get_parser_backend(backend)
+    return parse_job_cards(parser['find_cards'](parser['load'](source)), is_duplicate, backend)
+
+def record_page_source(page_source, record_dir, role, page):
+    """Save a results page so it can be replayed through the parser offline"""
+    os.makedirs(record_dir, exist_ok=True)
+    slug = re.sub(r'[^a-z0-9]+', '-', role.lower()).strip('-')
+    filepath = os.path.join(record_dir, f"{slug}_page{page:03d}.html")
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write(page_source)
+
+# --- lxml Extraction Backend ---
+
+# Same card-finding strategies as find_job_cards, in the same priority order
+LXML_CARD_QUERIES = [
+    "//div[contains(@class, 'jobCard')]",
+    "//li[contains(translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'job')]",
+    "//article",
+    "//div[@data-job-id]",
+]
+
+# BeautifulSoup's get_text() leaves out script, style and template contents
+LXML_TEXT_QUERY = ".//text()[not(ancestor::*[self::script or self::style or self::template])]"
+
+if etree is not None:
+    LXML_CARD_XPATHS = [etree.XPath(query) for query in LXML_CARD_QUERIES]
+    LXML_TEXT_XPATH = etree.XPath(LXML_TEXT_QUERY, smart_strings=False)
+    LXML_LINK_XPATH = etree.XPath(".//a[@href]")
+
+COMPANY_TAGS = ('div', 'span', 'a', 'p')
+DATE_TAGS = ('span', 'div', 'li', 'p', 'time')
+DATE_CLASS_KEYS = ('time', 'date', 'posted', 'ago')
+SALARY_TAGS = ('li', 'div', 'span')
+COMPANY_FALLBACK_TAGS = ('div', 'span', 'p', 'h3', 'h4', 'h5')
+
+def load_shine_tree(source):
+    """lxml counterpart of load_shine_html"""
+    if etree is None:
+        raise ImportError("lxml is required for the 'lxml' parser backend")
+    if isinstance(source, os.PathLike) or (
+            isinstance(source, str) and '<' not in source and os.path.isfile(source)):
+        with open(source, 'rb') as f:
+            source = f.read()
+    return etree.fromstring(source, etree.HTMLParser())
+
+def find_job_cards_lxml(tree):
+    if tree is None:
+        return []
+    for xpath in LXML_CARD_XPATHS:
+        job_cards = xpath(tree)
+        if job_cards:
+            return job_cards
+    return []
+
+def extract_job_link_lxml(card):
+    link_elems = LXML_LINK_XPATH(card)
+    return shine_job_link(link_elems[0].get('href', '')) if link_elems else ''
+
+def lxml_get_text(elem, strip=False):
+    """Match BeautifulSoup's get_text() / get_text(strip=True) on an lxml element"""
+    texts = LXML_TEXT_XPATH(elem)
+    if strip:
+        return ''.join(text.strip() for text in texts)
+    return ''.join(texts)
+
+def scan_card_lxml(card):
+    """Walk the card once and remember the first element for every selector used in parse_job_card"""
+    found = {}
+    fallback_elems = []
+    ld_json_scripts = []
+
+    for elem in card.iterdescendants():
+        tag = elem.tag
+        if not isinstance(tag, str):
+            continue
+        attrs = elem.attrib
+        css_class = attrs.get('class', '').lower()
+
+        if tag in ('h2', 'h3', 'strong', 'time'):
+            found.setdefault(tag, elem)
+        if tag == 'a':
+            if 'href' in attrs:
+                found.setdefault('link', elem)
+            if 'title' in css_class:
+                found.setdefault('a_title', elem)
+        if tag == 'span':
+            if 'title' in css_class:
+                found.setdefault('span_title', elem)
+            if 'data-company' in attrs:
+                found.setdefault('span_data_company', elem)
+        if tag in COMPANY_TAGS and 'company' in css_class:
+            found.setdefault(('company', tag), elem)
+        if tag == 'div':
+            if 'employer' in css_class:
+                found.setdefault('div_employer', elem)
+            if 'organization' in css_class:
+                found.setdefault('div_organization', elem)
+            if attrs.get('itemprop') == 'hiringOrganization':
+                found.setdefault('div_hiring_org', elem)
+        if tag in DATE_TAGS:
+            for idx, key in enumerate(DATE_CLASS_KEYS):
+                if key in css_class:
+                    found.setdefault(('date', idx, tag), elem)
+            if 'data-posted' in attrs:
+                found.setdefault(('date', 4, tag), elem)
+            if attrs.get('itemprop') == 'datePosted':
+                found.setdefault(('date', 5, tag), elem)
+        if tag in SALARY_TAGS and 'salary' in css_class:
+            found.setdefault(('salary', tag), elem)
+        if tag in COMPANY_FALLBACK_TAGS:
+            fallback_elems.append(elem)
+        if tag == 'script' and attrs.get('type') == 'application/ld+json':
+            ld_json_scripts.append(elem)
+
+    return found, fallback_elems, ld_json_scripts
+
+def extract_company_name_lxml(found, fallback_elems):
+    company_name = 'Not specified'
+
+    slots = [('company', tag) for tag in COMPANY_TAGS]
+    slots += ['div_employer', 'div_organization', 'span_data_company', 'div_hiring_org']
+    for slot in slots:
+        elem = found.get(slot)
+        if elem is not None:
+            text = lxml_get_text(elem, strip=True)
+            if text:
+                company_name = text
+                break
+
+    if company_name == 'Not specified':
+        for elem in fallback_elems:
+            text = lxml_get_text(elem, strip=True)
+            if looks_like_company_name(text):
+                company_name = text
+                break
+
+    company_name = clean_company_name(company_name)
+
+    return company_name if company_name and company_name != 'Not specified' else 'Not specified'
+
+def extract_date_posted_lxml(card, found, ld_json_scripts):
+    for idx in range(len(DATE_CLASS_KEYS) + 2):
+        for tag in DATE_TAGS:
+            elem = found.get(('date', idx, tag))
+            if elem is not None:
+                date_text = lxml_get_text(elem, strip=True)
+                if date_text and len(date_text) > 1:
+                    date_posted = clean_date_posted(date_text)
+                    if date_posted != 'Not specified':
+                        return date_posted
+
+    time_tag = found.get('time')
+    if time_tag is not None:
+        if time_tag.get('datetime'):
+            date_posted = clean_date_posted(time_tag.get('datetime'))
+            if date_posted != 'Not specified':
+                return date_posted
+        date_text = lxml_get_text(time_tag, strip=True)
+        if date_text:
+            date_posted = clean_date_posted(date_text)
+            if date_posted != 'Not specified':
+                return date_posted
+
+    card_text = lxml_get_text(card)
+    for pattern in PATTERNS['card_dates']:
+        match = pattern.search(card_text)
+        if match:
+            date_str = match.group(match.lastindex) if match.lastindex > 1 else match.group(0)
+            date_posted = clean_date_posted(date_str)
+            if date_posted != 'Not specified':
+                return date_posted
+
+    for script in ld_json_scripts:
+        try:
+            data = json.loads(script.text)
+            if isinstance(data, dict) and 'datePosted' in data:
+                date_posted = clean_date_posted(data['datePosted'])
+                if date_posted != 'Not specified':
+                    return date_posted
+        except:
+            continue
+
+    return 'Not specified'
+
+def parse_job_card_lxml(card, is_duplicate=is_duplicate_job):
+    """lxml counterpart of parse_job_card built on a single scan of the card"""
+    found, fallback_elems, ld_json_scripts = scan_card_lxml(card)
+
+    title_elem = next((found[slot] for slot in ('h2', 'h3', 'a_title', 'strong', 'span_title')
+                       if slot in found), None)
+    job_title = lxml_get_text(title_elem, strip=True) if title_elem is not None else ''
+
+    if not job_title:
+        return None
+
+    link_elem = found.get('link')
+    job_link = shine_job_link(link_elem.get('href', '')) if link_elem is not None else ''
+
+    if is_duplicate(job_link):
+        return None
+
+    company_name = extract_company_name_lxml(found, fallback_elems)
+
+    card_text = lxml_get_text(card, strip=True)
+
+    experience = extract_experience_enhanced(card_text)
+
+    if not meets_all_criteria(job_title, company_name, card_text, experience):
+        return None
+
+    salary = "Not Disclosed"
+    salary_elem = next((found[('salary', tag)] for tag in SALARY_TAGS if ('salary', tag) in found), None)
+    if salary_elem is not None:
+        salary = extract_salary_text(lxml_get_text(salary_elem, strip=True))
+
+    date_posted = extract_date_posted_lxml(card, found, ld_json_scripts)
+
+    return {
+        'job_title': job_title,
+        'company_name': company_name,
+        'job_link': job_link,
+        'experience': experience,
+        'salary': salary,
+        'date_posted': date_posted,
+        'work_type': "Remote + Contract",
+        'company_key': canonical_company(company_name),
+    }
+
+# Card parsing backends, selected by name via PARSER_BACKEND or the backend= arguments
+PARSER_BACKEND = 'bs4'
+
+PARSER_BACKENDS = {
+    'bs4': {'load': load_shine_html, 'find_cards': find_job_cards, 'parse_card': parse_job_card,
+            'card_link': extract_job_link},
+    'lxml': {'load': load_shine_tree, 'find_cards': find_job_cards_lxml, 'parse_card': parse_job_card_lxml,
+             'card_link': extract_job_link_lxml},
+}
+
+def get_parser_backend(backend=None):
+    backend = backend or PARSER_BACKEND
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend '{backend}', expected one of {sorted(PARSER_BACKENDS)}")
+    return PARSER_BACKENDS[backend]
+
+
+def shine_search_url(role, page=1):
+    # MODIFIED: Search for both remote AND contract
+    query = requests.utils.quote(f"remote contract {role}")
+    if page > 1:
+        return f"https://www.shine.com/job-search/{query}-jobs-{page}"
+    return f"https://www.shine.com/job-search/{query}-jobs"
+
+def process_results_page(page_source, role, page, backend=None, is_duplicate=is_duplicate_job, record_dir=None, stats=None,
+                         job_cards=None):
+    """Parse one fetched results page, returning (card count, qualified jobs, card links)
+
+    Pass job_cards when the page was already parsed (ShineFetcher's HTTP check) to skip parsing it again.
+    """
+    parser = get_parser_backend(backend)
+    if record_dir:
+        record_page_source(page_source, record_dir, role, page)
+    
+    if job_cards is None:
+        job_cards = parser['find_cards'](parser['load'](page_source))
+    if stats is not None:
+        stats['pages'] += 1
+        stats['cards'] += len(job_cards)
+    
+    print(f"Found {len(job_cards)} total job cards")
+    
+    qualified_jobs = parse_job_cards(job_cards, is_duplicate, backend) if job_cards else []
+    if stats is not None:
+        stats['jobs'] = stats.get('jobs', 0) + len(qualified_jobs)
+    for job_data in qualified_jobs:
+        print(f"✓ QUALIFIED: {job_data['job_title'][:50]}... | {job_data['company_name'][:30]}... | {job_data['work_type']}")
+    
+    if job_cards:
+        print(f"Page {page}: Found {len(qualified_jobs)} qualified jobs")
+    page_links = [link for link in map(parser['card_link'], job_cards) if link]
+    return len(job_cards), qualified_jobs, page_links
+
+# --- Incremental Mode ---
+
+class RoleWatermark:
+    """Tracks one role's pagination against the seen-job index for incremental runs.
+
+    A role stops paginating once a page holds only links stored by a previous
+    run, or once it reaches the newest link recorded for the role last time.
+    """
+
+    def __init__(self, seen_index, role):
+        self.seen_index = seen_index
+        self.role = role
+        self.previous = seen_index.get_watermark(role)
+        self.newest_link = None
+        self.pages = 0
+
+    def should_stop(self, page_links):
+        """Record a scraped page and say whether older pages can be skipped"""
+        self.pages += 1
+        if self.newest_link is None and page_links:
+            self.newest_link = page_links[0]
+        if not page_links:
+            return False
+        if all(link in self.seen_index for link in page_links):
+            print(f"Incremental: every job on this page was seen on a previous run, stopping {self.role}")
+            return True
+        if self.previous and self.previous['newest_url'] in {normalize_job_url(link) for link in page_links}:
+            print(f"Incremental: reached last run's newest job for {self.role}, stopping")
+            return True
+        return False
+
+    def finish(self, stats=None):
+        """Store the new watermark and return how many pages were saved versus the last run"""
+        pages_saved = max(self.previous['pages'] - self.pages, 0) if self.previous else 0
+        newest_url = normalize_job_url(self.newest_link) if self.newest_link else (
+            self.previous['newest_url'] if self.previous else None)
+        self.seen_index.set_watermark(self.role, newest_url, self.pages)
+        if stats is not None:
+            stats['pages_saved'] = stats.get('pages_saved', 0) + pages_saved
+        print(f"Incremental: {self.role} took {self.pages} pages ({pages_saved} saved vs last run)")
+        return pages_saved
+
+def scrape_role(driver, role, backend=None, is_duplicate=is_duplicate_job, record_dir=None, stats=None, incremental=None,
+                checkpoint=None, sink=None, stop_event=None, on_page=None):
+    """Scrape every results page for one role on an existing driver and return its qualified jobs.
+
+    Pass the run's SeenJobIndex as incremental to stop at pages already seen on a previous run,
+    and a ScrapeCheckpoint to save progress after each page and continue from it. With a sink,
+    jobs are streamed into it page by page and the returned list stays empty. Setting
+    stop_event ends the role before its next page, leaving it open in the checkpoint.
+    on_page(role, page, cards, qualified) is called after every parsed results page.
+    """
+    if stats is None:
+        stats = {'pages': 0, 'cards': 0}
+    watermark = RoleWatermark(incremental, role) if incremental else None
+    page, consecutive_zero_pages = checkpoint.resume_point(role) if checkpoint else (1, 0)
+    if page > 1:
+        print(f"Resuming {role} at page {page}")
+    interrupted = False
+    
+    search_url = shine_search_url(role, page)
+    print(f"Search URL: {search_url}")
+    driver.get(search_url)
+    time.sleep(random.uniform(8, 12))
+    
+    # Handle initial pop-ups
     try:
-        for role_idx, role in enumerate(job_roles):
-            print(f"\n{'='*60}")
-            print(f"Scraping role {role_idx + 1}/{len(job_roles)}: {role}")
-            print(f"{'='*60}")
+        close_buttons = driver.find_elements(By.CSS_SELECTOR, "button[aria-label='Close'], .closeBtn, [data-testid='modal-close']")
+        for btn in close_buttons:
+            try:
+                btn.click()
+                time.sleep(1)
+            except:
+                continue
+    except:
+        pass
+    
+    max_pages = 300 
+    role_jobs = []
+    role_jobs_count = 0
+    max_consecutive_zero = 5
+    
+    while page <= max_pages and consecutive_zero_pages < max_consecutive_zero:
+        if stop_event and stop_event.is_set():
+            print(f"Stop requested, leaving {role} at page {page}")
+            interrupted = True
+            break
+        print(f"\n--- Page {page} ---")
+        
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "div[class*='jobCard'], li[class*='job'], article, [data-job-id]"))
+            )
             
-            # MODIFIED: Search for both remote AND contract
-            query = requests.utils.quote(f"remote contract {role}")
-            search_url = f"https://www.shine.com/job-search/{query}-jobs"
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            time.sleep(2)
             
-            print(f"Search URL: {search_url}")
-            driver.get(search_url)
-            time.sleep(random.uniform(8, 12))
+            card_count, qualified_jobs, page_links = process_results_page(
+                driver.page_source, role, page, backend, is_duplicate, record_dir, stats)
+            if on_page:
+                on_page(role, page, card_count, len(qualified_jobs))
             
-            # Handle initial pop-ups
-            try:
-                close_buttons = driver.find_elements(By.CSS_SELECTOR, "button[aria-label='Close'], .closeBtn, [data-testid='modal-close']")
-                for btn in close_buttons:
-                    try:
-                        btn.click()
-                        time.sleep(1)
-                    except:
-                        continue
-            except:
-                pass
+            if not card_count:
+                print("No job cards found, stopping...")
+                consecutive_zero_pages += 1
+                break
             
-            page = 1
-            max_pages = 300 
-            role_jobs_count = 0
-            consecutive_zero_pages = 0
-            max_consecutive_zero = 5
+            if sink:
+                sink.write_many(qualified_jobs)
+            else:
+                role_jobs.extend(qualified_jobs)
+            role_jobs_count += len(qualified_jobs)
+            page_jobs = len(qualified_jobs)
             
-            while page <= max_pages and consecutive_zero_pages < max_consecutive_zero:
-                print(f"\n--- Page {page} ---")
-                
+            if page_jobs == 0:
+                consecutive_zero_pages += 1
+                print(f"⚠ No qualified jobs on page {page}. Consecutive zero pages: {consecutive_zero_pages}")
+            else:
+                consecutive_zero_pages = 0 
+            if checkpoint:
+                checkpoint.record_page(role, page, qualified_jobs, consecutive_zero_pages)
+            
+            if watermark and watermark.should_stop(page_links):
+                break
+            
+            if consecutive_zero_pages >= max_consecutive_zero:
+                print(f"Stopping {role} - {consecutive_zero_pages} consecutive pages with no qualified jobs")
+                break
+            
+            if page < max_pages:
                 try:
-                    WebDriverWait(driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "div[class*='jobCard'], li[class*='job'], article, [data-job-id]"))
-                    )
-                    
-                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(2)
+                    next_selectors = [
+                        f"a[href*='page={page+1}']",
+                        f"a[href*='-jobs-{page+1}']",
+                        "a.pagination-next",
+                        "button[aria-label*='next']",
+                    ]
                     
-                    soup = BeautifulSoup(driver.page_source, 'html.parser')
-                    
-                    job_cards = (
-                        soup.find_all('div', {'class': lambda x: x and 'jobCard' in str(x)}) or
-                        soup.find_all('li', {'class': lambda x: x and 'job' in str(x).lower()}) or
-                        soup.find_all('article') or
-                        soup.find_all('div', attrs={'data-job-id': True}) or
-                        []
-                    )
-                    
-                    print(f"Found {len(job_cards)} total job cards")
-                    
-                    if not job_cards:
-                        print("No job cards found, stopping...")
-                        consecutive_zero_pages += 1
-                        break
-                    
-                    page_jobs = 0
-                    
-                    for card in job_cards:
+                    next_found = False
+                    for selector in next_selectors:
                         try:
-                            title_elem = (
-                                card.find('h2') or card.find('h3') or 
-                                card.find('a', {'class': lambda x: x and 'title' in str(x).lower()}) or
-                                card.find('strong') or card.find('span', {'class': lambda x: x and 'title' in str(x).lower()})
-                            )
-                            job_title = title_elem.get_text(strip=True) if title_elem else ''
-                            
-                            if not job_title:
-                                continue
-                            
-                            link_elem = card.find('a', href=True)
-                            job_link = ''
-                            if link_elem:
-                                href = link_elem.get('href', '')
-                                if href.startswith('/'):
-                                    job_link = f"https://www.shine.com{href}"
-                                elif href.startswith('http'):
-                                    job_link = href
-                            
-                            if is_duplicate_job(job_link):
-                                continue
-                            
-                            company_name = extract_company_name(card)
-                            
-                            card_text = card.get_text(strip=True)
-                            
-                            experience = extract_experience_enhanced(card_text)
-                            
-                            if not meets_all_criteria(job_title, company_name, card_text, experience):
-                                continue
-                            
-                            salary = "Not Disclosed"
-                            salary_elem = (
-                                card.find('li', {'class': lambda x: x and 'salary' in str(x).lower()}) or
-                                card.find('div', {'class': lambda x: x and 'salary' in str(x).lower()}) or
-                                card.find('span', {'class': lambda x: x and 'salary' in str(x).lower()})
-                            )
-                            if salary_elem:
-                                raw_salary = salary_elem.get_text(strip=True)
-                                salary = extract_salary_text(raw_salary)
-                            
-                            date_posted = extract_date_posted(card)
-                            
-                            # MODIFIED: Since we're only getting remote+contract jobs, work_type is always "Remote + Contract"
-                            work_type_str = "Remote + Contract"
-                            
-                            # Save job data
-                            job_data = {
-                                'job_title': job_title,
-                                'company_name': company_name,
-                                'job_link': job_link,
-                                'experience': experience,
-                                'salary': salary,
-                                'date_posted': date_posted,
-                                'work_type': work_type_str
-                            }
-                            
-                            all_jobs.append(job_data)
-                            role_jobs_count += 1
-                            page_jobs += 1
-                            
-                            print(f"✓ QUALIFIED: {job_title[:50]}... | {company_name[:30]}... | {work_type_str}")
-                            
-                        except Exception as e:
+                            next_btn = driver.find_element(By.CSS_SELECTOR, selector)
+                            driver.execute_script("arguments[0].click();", next_btn)
+                            time.sleep(random.uniform(3, 5))
+                            next_found = True
+                            break
+                        except:
                             continue
                     
-                    print(f"Page {page}: Found {page_jobs} qualified jobs")
+                    if not next_found:
+                        current_url = driver.current_url
+                        if 'page=' in current_url:
+                            next_url = current_url.replace(f'page={page}', f'page={page+1}')
+                        else:
+                            separator = '&' if '?' in current_url else '?'
+                            next_url = f"{current_url}{separator}page={page+1}"
+                        
+                        driver.get(next_url)
+                        time.sleep(random.uniform(3, 5))
                     
-                    if page_jobs == 0:
-                        consecutive_zero_pages += 1
-                        print(f"⚠ No qualified jobs on page {page}. Consecutive zero pages: {consecutive_zero_pages}")
-                    else:
-                        consecutive_zero_pages = 0 
-                    if consecutive_zero_pages >= max_consecutive_zero:
-                        print(f"Stopping {role} - {consecutive_zero_pages} consecutive pages with no qualified jobs")
-                        break
+                    page += 1
                     
-                    if page < max_pages:
-                        try:
-                            next_selectors = [
-                                f"a[href*='page={page+1}']",
-                                f"a[href*='-jobs-{page+1}']",
-                                "a.pagination-next",
-                                "button[aria-label*='next']",
-                            ]
-                            
-                            next_found = False
-                            for selector in next_selectors:
-                                try:
-                                    next_btn = driver.find_element(By.CSS_SELECTOR, selector)
-                                    driver.execute_script("arguments[0].click();", next_btn)
-                                    time.sleep(random.uniform(3, 5))
-                                    next_found = True
-                                    break
-                                except:
-                                    continue
-                            
-                            if not next_found:
-                                current_url = driver.current_url
-                                if 'page=' in current_url:
-                                    next_url = current_url.replace(f'page={page}', f'page={page+1}')
-                                else:
-                                    separator = '&' if '?' in current_url else '?'
-                                    next_url = f"{current_url}{separator}page={page+1}"
-                                
-                                driver.get(next_url)
-                                time.sleep(random.uniform(3, 5))
-                            
-                            page += 1
-                            
-                        except Exception as e:
-                            print(f"Could not navigate to page {page+1}: {e}")
-                            break
-                    else:
-                        break
-                        
-                except TimeoutException:
-                    print(f"Timeout on page {page}, stopping...")
-                    consecutive_zero_pages += 1
-                    break
                 except Exception as e:
-                    print(f"Error on page {page}: {e}")
-                    consecutive_zero_pages += 1
+                    print(f"Could not navigate to page {page+1}: {e}")
                     break
+            else:
+                break
+                
+        except TimeoutException:
+            print(f"Timeout on page {page}, stopping...")
+            consecutive_zero_pages += 1
+            break
+        except Exception as e:
+            print(f"Error on page {page}: {e}")
+            consecutive_zero_pages += 1
+            # Likely a dead driver: leave the role open in the checkpoint so --resume retries it
+            interrupted = True
+            break
+    
+    print(f"Finished {role}: {role_jobs_count} qualified jobs")
+    if checkpoint and not interrupted:
+        checkpoint.complete_role(role)
+    
+    # If we stopped due to consecutive zero pages, print message
+    if consecutive_zero_pages >= max_consecutive_zero:
+        print(f"Moving to next role after {consecutive_zero_pages} consecutive pages with no qualified jobs")
+    
+    if watermark:
+        watermark.finish(stats)
+    
+    return role_jobs
+
+def scrape_shine(record_dir=None, backend=None, http_first=False, is_duplicate=None, incremental=None, checkpoint=None,
+                 sink=None, stop_event=None, on_page=None, driver=None, roles=None):
+    """Scrape every role in roles (default: job_roles); pass record_dir to also keep each page's HTML.
+
+    With http_first, pages are fetched over plain HTTP and Chrome is only
+    started for pages that need JS rendering. is_duplicate defaults to the
+    in-memory is_duplicate_job; pass SeenJobIndex.is_duplicate to skip jobs
+    seen on previous runs, and the index itself as incremental to also stop
+    paginating once a role reaches jobs from a previous run. With a
+    checkpoint, roles it marks complete are skipped and their saved jobs reused.
+    With a sink, jobs are streamed into it instead of being returned. Setting
+    stop_event (a threading.Event) stops the run before the next results page,
+    and on_page(role, page, cards, qualified) reports each page as it is parsed.
+    Pass driver to scrape with an already running (e.g. pooled) Chrome, which
+    is left open; otherwise one is started and quit here.
+    """
+
+    is_duplicate = is_duplicate or is_duplicate_job
+    roles = job_roles if roles is None else roles
+    stats = {'pages': 0, 'cards': 0, 'jobs': 0}
+    all_jobs = []
+    collect = sink.write_many if sink else all_jobs.extend
+    if checkpoint:
+        checkpoint.seed(is_duplicate)
+    own_driver = driver is None
+    fetcher = ShineFetcher(backend, driver=driver) if http_first else None
+    if not http_first and own_driver:
+        driver = create_stealth_driver()
+    
+    try:
+        for role_idx, role in enumerate(roles):
+            if stop_event and stop_event.is_set():
+                print("Stop requested, skipping the remaining roles")
+                break
+            if checkpoint:
+                collect(checkpoint.jobs_for(role))
+                if checkpoint.is_complete(role):
+                    continue
             
-            print(f"Finished {role}: {role_jobs_count} qualified jobs")
+            print(f"\n{'='*60}")
+            print(f"Scraping role {role_idx + 1}/{len(roles)}: {role}")
+            print(f"{'='*60}")
             
-            # If we stopped due to consecutive zero pages, print message
-            if consecutive_zero_pages >= max_consecutive_zero:
-                print(f"Moving to next role after {consecutive_zero_pages} consecutive pages with no qualified jobs")
+            if fetcher:
+                collect(scrape_role_http(fetcher, role, backend, is_duplicate, record_dir, stats, incremental,
+                                         checkpoint, sink, stop_event, on_page))
+            else:
+                collect(scrape_role(driver, role, backend, is_duplicate, record_dir, stats, incremental,
+                                    checkpoint, sink, stop_event, on_page))
             
             time.sleep(random.uniform(5,8))
             
     except Exception as e:
         print(f"Error scraping Shine: {e}")
     finally:
-        driver.quit()
-        print(f" Total collected {len(all_jobs)} qualified Remote+Contract jobs from Shine")
+        if fetcher:
+            fetcher.report()
+            fetcher.close()
+        if driver and own_driver:
+            driver.quit()
+        if incremental:
+            print(f" Incremental run: {stats['pages']} pages scraped, {stats.get('pages_saved', 0)} pages saved vs last run")
+        print(f" Total collected {sink.count if sink else len(all_jobs)} qualified Remote+Contract jobs from Shine")
     
     return all_jobs
 
+# --- HTTP-first Fetch Layer ---
+
+# Markers of a bot wall or an empty client-side shell rather than real results
+JS_REQUIRED_MARKERS = ('captcha', 'enable javascript', 'access denied', 'cf-browser-verification')
+
+class ShineFetcher:
+    """Fetch Shine result pages over a pooled requests.Session.
+
+    Pages are only handed to a (lazily created) stealth Chrome when the plain
+    HTTP response can't be used: a non-200 status, a bot wall, or HTML with no
+    job cards because the results are rendered client-side. Latency and
+    success counts are kept per mode so the Chrome time saved can be reported.
+    """
+
+    def __init__(self, backend=None, pool_size=10, timeout=15, driver_factory=None, driver=None):
+        self.backend = backend
+        self.timeout = timeout
+        self.driver_factory = driver_factory or create_stealth_driver
+        # A driver passed in belongs to the caller and is not quit on close()
+        self.driver = driver
+        self.owns_driver = driver is None
+        self.lock = threading.Lock()
+
+        self.session = requests.Session()
+        retries = Retry(total=2, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'User-Agent': random.choice(USER_AGENTS),
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9',
+        })
+
+        self.stats = {mode: {'requests': 0, 'successes': 0, 'latencies': []} for mode in ('http', 'browser')}
+
+    def record(self, mode, success, latency):
+        with self.lock:
+            mode_stats = self.stats[mode]
+            mode_stats['requests'] += 1
+            mode_stats['successes'] += int(success)
+            mode_stats['latencies'].append(latency)
+
+    def http_cards(self, page_source):
+        """The job cards of a plain HTTP page, or None when it needs JS rendering"""
+        lowered = page_source[:20000].lower()
+        if any(marker in lowered for marker in JS_REQUIRED_MARKERS):
+            return None
+        parser = get_parser_backend(self.backend)
+        return parser['find_cards'](parser['load'](page_source)) or None
+
+    def fetch_http(self, url):
+        """Return (page HTML, its job cards), or (None, None) when it has to be rendered in Chrome"""
+        start_time = time.perf_counter()
+        page_source = job_cards = None
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            if response.status_code == 200:
+                job_cards = self.http_cards(response.text)
+                if job_cards is not None:
+                    page_source = response.text
+        except requests.RequestException as e:
+            print(f"HTTP fetch failed for {url}: {e}")
+        self.record('http', page_source is not None, time.perf_counter() - start_time)
+        return page_source, job_cards
+
+    def fetch_browser(self, url):
+        start_time = time.perf_counter()
+        page_source = None
+        try:
+            if self.driver is None:
+                self.driver = self.driver_factory()
+            self.driver.get(url)
+            WebDriverWait(self.driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "div[class*='jobCard'], li[class*='job'], article, [data-job-id]"))
+            )
+            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            time.sleep(2)
+            page_source = self.driver.page_source
+        except TimeoutException:
+            print(f"Timeout rendering {url} in Chrome")
+        except Exception as e:
+            print(f"Chrome fetch failed for {url}: {e}")
+        self.record('browser', page_source is not None, time.perf_counter() - start_time)
+        return page_source
+
+    def fetch(self, url):
+        """Return (page_source, mode, job_cards) where mode is 'http' or 'browser'; page_source is None on
+        failure, and job_cards (already parsed over HTTP) is None for pages rendered in Chrome"""
+        page_source, job_cards = self.fetch_http(url)
+        if page_source is not None:
+            return page_source, 'http', job_cards
+        print("Page needs JS rendering, falling back to Chrome")
+        return self.fetch_browser(url), 'browser', None
+
+    def report(self):
+        print(f"\n{'='*60}")
+        print("Fetch modes")
+        print(f"{'='*60}")
+        for mode, mode_stats in self.stats.items():
+            latencies = sorted(mode_stats['latencies'])
+            if not latencies:
+                print(f"{mode:<8} no requests")
+                continue
+            success_rate = mode_stats['successes'] / mode_stats['requests']
+            print(f"{mode:<8} {mode_stats['requests']} requests, {success_rate:.0%} success, "
+                  f"avg {sum(latencies) / len(latencies):.2f}s, p50 {latencies[len(latencies) // 2]:.2f}s")
+
+        browser_latencies = self.stats['browser']['latencies']
+        if browser_latencies and self.stats['http']['successes']:
+            saved = self.stats['http']['successes'] * sum(browser_latencies) / len(browser_latencies)
+            print(f"Estimated Chrome time saved: {saved:.0f}s")
+
+    def close(self):
+        self.session.close()
+        if self.driver is not None and self.owns_driver:
+            self.driver.quit()
+            self.driver = None
+
+def scrape_role_http(fetcher, role, backend=None, is_duplicate=is_duplicate_job, record_dir=None, stats=None, incremental=None,
+                     checkpoint=None, sink=None, stop_event=None, on_page=None):
+    """HTTP-first version of scrape_role: pages are addressed by URL instead of clicking next"""
+    if stats is None:
+        stats = {'pages': 0, 'cards': 0}
+    watermark = RoleWatermark(incremental, role) if incremental else None
+    page, consecutive_zero_pages = checkpoint.resume_point(role) if checkpoint else (1, 0)
+    if page > 1:
+        print(f"Resuming {role} at page {page}")
+    interrupted = False
+    
+    max_pages = 300
+    role_jobs = []
+    role_jobs_count = 0
+    max_consecutive_zero = 5
+    
+    while page <= max_pages and consecutive_zero_pages < max_consecutive_zero:
+        if stop_event and stop_event.is_set():
+            print(f"Stop requested, leaving {role} at page {page}")
+            interrupted = True
+            break
+        print(f"\n--- Page {page} ---")
+        url = shine_search_url(role, page)
+        print(f"URL: {url}")
+        
+        page_source, mode, job_cards = fetcher.fetch(url)
+        if page_source is None:
+            print(f"Could not fetch page {page} ({mode}), stopping...")
+            interrupted = True
+            break
+        
+        card_count, qualified_jobs, page_links = process_results_page(
+            page_source, role, page, backend, is_duplicate, record_dir, stats, job_cards)
+        if on_page:
+            on_page(role, page, card_count, len(qualified_jobs))
+        
+        if not card_count:
+            print("No job cards found, stopping...")
+            break
+        
+        if sink:
+            sink.write_many(qualified_jobs)
+        else:
+            role_jobs.extend(qualified_jobs)
+        role_jobs_count += len(qualified_jobs)
+        if qualified_jobs:
+            consecutive_zero_pages = 0
+        else:
+            consecutive_zero_pages += 1
+            print(f"⚠ No qualified jobs on page {page}. Consecutive zero pages: {consecutive_zero_pages}")
+        if checkpoint:
+            checkpoint.record_page(role, page, qualified_jobs, consecutive_zero_pages)
+        
+        if watermark and watermark.should_stop(page_links):
+            break
+        
+        page += 1
+        time.sleep(random.uniform(3, 5))
+    
+    print(f"Finished {role}: {role_jobs_count} qualified jobs")
+    if checkpoint and not interrupted:
+        checkpoint.complete_role(role)
+    if watermark:
+        watermark.finish(stats)
+    return role_jobs
+
+# --- Parallel Worker Pool ---
+
+class JobLinkDeduper:
+    """Thread-safe stand-in for seen_job_links, shared by all parallel workers"""
+
+    def __init__(self):
+        self.seen = set()
+        self.lock = threading.Lock()
+
+    def __call__(self, job_link):
+        if not job_link:
+            return True
+        normalized_link = normalize_job_link(job_link)
+        with self.lock:
+            if normalized_link in self.seen:
+                return True
+            self.seen.add(normalized_link)
+        return False
+
+def shine_worker(worker_id, role_queue, total_roles, role_results, is_duplicate, stats, backend=None, record_dir=None, incremental=None,
+                 checkpoint=None, sink=None):
+    """Pull roles off the shared queue until it is empty, each worker on its own driver and pacing"""
+    start_time = time.time()
+    driver = None
+    
+    try:
+        # Stagger start-up so the workers don't hit Shine in lockstep
+        time.sleep(random.uniform(2, 5) * worker_id)
+        driver = create_stealth_driver()
+        
+        while True:
+            try:
+                role_idx, role = role_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            print(f"\n[worker {stats['worker']}] Scraping role {role_idx + 1}/{total_roles}: {role}")
+            previous_jobs = checkpoint.jobs_for(role) if checkpoint else []
+            try:
+                role_jobs = scrape_role(driver, role, backend, is_duplicate, record_dir, stats, incremental,
+                                        checkpoint, sink)
+            except Exception as e:
+                print(f"[worker {stats['worker']}] Error scraping {role}: {e}, restarting driver")
+                role_jobs = []
+                try:
+                    driver.quit()
+                except:
+                    pass
+                driver = create_stealth_driver()
+            
+            role_results[role_idx] = previous_jobs + role_jobs
+            stats['roles'] += 1
+            
+            time.sleep(random.uniform(5,8))
+            
+    except Exception as e:
+        print(f"[worker {stats['worker']}] Worker stopped: {e}")
+    finally:
+        if driver:
+            driver.quit()
+        stats['elapsed'] = time.time() - start_time
+
+def print_worker_report(worker_stats):
+    print(f"\n{'='*60}")
+    print("Per-worker throughput")
+    print(f"{'='*60}")
+    for stats in worker_stats:
+        minutes = max(stats['elapsed'], 1e-9) / 60
+        print(f"Worker {stats['worker']}: {stats['roles']} roles, {stats['pages']} pages, "
+              f"{stats['cards']} cards, {stats['jobs']} jobs in {stats['elapsed']:.0f}s "
+              f"({stats['pages'] / minutes:.1f} pages/min, {stats['jobs'] / minutes:.1f} jobs/min)")
+
+def scrape_shine_parallel(num_workers=3, record_dir=None, backend=None, is_duplicate=None, incremental=None,
+                          checkpoint=None, sink=None):
+    """Scrape job_roles with num_workers headless drivers pulling roles from a shared queue.
+
+    is_duplicate must be thread-safe (JobLinkDeduper or SeenJobIndex.is_duplicate).
+    With a sink, workers stream jobs into it as pages finish, so rows are in
+    completion order rather than job_roles order.
+    """
+    get_parser_backend(backend)
+    
+    is_duplicate = is_duplicate or JobLinkDeduper()
+    role_results = {}
+    if checkpoint:
+        checkpoint.seed(is_duplicate)
+    
+    role_queue = queue.Queue()
+    for role_idx, role in enumerate(job_roles):
+        if checkpoint and checkpoint.is_complete(role):
+            role_results[role_idx] = checkpoint.jobs_for(role)
+        else:
+            role_queue.put((role_idx, role))
+
+    worker_stats = []
+    threads = []
+    
+    for worker_id in range(num_workers):
+        stats = {'worker': worker_id + 1, 'roles': 0, 'pages': 0, 'cards': 0, 'jobs': 0, 'elapsed': 0.0}
+        worker_stats.append(stats)
+        thread = threading.Thread(
+            target=shine_worker,
+            args=(worker_id, role_queue, len(job_roles), role_results, is_duplicate, stats, backend, record_dir, incremental,
+                  checkpoint, sink),
+            name=f"shine-worker-{worker_id + 1}",
+            daemon=True,
+        )
+        thread.start()
+        threads.append(thread)
+    
+    for thread in threads:
+        thread.join()
+    
+    # Merge in job_roles order so output matches a serial run
+    all_jobs = []
+    collect = sink.write_many if sink else all_jobs.extend
+    for role_idx in sorted(role_results):
+        collect(role_results[role_idx])
+    
+    print_worker_report(worker_stats)
+    if incremental:
+        print(f" Incremental run: {sum(s.get('pages_saved', 0) for s in worker_stats)} pages saved vs last run")
+    print(f" Total collected {sink.count if sink else len(all_jobs)} qualified Remote+Contract jobs from Shine")
+    return all_jobs
+
+SHINE_FIELDNAMES = ['job_title', 'company_name', 'job_link', 'experience', 'salary', 'date_posted', 'work_type',
+                    'company_key']
+SHINE_OUTPUT_NAME = 'remote_contract_software_jobs'
+
 def save_to_csv(jobs, filename):
     if not jobs:
         print(f"No jobs to save for {filename}")
@@ -1001,30 +1795,78 @@ def save_to_csv(jobs, filename):
     filepath = os.path.join(Data_dir, filename)
     try:
         with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['job_title', 'company_name', 'job_link', 'experience', 'salary', 'date_posted', 'work_type']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer = csv.DictWriter(csvfile, fieldnames=SHINE_FIELDNAMES)
             writer.writeheader()
             writer.writerows(jobs)
         print(f"Successfully saved {len(jobs)} jobs to {filepath}")
     except Exception as e:
         print(f"Error saving to CSV: {e}")
 
-def main():
+def main(workers=1, backend=None, http_first=False, use_history=False, incremental=False, resume=False, output='csv'):
     global seen_job_links
     seen_job_links = set()
     
     start_time = time.time()
-    
-    # Scrape Shine
-    shine_jobs = scrape_shine()
-    save_to_csv(shine_jobs, 'remote_contract_software_jobs.csv')
+    checkpoint = ScrapeCheckpoint(resume=resume)
+    seen_index = SeenJobIndex(source='shine') if use_history or incremental else None
+    is_duplicate = seen_index.is_duplicate if seen_index else None
+    incremental = seen_index if incremental else None
+    if output == 'parquet':
+        # Parquet output lands in the archive's shine/<today> partition (needs pandas + pyarrow)
+        from job_archive import partition_path
+        output_path = partition_path('shine')
+    else:
+        output_path = os.path.join(Data_dir, SHINE_OUTPUT_NAME + SINK_FORMATS[output])
+    sink = open_job_sink(output_path, SHINE_FIELDNAMES)
+    
+    # Scrape Shine, streaming jobs into the sink as pages finish
+    failed = False
+    try:
+        if workers > 1:
+            scrape_shine_parallel(workers, backend=backend, is_duplicate=is_duplicate,
+                                  incremental=incremental, checkpoint=checkpoint, sink=sink)
+        else:
+            scrape_shine(backend=backend, http_first=http_first, is_duplicate=is_duplicate,
+                         incremental=incremental, checkpoint=checkpoint, sink=sink)
+    except Exception:
+        failed = True
+        raise
+    finally:
+        # A failed run keeps the previous output; Ctrl+C saves the jobs found so far.
+        # Jobs only count as seen once they are in the saved output.
+        sink.close(commit=not failed)
+        if seen_index:
+            seen_index.close(commit=not failed)
+    if seen_index and not sink.count:
+        print(f"No new jobs since the last run, {output_path} left as it was")
+    
+    unfinished_roles = [role for role in job_roles if not checkpoint.is_complete(role)]
+    if unfinished_roles:
+        print(f"{len(unfinished_roles)} roles unfinished, checkpoint kept at {checkpoint.path} - rerun with --resume")
+    else:
+        checkpoint.clear()
     
     end_time = time.time()
     duration = end_time - start_time
     
     print(f"\nScraping completed in {duration:.2f} seconds!")
-    print(f"Total qualified jobs: {len(shine_jobs)}")
+    print(f"Total qualified jobs: {sink.count}")
     print(f"Jobs saved to: {Data_dir}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    arg_parser = argparse.ArgumentParser(description="Scrape remote contract jobs from Shine.com")
+    arg_parser.add_argument('--workers', type=int, default=1, help="number of parallel headless drivers")
+    arg_parser.add_argument('--backend', choices=sorted(PARSER_BACKENDS), default=PARSER_BACKEND,
+                            help="card extraction backend")
+    arg_parser.add_argument('--http-first', action='store_true',
+                            help="fetch pages over HTTP and only use Chrome when JS rendering is needed")
+    arg_parser.add_argument('--history', action='store_true',
+                            help="skip jobs seen by earlier --history runs; the output then holds only new jobs")
+    arg_parser.add_argument('--incremental', action='store_true',
+                            help="stop paginating a role once its pages only hold jobs from previous runs")
+    arg_parser.add_argument('--resume', action='store_true',
+                            help="continue from the checkpoint left by an interrupted run")
+    arg_parser.add_argument('--output', choices=sorted(SINK_FORMATS), default='csv',
+                            help="output format for the collected jobs")
+    args = arg_parser.parse_args()
+    main(args.workers, args.backend, args.http_first, args.history, args.incremental, args.resume, args.output)
\ No newline at end of file
@@ -0,0 +1,141 @@
+"""
+Persistent index of job URLs seen across scraper runs.
+
+Backed by SQLite (Data/seen_jobs.sqlite3) with first_seen/last_seen
+timestamps per normalized job URL. Known URLs are loaded into memory when
+the index is opened so lookups during a run never touch the disk. A second
+table keeps per-role watermarks (newest job URL and pages scraped) for
+incremental runs.
+
+Sightings and watermarks are staged in memory and only written by commit()
+(close() commits by default), so a run whose output is thrown away -
+close(commit=False) - does not mark its jobs as seen.
+"""
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+
+Base_dir = os.path.dirname(os.path.abspath(__file__))
+Data_dir = os.path.join(Base_dir, 'Data')
+DEFAULT_INDEX_PATH = os.path.join(Data_dir, 'seen_jobs.sqlite3')
+
+QUERY_STRING = re.compile(r'\?.*$')
+
+
+def normalize_job_url(job_url):
+    """Lowercase, drop query string and trailing slash"""
+    return QUERY_STRING.sub('', job_url.strip().lower()).rstrip('/')
+
+
+class SeenJobIndex:
+    def __init__(self, path=DEFAULT_INDEX_PATH, source=None):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.source = source
+        self.lock = threading.Lock()
+
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen_jobs (
+                url TEXT PRIMARY KEY,
+                source TEXT,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL
+            ) WITHOUT ROWID
+        """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS role_watermarks (
+                source TEXT NOT NULL,
+                role TEXT NOT NULL,
+                newest_url TEXT,
+                pages INTEGER NOT NULL,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (source, role)
+            ) WITHOUT ROWID
+        """)
+        self.conn.commit()
+
+        # URLs from previous runs, and everything looked up during this one
+        self.known = {url for (url,) in self.conn.execute("SELECT url FROM seen_jobs")}
+        self.seen_this_run = set()
+        self.pending = []
+        self.pending_watermarks = {}
+        self.new_count = 0
+        self.known_count = 0
+
+    def __contains__(self, job_url):
+        return bool(job_url) and normalize_job_url(job_url) in self.known
+
+    def is_duplicate(self, job_url):
+        """Drop-in for is_duplicate_job: True if the URL is empty, was seen earlier
+        in this run, or was stored by a previous run. Records the sighting."""
+        if not job_url:
+            return True
+        url = normalize_job_url(job_url)
+        with self.lock:
+            if url in self.seen_this_run:
+                return True
+            self.seen_this_run.add(url)
+            self.pending.append((url, self.source, datetime.now().isoformat(timespec='seconds')))
+            if url in self.known:
+                self.known_count += 1
+                return True
+            self.new_count += 1
+            return False
+
+    def get_watermark(self, role):
+        """Newest job URL and page count stored for this role by the last committed run, or None"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT newest_url, pages, updated_at FROM role_watermarks WHERE source = ? AND role = ?",
+                (self.source or '', role)).fetchone()
+        if row is None:
+            return None
+        return {'newest_url': row[0], 'pages': row[1], 'updated_at': row[2]}
+
+    def set_watermark(self, role, newest_url, pages):
+        """Stage this role's watermark; written with the sightings on commit()"""
+        with self.lock:
+            self.pending_watermarks[role] = (self.source or '', role, newest_url, pages,
+                                             datetime.now().isoformat(timespec='seconds'))
+
+    def _commit(self):
+        self.conn.executemany("""
+            INSERT INTO seen_jobs (url, source, first_seen, last_seen) VALUES (?1, ?2, ?3, ?3)
+            ON CONFLICT(url) DO UPDATE SET last_seen = excluded.last_seen
+        """, self.pending)
+        self.conn.executemany("""
+            INSERT INTO role_watermarks (source, role, newest_url, pages, updated_at) VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(source, role) DO UPDATE SET
+                newest_url = excluded.newest_url, pages = excluded.pages, updated_at = excluded.updated_at
+        """, list(self.pending_watermarks.values()))
+        self.conn.commit()
+        self.pending = []
+        self.pending_watermarks = {}
+
+    def commit(self):
+        """Write the staged sightings and watermarks; call once the run's jobs are saved"""
+        with self.lock:
+            self._commit()
+
+    def close(self, commit=True):
+        """Commit (or with commit=False drop) what this run staged, then close the database"""
+        with self.lock:
+            if commit:
+                self._commit()
+            self.conn.close()
+        if commit:
+            print(f"Seen-job index: {self.new_count} new, {self.known_count} already known "
+                  f"({len(self.known) + self.new_count} total) in {self.path}")
+        else:
+            print(f"Seen-job index: dropped {len(self.pending)} sightings of a run that was not saved")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(commit=exc_type is None)